@@ -138,22 +138,23 @@ All rights reserved.
 
 import sys
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-                             QComboBox, QGroupBox, QGridLayout, QTabWidget,
-                             QTextEdit, QFileDialog, QMessageBox, QProgressBar,
-                             QDoubleSpinBox, QSpinBox, QMenuBar, QMenu, QSplitter,
+                             QHBoxLayout, QLabel, QPushButton, 
+                             QComboBox, QGroupBox, QGridLayout, QFormLayout, QTabWidget,
+                             QTextEdit, QFileDialog, QMessageBox,
+                             QDoubleSpinBox, QSpinBox, QSplitter,
                              QStackedWidget, QScrollArea, QTableWidget, QTableWidgetItem,
-                             QHeaderView)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QPixmap
+                             QHeaderView, QAbstractSpinBox, QTableView)
+from PyQt6.QtCore import (Qt, QTimer, QSignalBlocker,
+                          QAbstractTableModel, QModelIndex)
+from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QPixmap, QTextCursor
 import matplotlib
 matplotlib.use('Qt5Agg')
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+import matplotlib.style
 
-# Set matplotlib to use light theme
-plt.style.use('default')
+# Set matplotlib to use light theme (via matplotlib.style so pyplot is never imported)
+matplotlib.style.use('default')
 matplotlib.rcParams['figure.facecolor'] = 'white'
 matplotlib.rcParams['axes.facecolor'] = 'white'
 matplotlib.rcParams['savefig.facecolor'] = 'white'
@@ -163,8 +164,13 @@ matplotlib.rcParams['xtick.color'] = 'black'
 matplotlib.rcParams['ytick.color'] = 'black'
 matplotlib.rcParams['text.color'] = 'black'
 matplotlib.rcParams['grid.color'] = 'gray'
-import pandas as pd
-import json
+# Long simulation time-series: simplify paths and let Agg render them in chunks
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 0.5
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial
 
 
 # ========== EV DEFAULT CONSTANTS ==========
@@ -332,6 +338,22 @@ GPM_MOTORS = {
     }
 }
 
+# Precomputed torque curves per (motor, mode): (base_rpm, constant_torque, power * 60 / 2π)
+# Above base RPM the constant-power torque is simply the numerator divided by motor RPM
+MOTOR_TORQUE_CURVES = {}
+for _motor_key, _motor in GPM_MOTORS.items():
+    MOTOR_TORQUE_CURVES[(_motor_key, 'boost')] = (
+        _motor['base_rpm'], _motor['peak_torque_nm'], _motor['peak_power_w'] * 60 / (2 * 3.14159))
+    MOTOR_TORQUE_CURVES[(_motor_key, 'eco')] = (
+        _motor['base_rpm'], _motor['continuous_torque_nm'], _motor['continuous_power_w'] * 60 / (2 * 3.14159))
+
+# Physical constants
+GRAVITY = 9.81  # m/s² 
+DRAG_KMH_FACTOR = 0.03858025308642  # 0.5 / 3.6², drag force factor for speeds in km/h
+DEG_TO_RAD = 0.01745329  # degrees to radians conversion
+KMH_TO_MS = 0.2777778   # km/h to m/s conversion
+TWO_PI = 2 * 3.14159  # radians per revolution, with the π the graph simulation formulas use
+
 # ========== GRAPH SIMULATION DEFAULT CONSTANTS ==========
 
 GRAPH_SIM_DEFAULTS = {
@@ -374,7 +396,7 @@ GRAPH_SIM_DEFAULTS['init_vehicle_speed_kmph'] = GRAPH_SIM_DEFAULTS['init_vehicle
 # Uses EV_DEFAULTS for gear_ratio and wheel_radius
 GRAPH_SIM_DEFAULTS['init_motor_speed_rpm'] = (
     GRAPH_SIM_DEFAULTS['init_vehicle_speed_kmph'] * EV_DEFAULTS['gear_ratio']
-) / (2 * 3.14159 * EV_DEFAULTS['wheel_radius'] * 0.001 * 60)
+) / (TWO_PI * EV_DEFAULTS['wheel_radius'] * 0.001 * 60)
 
 # Calculate init_total_motor_torque based on mode and motor RPM
 # Formula: IF(mode=boost, IF(RPM<500, 37, (2000*60)/(2*π*RPM)), IF(RPM<500, 19, (1000*60)/(2*π*RPM))) * 2
@@ -382,11 +404,11 @@ GRAPH_SIM_DEFAULTS['init_motor_speed_rpm'] = (
 GRAPH_SIM_DEFAULTS['init_total_motor_torque'] = (
     GRAPH_SIM_DEFAULTS['mode'] == 'boost' and (
         GRAPH_SIM_DEFAULTS['init_motor_speed_rpm'] < 500 and 37 or (
-            (2000 * 60) / (2 * 3.14159 * GRAPH_SIM_DEFAULTS['init_motor_speed_rpm'])
+            (2000 * 60) / (TWO_PI * GRAPH_SIM_DEFAULTS['init_motor_speed_rpm'])
         )
     ) or (
         GRAPH_SIM_DEFAULTS['init_motor_speed_rpm'] < 500 and 19 or (
-            (1000 * 60) / (2 * 3.14159 * GRAPH_SIM_DEFAULTS['init_motor_speed_rpm'])
+            (1000 * 60) / (TWO_PI * GRAPH_SIM_DEFAULTS['init_motor_speed_rpm'])
         )
     )
 ) * 2
@@ -398,7 +420,7 @@ GRAPH_SIM_DEFAULTS['init_per_motor_torque'] = (
 
 # Calculate init_per_motor_power: (2π × RPM × torque) / 60
 GRAPH_SIM_DEFAULTS['init_per_motor_power'] = (
-    (2 * 3.14159 * GRAPH_SIM_DEFAULTS['init_motor_speed_rpm'] * GRAPH_SIM_DEFAULTS['init_per_motor_torque']) / 60
+    (TWO_PI * GRAPH_SIM_DEFAULTS['init_motor_speed_rpm'] * GRAPH_SIM_DEFAULTS['init_per_motor_torque']) / 60
 )
 
 # Calculate init_tractive_force: (total_torque × gear_efficiency × gear_ratio) / wheel_radius
@@ -410,20 +432,20 @@ GRAPH_SIM_DEFAULTS['init_tractive_force'] = (
 
 # Calculate init_froll: rolling resistance force = cr × mass × g
 # Uses EV_DEFAULTS for cr and gvw
-GRAPH_SIM_DEFAULTS['init_froll'] = EV_DEFAULTS['cr'] * EV_DEFAULTS['gvw'] * 9.81
+GRAPH_SIM_DEFAULTS['init_froll'] = EV_DEFAULTS['cr'] * EV_DEFAULTS['gvw'] * GRAVITY
 
 # Calculate init_fdrag: aerodynamic drag force = cd × air_density × frontal_area × speed² × 0.03858025308642
 # Uses EV_DEFAULTS for cd, air_density, frontal_area
 GRAPH_SIM_DEFAULTS['init_fdrag'] = (
     EV_DEFAULTS['cd'] * EV_DEFAULTS['air_density'] * EV_DEFAULTS['frontal_area'] * 
-    GRAPH_SIM_DEFAULTS['init_vehicle_speed_kmph'] * GRAPH_SIM_DEFAULTS['init_vehicle_speed_kmph'] * 0.03858025308642
+    GRAPH_SIM_DEFAULTS['init_vehicle_speed_kmph'] * GRAPH_SIM_DEFAULTS['init_vehicle_speed_kmph'] * DRAG_KMH_FACTOR
 )
 
 # Calculate init_fclimb: climbing force = mass × g × sin(gradient_angle)
 # Uses EV_DEFAULTS for gvw
 import math
 GRAPH_SIM_DEFAULTS['init_fclimb'] = (
-    EV_DEFAULTS['gvw'] * 9.81 * math.sin(GRAPH_SIM_DEFAULTS['gradient_deg'] * 0.01745329)
+    EV_DEFAULTS['gvw'] * GRAVITY * math.sin(GRAPH_SIM_DEFAULTS['gradient_deg'] * DEG_TO_RAD)
 )
 
 # Calculate init_fload: total load resistance = froll + fdrag + fclimb
@@ -442,85 +464,1057 @@ GRAPH_SIM_DEFAULTS['init_vehicle_accel'] = (
     GRAPH_SIM_DEFAULTS['init_fnet'] / EV_DEFAULTS['gvw']
 )
 
-# Physical constants
-GRAVITY = 9.81  # m/s² 
-DEG_TO_RAD = 0.01745329  # degrees to radians conversion
-KMH_TO_MS = 0.2777778   # km/h to m/s conversion
+# Reference EV for the graph simulation and motor suitability check, frozen once so those
+# paths unpack one tuple instead of looking each value up in EV_DEFAULTS:
+# (gvw, gear_efficiency as a fraction, gear_ratio, wheel_radius, cr, cd, air_density, frontal_area)
+GRAPH_SIM_VEHICLE = (
+    EV_DEFAULTS['gvw'], EV_DEFAULTS['gear_efficiency'] / 100.0, EV_DEFAULTS['gear_ratio'],
+    EV_DEFAULTS['wheel_radius'], EV_DEFAULTS['cr'], EV_DEFAULTS['cd'], EV_DEFAULTS['air_density'],
+    EV_DEFAULTS['frontal_area'],
+)
+
+# (cos, sin) of each whole-degree gradient 0-89 scanned by the motor suitability check
+GRADIENT_SCAN_TRIG = tuple((math.cos(math.radians(deg)), math.sin(math.radians(deg))) for deg in range(90))
+
+# Terrain scenario buttons: scenario -> gradient (degrees)
+SCENARIO_GRADIENTS = {'flat': 0, 'gentle': 7, 'hill': 15, 'steep': 30}
+
+# EV drive pattern slabs: name, share of the range driven (%), speed as a fraction of max speed.
+# The last slab runs at the slope speed on the gradeability angle instead.
+SLAB_NAMES = ('Slab-1 Max Speed', 'Slab-2 Speed', 'Slab-3 Speed', 'Slab-4 Speed')
+SLAB_DRIVE_PCT = (35, 40, 20, 5)
+SLAB_SPEED_MULT = (1.0, 0.7, 0.5, 0.0)
+# Structured dtype of one slab record, fields in EV_SLAB_ROW_TEMPLATE column order
+SLAB_FIELDS = [
+    ('name', 'U24'), ('speed', 'f8'), ('drive_pct', 'i4'), ('gradient', 'f8'), ('distance', 'f8'),
+    ('F_climb', 'f8'), ('F_drag', 'f8'), ('F_roll', 'f8'), ('motor_input', 'f8'), ('motor_output', 'f8'),
+    ('battery_current', 'f8'), ('usable_energy', 'f8'), ('true_usable_ah', 'f8'), ('final_ah', 'f8'),
+]
+
+# Graph simulation table columns, in display/export order
+GRAPH_SIM_COLUMNS = (
+    'Time',
+    'Vehicle Speed (m/s)',
+    'Vehicle Speed (Kmph)',
+    'Motor Speed (RPM)',
+    'Gradient (Degree)',
+    'Mode',
+    'Total Motor Torque (Nm)',
+    'Total Number of Power Wheels',
+    'PerMotor Torque (Nm)',
+    'PerMotor Power (Watts)',
+    'Motoring Tractive Force F_Tractive (N)',
+    'Froll (N)',
+    'Fdrag (N)',
+    'Fclimb (N)',
+    'F_Load Resistance (N)',
+    'Net Force F_Net (N)',
+    'Vehicle Acceleration (m/s)',
+)
+# Columns that change per time step (the rest are constant for a run)
+GRAPH_SIM_STEP_COLUMNS = tuple(name for name in GRAPH_SIM_COLUMNS
+                               if name not in ('Gradient (Degree)', 'Mode', 'Total Number of Power Wheels'))
+
+# Reset plan shared by EV and UGV parameter panels: (widget attribute suffix, defaults key, setter)
+VEHICLE_RESET_FIELDS = (
+    # Physical Parameters
+    ('cd_input', 'cd', 'setValue'),
+    ('cr_input', 'cr', 'setValue'),
+    ('wheel_radius_input', 'wheel_radius', 'setValue'),
+    ('air_density_input', 'air_density', 'setValue'),
+    ('frontal_area_input', 'frontal_area', 'setValue'),
+    # Drivetrain Parameters
+    ('gear_ratio_input', 'gear_ratio', 'setValue'),
+    ('gear_efficiency_input', 'gear_efficiency', 'setValue'),
+    ('motor_efficiency_input', 'motor_efficiency', 'setValue'),
+    ('motor_base_rpm_input', 'motor_base_rpm', 'setValue'),
+    # Weight Parameters
+    ('kerb_weight_input', 'kerb_weight', 'setValue'),
+    ('passenger_weight_input', 'passenger_weight', 'setValue'),
+    ('gvw_input', 'gvw', 'setValue'),
+    ('motor_controller_weight_input', 'motor_controller_weight', 'setValue'),
+    ('battery_weight_input', 'battery_weight_input', 'setValue'),
+    ('vehicle_weight_input', 'vehicle_weight', 'setValue'),
+    ('other_weights_input', 'other_weights', 'setValue'),
+    ('generator_weight_input', 'generator_weight', 'setValue'),
+    # Battery Parameters
+    ('battery_req_input', 'battery_requirements', 'setCurrentText'),
+    ('battery_chem_input', 'battery_chemistry', 'setCurrentText'),
+    ('battery_voltage_input', 'battery_voltage', 'setValue'),
+    ('weight_per_wh_input', 'weight_per_wh', 'setValue'),
+    ('peukert_input', 'peukert_coeff', 'setValue'),
+    ('discharge_hr_input', 'discharge_hr', 'setValue'),
+    ('dod_input', 'dod_pct', 'setValue'),
+    ('battery_current_input', 'battery_current', 'setValue'),
+    ('true_capacity_wh_input', 'true_capacity_wh', 'setValue'),
+    ('true_capacity_ah_input', 'true_capacity_ah', 'setValue'),
+    ('tentative_ah_input', 'tentative_ah', 'setValue'),
+    ('tentative_wh_input', 'tentative_wh', 'setValue'),
+    ('battery_weight_total_input', 'battery_weight_total', 'setValue'),
+    # Performance Parameters
+    ('rotary_inertia_input', 'rotary_inertia', 'setValue'),
+    ('max_speed_input', 'max_speed', 'setValue'),
+    ('slope_speed_input', 'slope_speed', 'setValue'),
+    ('gradeability_input', 'gradeability', 'setValue'),
+    ('accel_end_speed_input', 'accel_end_speed', 'setValue'),
+    ('accel_period_input', 'accel_period', 'setValue'),
+    ('vehicle_range_input', 'vehicle_range', 'setValue'),
+)
+
+UGV_RESET_FIELDS = VEHICLE_RESET_FIELDS + (
+    # UGV-Specific Parameters
+    ('step_height_input', 'step_height', 'setValue'),
+    ('num_wheels_input', 'num_wheels', 'setValue'),
+    ('num_powered_wheels_input', 'num_powered_wheels', 'setValue'),
+    ('load_per_wheel_input', 'load_per_wheel', 'setValue'),
+    ('torque_climb_input', 'torque_climb', 'setValue'),
+    ('track_width_input', 'track_width', 'setValue'),
+    ('skid_coefficient_input', 'skid_coefficient', 'setValue'),
+    ('spin_angular_rad_input', 'spin_angular_rad', 'setValue'),
+    ('spin_angular_deg_input', 'spin_angular_deg', 'setValue'),
+)
+
+# Parameter panel spin boxes, one table per group box. Rows are
+# (widget attribute suffix, label, (minimum, maximum), initial value, decimals, single step);
+# decimals is None for integer (QSpinBox) inputs. The vehicle tables are shared by EV and UGV.
+VEHICLE_PHYSICAL_SPINS = (
+    ('cd_input', 'Cd Drag Coefficient:', (0.1, 2.0), EV_DEFAULTS['cd'], 3, 0.01),
+    ('cr_input', 'Cr Rolling Resistance:', (0.001, 0.1), EV_DEFAULTS['cr'], 4, 0.001),
+    ('wheel_radius_input', 'Wheel Radius (m):', (0.05, 1.0), EV_DEFAULTS['wheel_radius'], 4, 0.001),
+    ('air_density_input', 'ρ Air Density (kg/m³):', (0.5, 2.0), EV_DEFAULTS['air_density'], 3, 0.001),
+    ('frontal_area_input', 'Af Frontal Area (m²):', (0.1, 5.0), EV_DEFAULTS['frontal_area'], 2, 0.1),
+)
+VEHICLE_DRIVETRAIN_SPINS = (
+    ('gear_ratio_input', 'Gear Ratio:', (1.0, 20.0), 5.221, 3, 0.1),
+    ('gear_efficiency_input', 'Gear Efficiency ηg (%):', (50.0, 99.0), 95.0, 1, 0.5),
+    ('motor_efficiency_input', 'Motor Efficiency ηm (%):', (50.0, 99.0), 85.0, 1, 0.5),
+    ('motor_base_rpm_input', 'Motor Base RPM:', (100, 20000), 1000, None, 100),
+)
+VEHICLE_WEIGHT_SPINS = (
+    ('kerb_weight_input', 'Kerb Weight (kg):', (0.0, 5000.0), 150.0, 2, 5.0),
+    ('passenger_weight_input', 'Passenger/Load Weight (kg):', (0.0, 1000.0), 0.0, 2, 5.0),
+    ('gvw_input', 'GVW (kg):', (0.0, 6000.0), 150.0, 2, 5.0),
+    # QFormLayout labels read '&' as a mnemonic marker, so a literal ampersand is written '&&'
+    ('motor_controller_weight_input', 'Motor && Controller Weight (kg):', (0.0, 500.0), 0.0, 2, 1.0),
+    ('battery_weight_input', 'Battery Weight (kg):', (0.0, 1000.0), 0.0, 2, 1.0),
+    ('vehicle_weight_input', 'Vehicle Weight (kg):', (0.0, 5000.0), 150.0, 2, 5.0),
+    ('other_weights_input', 'Other Weights (kg):', (0.0, 500.0), 0.0, 2, 1.0),
+    ('generator_weight_input', 'Generator Weight (kg):', (0.0, 200.0), 0.0, 2, 1.0),
+)
+VEHICLE_BATTERY_SPINS = (
+    ('battery_voltage_input', 'Battery Voltage (V):', (0.0, 1000.0), 24.0, 1, 1.0),
+    ('weight_per_wh_input', 'Weight per unit Wh (kg/Wh):', (0.0, 1.0), EV_DEFAULTS['weight_per_wh'], 4, 0.0001),
+    ('peukert_input', 'Peukert\'s Coefficient:', (1.0, 1.5), 1.05, 2, 0.01),
+    ('discharge_hr_input', 'Discharge Hour Rating (Hr):', (0.1, 20.0), 2.0, 1, 0.1),
+    ('dod_input', 'Depth of Discharge (%):', (0.0, 100.0), 100.0, 1, 1.0),
+    ('battery_current_input', 'Constant Speed Battery Current (A):', (0.0, 500.0), 53.0, 1, 1.0),
+    ('true_capacity_wh_input', 'True Usable Battery Capacity (Wh):', (0.0, 50000.0), 1789.0, 1, 10.0),
+    ('true_capacity_ah_input', 'True Usable Battery Capacity (Ah):', (0.0, 1000.0), 75.0, 1, 1.0),
+    ('tentative_ah_input', 'Tentative Battery Ah (for Discharge Hr):', (0.0, 1000.0), 76.0, 1, 1.0),
+    ('tentative_wh_input', 'Tentative Battery Capacity (Wh):', (0.0, 50000.0), 1820.0, 1, 10.0),
+    ('battery_weight_total_input', 'Battery Weight (kg):', (0.0, 500.0), 12.0, 1, 0.5),
+)
+VEHICLE_PERFORMANCE_SPINS = (
+    ('rotary_inertia_input', 'Rotary Inertia Compensation:', (0.0, 2.0), 1.06, 3, 0.01),
+    ('max_speed_input', 'Max Speed (Kmph):', (1.0, 300.0), 50.0, 2, 1.0),
+    ('slope_speed_input', 'Slope Speed (Kmph):', (1.0, 150.0), 5.0, 2, 1.0),
+    ('gradeability_input', 'Gradeability (deg):', (0.0, 60.0), 30.0, 2, 0.5),
+    ('accel_end_speed_input', 'Acceleration End Speed (Kmph):', (1.0, 200.0), 50.0, 2, 1.0),
+    ('accel_period_input', 'Acceleration Period (s):', (1.0, 60.0), 5.0, 2, 0.5),
+    ('vehicle_range_input', 'Vehicle Range (Km):', (1.0, 1000.0), 70.0, 2, 5.0),
+)
+UGV_SPECIFIC_SPINS = (
+    ('step_height_input', 'Step Height (m):', (0.0, 1.0), 0.1, 3, 0.01),
+    ('num_wheels_input', 'Number of Wheels:', (2, 12), 4, None, 1),
+    ('num_powered_wheels_input', 'Number of Powered Wheels:', (1, 12), 2, None, 1),
+    ('load_per_wheel_input', 'Load on each Wheel (kg):', (0.0, 1000.0), 37.5, 2, 0.1),
+    ('torque_climb_input', 'Torque Req. Climb/Motor (Nm):', (0.0, 500.0), 36.75, 2, 0.01),
+    ('track_width_input', 'Track Width (m):', (0.1, 5.0), 0.6, 3, 0.01),
+    ('skid_coefficient_input', 'Skid Coefficient μ:', (0.1, 2.0), 0.7, 3, 0.01),
+    ('spin_angular_rad_input', 'Spin Angular Speed ω (rad/s):', (0.0, 20.0), 0.5, 3, 0.1),
+    ('spin_angular_deg_input', 'Spin Angular Speed (deg/s):', (0.0, 1200.0), 28.6479, 4, 0.1),
+)
+
+# Battery combo boxes, ahead of the battery spin boxes: (attribute suffix, label, items, initial item)
+VEHICLE_BATTERY_COMBOS = (
+    ('battery_req_input', 'Battery Requirements:', ('Lithium', 'Lead Acid', 'NiMH'), 'Lithium'),
+    ('battery_chem_input', 'Battery Chemistry:', ('NCM', 'NCA', 'LFP', 'LTO'), 'NCM'),
+)
+
+# Group boxes of a vehicle parameter panel, top to bottom: (title, combo rows, spin box rows)
+VEHICLE_PARAM_GROUPS = (
+    ('Physical Parameters', (), VEHICLE_PHYSICAL_SPINS),
+    ('Drivetrain Parameters', (), VEHICLE_DRIVETRAIN_SPINS),
+    ('Weight Parameters', (), VEHICLE_WEIGHT_SPINS),
+    ('Battery Parameters', VEHICLE_BATTERY_COMBOS, VEHICLE_BATTERY_SPINS),
+    ('Performance Parameters', (), VEHICLE_PERFORMANCE_SPINS),
+)
+UGV_PARAM_GROUPS = VEHICLE_PARAM_GROUPS + (('UGV-Specific Parameters', (), UGV_SPECIFIC_SPINS),)
+
+# UGV widgets compute_output_values reads, in the order it unpacks them (suffix after 'ugv_')
+UGV_COMPUTE_INPUTS = (
+    'wheel_radius_input', 'gear_ratio_input', 'gear_efficiency_input', 'motor_efficiency_input',
+    'motor_base_rpm_input', 'vehicle_weight_input', 'cd_input', 'cr_input', 'frontal_area_input',
+    'air_density_input', 'max_speed_input', 'slope_speed_input', 'gradeability_input',
+    'accel_end_speed_input', 'accel_period_input', 'rotary_inertia_input', 'gvw_input',
+    'num_wheels_input', 'num_powered_wheels_input', 'track_width_input', 'skid_coefficient_input',
+    'spin_angular_rad_input', 'spin_angular_deg_input',
+)
+
+# Testing Point defaults: vehicle parameters shared by every point, bound from EV_DEFAULTS once
+TEST_POINT_VEHICLE = {key: EV_DEFAULTS[key] for key in
+                      ('gvw', 'cd', 'cr', 'air_density', 'frontal_area', 'gear_ratio', 'wheel_radius')}
+
+# Different default values for each of the 10 test points
+# Varying RPM, Torque, Gradient and some vehicle parameters for diverse analysis
+TEST_POINT_DEFAULTS = (
+    # Point 1: Low speed, low torque, flat road
+    {'rpm': 500, 'torque': 20, **TEST_POINT_VEHICLE, 'gradient': 0.0},
+    # Point 2: Medium speed, medium torque, flat road
+    {'rpm': 1500, 'torque': 50, **TEST_POINT_VEHICLE, 'gradient': 0.0},
+    # Point 3: Optimal efficiency zone (mid RPM, mid-high torque)
+    {'rpm': 2500, 'torque': 75, **TEST_POINT_VEHICLE, 'gradient': 0.0},
+    # Point 4: High torque climbing - gentle slope
+    {'rpm': 2000, 'torque': 100, **TEST_POINT_VEHICLE, 'gradient': 5.0},
+    # Point 5: High speed cruise
+    {'rpm': 4000, 'torque': 40, **TEST_POINT_VEHICLE, 'gradient': 0.0},
+    # Point 6: Steep climb - high torque
+    {'rpm': 1000, 'torque': 120, **TEST_POINT_VEHICLE, 'gradient': 15.0},
+    # Point 7: Highway speed
+    {'rpm': 5000, 'torque': 60, **TEST_POINT_VEHICLE, 'gradient': 0.0},
+    # Point 8: Very high speed
+    {'rpm': 7000, 'torque': 30, **TEST_POINT_VEHICLE, 'gradient': 0.0},
+    # Point 9: Heavy load condition
+    {'rpm': 3000, 'torque': 90, **TEST_POINT_VEHICLE, 'gvw': EV_DEFAULTS['gvw'] * 1.3, 'gradient': 3.0},
+    # Point 10: Downhill regeneration
+    {'rpm': 3500, 'torque': 25, **TEST_POINT_VEHICLE, 'gradient': -5.0},
+)
+
+# Values Clear Test Points writes to every row: no operating point, reference vehicle, flat road
+TEST_POINT_CLEARED = {'rpm': 0, 'torque': 0, **TEST_POINT_VEHICLE, 'gradient': 0.0}
+
+# calculate_motor_efficiency: params used when none are given, and the reference vehicle's
+# cd * frontal_area * air_density that the drag penalty is measured against
+EFFICIENCY_DEFAULT_PARAMS = {**TEST_POINT_VEHICLE, 'gradient': 0.0}
+EFFICIENCY_REFERENCE_DRAG = EV_DEFAULTS['cd'] * EV_DEFAULTS['frontal_area'] * EV_DEFAULTS['air_density']
+
+
+# Energy density by battery chemistry (Wh/kg)
+BATTERY_ENERGY_DENSITY = {
+    'NCM': 250,  # Nickel Cobalt Manganese
+    'NCA': 260,  # Nickel Cobalt Aluminum
+    'LFP': 160,  # Lithium Iron Phosphate
+    'LTO': 80    # Lithium Titanate Oxide
+}
+
+# Rendered EV outputs kept for repeated parameter sets
+EV_OUTPUT_CACHE_SIZE = 128
+
+
+# Python 3.8 has no dataclass(slots=True), so the record classes below list their __slots__ by hand
+# (no __dict__ per instance); keep each tuple in step with the fields
+@dataclass(frozen=True)
+class EVSnapshot:
+    """EV parameter panel values, read once per compute. Field names match the ev_<name>_input widgets."""
+    __slots__ = ('wheel_radius', 'cd', 'cr', 'frontal_area', 'air_density', 'gear_ratio', 'gear_efficiency',
+                 'motor_efficiency', 'motor_base_rpm', 'passenger_weight', 'motor_controller_weight',
+                 'battery_weight', 'vehicle_weight', 'other_weights', 'generator_weight', 'battery_req',
+                 'battery_chem', 'battery_voltage', 'weight_per_wh', 'peukert', 'discharge_hr', 'dod',
+                 'battery_current', 'true_capacity_wh', 'true_capacity_ah', 'tentative_ah', 'tentative_wh',
+                 'battery_weight_total', 'max_speed', 'slope_speed', 'gradeability', 'accel_end_speed',
+                 'accel_period', 'rotary_inertia', 'vehicle_range')
+    # Physical parameters
+    wheel_radius: float
+    cd: float
+    cr: float
+    frontal_area: float
+    air_density: float
+    # Drivetrain parameters
+    gear_ratio: float
+    gear_efficiency: float
+    motor_efficiency: float
+    motor_base_rpm: float
+    # Weight parameters
+    passenger_weight: float
+    motor_controller_weight: float
+    battery_weight: float
+    vehicle_weight: float
+    other_weights: float
+    generator_weight: float
+    # Battery parameters
+    battery_req: str
+    battery_chem: str
+    battery_voltage: float
+    weight_per_wh: float
+    peukert: float
+    discharge_hr: float
+    dod: float
+    battery_current: float
+    true_capacity_wh: float
+    true_capacity_ah: float
+    tentative_ah: float
+    tentative_wh: float
+    battery_weight_total: float
+    # Performance parameters
+    max_speed: float
+    slope_speed: float
+    gradeability: float
+    accel_end_speed: float
+    accel_period: float
+    rotary_inertia: float
+    vehicle_range: float
+
+
+@dataclass
+class WeightBreakdown:
+    """EV weight components shown in the Weight Analysis table (kg)"""
+    __slots__ = ('kerb_weight', 'passenger_weight', 'motor_controller_weight', 'battery_weight_total',
+                 'other_weights', 'generator_weight', 'calculated_total', 'calculated_gvw',
+                 'input_vehicle_weight')
+    kerb_weight: float
+    passenger_weight: float
+    motor_controller_weight: float
+    battery_weight_total: float
+    other_weights: float
+    generator_weight: float
+    calculated_total: float
+    calculated_gvw: float
+    input_vehicle_weight: float
+
+
+@dataclass
+class BatteryAnalysis:
+    """EV battery inputs and sizing results shown in the Battery Analysis table"""
+    __slots__ = ('requirements', 'chemistry', 'battery_voltage', 'weight_per_wh', 'peukert_coeff',
+                 'discharge_hr', 'dod_pct', 'battery_current', 'nominal_capacity_wh', 'nominal_capacity_ah',
+                 'peukert_adjusted_ah', 'peukert_adjusted_wh', 'calculated_battery_weight')
+    requirements: str
+    chemistry: str
+    battery_voltage: float
+    weight_per_wh: float
+    peukert_coeff: float
+    discharge_hr: float
+    dod_pct: float
+    battery_current: float
+    nominal_capacity_wh: float
+    nominal_capacity_ah: float
+    peukert_adjusted_ah: float
+    peukert_adjusted_wh: float
+    calculated_battery_weight: float
+
+
+def compute_drive_outputs(wheel_radius, cd, cr, frontal_area, air_density, gear_ratio, gear_efficiency,
+                          motor_efficiency, motor_base_rpm, gvw, calculated_gvw, max_speed, slope_speed,
+                          sin_gradeability, accel_end_speed, accel_period, rotary_inertia):
+    """
+    Force, power, torque and RPM requirements for the three design scenarios.
+    
+    Pure math with no widget access. Speeds are in km/h, efficiencies as fractions and
+    the gradeability is passed as its sine. Every input may be a scalar or a NumPy array; per-scenario
+    outputs are stacked along the first axis in the order (max speed, max slope, acceleration).
+    
+    Returns the tuple (F_drag_max, F_drag_slope, F_roll, F_climb, vehicle_speed_motor_base,
+    Vehicle_End_Acc_Speed, term1, term2, term3, req_power_accel, motor_input, motor_output,
+    rpm_motor, torque_motor, wheel_power, rpm_wheel, torque_wheel).
+    """
+    import numpy as np
+    
+    scenario_speeds = np.stack(np.broadcast_arrays(max_speed, slope_speed, accel_end_speed)).astype(float)
+    
+    # Convert speeds to m/s
+    scenario_speeds_ms = scenario_speeds / 3.6
+    
+    # Vehicle Speed for Motor Base Speed RPM
+    vehicle_speed_motor_base = (motor_base_rpm * math.tau * wheel_radius) / (60 * gear_ratio)
+    
+    # --- FORCE CALCULATIONS ---
+    # Drag force at max speed and at slope speed (F = 0.5 * Cd * ρ * A * v²)
+    F_drag_max, F_drag_slope = 0.5 * cd * air_density * frontal_area * scenario_speeds_ms[:2] ** 2
+    
+    # Rolling resistance (zero gradient)
+    F_roll = cr * gvw * 9.81
+    
+    # Climbing force (sine of the gradeability angle)
+    F_climb = gvw * 9.81 * sin_gradeability
+    
+    # Convert acceleration end speed to m/s
+    Vehicle_End_Acc_Speed = accel_end_speed * 0.277777777777777
+    
+    # --- VEHICLE ACCELERATION POWER ---
+    # Term1: ((GVW * rotary_inertia) / (2 * accel_period)) * ((Vehicle_End_Acc_Speed^2) + (vehicle_speed_motor_base^2))
+    term1 = ((calculated_gvw * rotary_inertia) / (2 * accel_period)) * ((Vehicle_End_Acc_Speed ** 2) + (vehicle_speed_motor_base ** 2))
+    
+    # Term2: (Cd * rho * A * Vehicle_End_Acc_Speed^3) / 5
+    term2 = (cd * air_density * frontal_area * Vehicle_End_Acc_Speed * Vehicle_End_Acc_Speed * Vehicle_End_Acc_Speed) / 5
+    
+    # Term3: (2 * Cr * GVW * g * Vehicle_End_Acc_Speed) / 3
+    term3 = (2 * cr * calculated_gvw * 9.81 * Vehicle_End_Acc_Speed) / 3
+    
+    # Required Power for Acceleration
+    req_power_accel = (term1 + term2 + term3) / (gear_efficiency * motor_efficiency)
+    
+    # --- POWER DEMAND PER SCENARIO ---
+    # Resistive force × speed for the two steady-state scenarios, acceleration terms for the third
+    max_speed_ms, slope_speed_ms = scenario_speeds[:2] * KMH_TO_MS
+    power_demand = np.stack(np.broadcast_arrays(
+        (F_drag_max + F_roll) * max_speed_ms,
+        (F_drag_slope + F_roll + F_climb) * slope_speed_ms,
+        term1 + term2 + term3))
+    
+    # --- TOTAL REQUIRED MOTOR OUTPUT POWER ---
+    motor_output = power_demand / gear_efficiency
+    
+    # --- MOTOR INPUT POWER (accounting for efficiencies) ---
+    motor_input = motor_output / motor_efficiency
+    
+    # --- TOTAL TORQUE AND RPM AT MOTOR OUTPUT ---
+    rpm_motor = (scenario_speeds * gear_ratio) / (math.tau * wheel_radius * 0.001 * 60)
+    torque_motor = (motor_output * 60) / (math.tau * rpm_motor)
+    
+    # --- TOTAL REQUIRED POWER OUTPUT AT WHEELS ---
+    wheel_power = motor_output * gear_efficiency
+    
+    # --- TOTAL TORQUE AND RPM AT WHEELS ---
+    rpm_wheel = (scenario_speeds_ms * 60) / (math.tau * wheel_radius)
+    torque_wheel = np.divide(wheel_power * 60, math.tau * rpm_wheel,
+                             out=np.zeros(np.broadcast_shapes(wheel_power.shape, rpm_wheel.shape)),
+                             where=rpm_wheel > 0)
+    
+    return (F_drag_max, F_drag_slope, F_roll, F_climb, vehicle_speed_motor_base, Vehicle_End_Acc_Speed,
+            term1, term2, term3, req_power_accel,
+            motor_input, motor_output, rpm_motor, torque_motor,
+            wheel_power, rpm_wheel, torque_wheel)
+
+
+# Names of the values returned by compute_drive_outputs, in order
+DRIVE_OUTPUT_NAMES = (
+    'F_drag_max', 'F_drag_slope', 'F_roll', 'F_climb', 'vehicle_speed_motor_base', 'Vehicle_End_Acc_Speed',
+    'term1', 'term2', 'term3', 'req_power_accel',
+    'motor_input', 'motor_output', 'rpm_motor', 'torque_motor',
+    'wheel_power', 'rpm_wheel', 'torque_wheel',
+)
+
+# Sweepable parameters: label -> (drive parameter name, default sweep min, default sweep max)
+SWEEP_PARAMETERS = {
+    'Max Speed (km/h)': ('max_speed', 10.0, 100.0),
+    'Slope Speed (km/h)': ('slope_speed', 2.0, 30.0),
+    'Gradeability (°)': ('gradeability', 0.0, 35.0),
+    'GVW (kg)': ('gvw', 100.0, 1000.0),
+    'Gear Ratio': ('gear_ratio', 2.0, 20.0),
+    'Accel End Speed (km/h)': ('accel_end_speed', 10.0, 100.0),
+}
+
+# Sweep result metrics: label -> (drive output name, scenario index: 0 max speed, 1 max slope, 2 acceleration)
+SWEEP_METRICS = {
+    'Motor Input Power - Max Speed (W)': ('motor_input', 0),
+    'Motor Input Power - Max Slope (W)': ('motor_input', 1),
+    'Motor Input Power - Acceleration (W)': ('motor_input', 2),
+    'Motor Torque - Max Slope (Nm)': ('torque_motor', 1),
+    'Motor Torque - Acceleration (Nm)': ('torque_motor', 2),
+}
+
+
+def sweep_drive_outputs(base_params, sweep_axes):
+    """
+    Evaluate compute_drive_outputs over a whole parameter grid in one broadcast pass.
+    
+    base_params holds the compute_drive_outputs arguments, with 'gradeability' in degrees
+    instead of its sine and a single 'gvw' used for both weight arguments. sweep_axes is a
+    sequence of (parameter name, 1-D values); grid axis i follows sweep_axes[i].
+    Returns a dict keyed by DRIVE_OUTPUT_NAMES.
+    """
+    import numpy as np
+    
+    params = dict(base_params)
+    ndim = len(sweep_axes)
+    for axis, (name, values) in enumerate(sweep_axes):
+        shape = [1] * ndim
+        shape[axis] = len(values)
+        params[name] = np.asarray(values, dtype=float).reshape(shape)
+    
+    params['calculated_gvw'] = params['gvw']
+    params['sin_gradeability'] = np.sin(params.pop('gradeability') * DEG_TO_RAD)
+    return dict(zip(DRIVE_OUTPUT_NAMES, compute_drive_outputs(**params)))
+
+
+@lru_cache(maxsize=1)
+def slab_pattern_arrays():
+    """The fixed drive pattern slab constants as read-only arrays, built once"""
+    import numpy as np
+    
+    speed_mult = np.array(SLAB_SPEED_MULT)
+    drive_pct = np.array(SLAB_DRIVE_PCT)
+    speed_mult.setflags(write=False)
+    drive_pct.setflags(write=False)
+    return speed_mult, drive_pct
+
+
+def compute_slab_outputs(max_speed, slope_speed, gradeability, sin_gradeability, vehicle_range, cd, air_density,
+                         frontal_area, cr, gvw, gear_efficiency, motor_efficiency, battery_voltage, dod_pct,
+                         discharge_hr, peukert_coeff):
+    """
+    Battery sizing over the EV drive pattern slabs (see SLAB_NAMES), one array element per slab.
+    
+    Returns the tuple (speeds, gradients, distances_km, F_drag, F_roll, F_climb, motor_input, motor_output,
+    battery_current, usable_energy_wh, true_usable_ah, final_ah).
+    """
+    import numpy as np
+    
+    speed_mult, drive_pct = slab_pattern_arrays()
+    speeds = speed_mult * max_speed
+    speeds[3] = slope_speed
+    speeds_ms = speeds * KMH_TO_MS
+    gradients = np.array([0.0, 0.0, 0.0, gradeability])
+    distances_km = (vehicle_range * drive_pct)/100
+    
+    # Slab-invariant terms
+    gvw_g = gvw * GRAVITY
+    drag_area = cd * air_density * frontal_area
+    peukert_exponent = peukert_coeff - 1
+    inv_peukert = 1/peukert_coeff
+    
+    # Calculate forces (rolling resistance is the same for every slab)
+    F_drag = drag_area * speeds * speeds * DRAG_KMH_FACTOR
+    F_roll = cr * gvw * GRAVITY
+    # Only the last slab is on a gradient; the flat slabs have no climbing force at all
+    F_climb = np.zeros(len(SLAB_NAMES))
+    F_climb[3] = gvw_g * sin_gradeability
+    
+    # Power calculations
+    power_wheel = (F_drag + F_roll + F_climb)
+    motor_output = power_wheel * speeds_ms / gear_efficiency
+    motor_input = motor_output / motor_efficiency
+    
+    # Battery current
+    battery_current = motor_input / battery_voltage
+    
+    # Energy and capacity
+    usable_energy_wh = (motor_input * distances_km) / (speeds * (dod_pct/100))
+    true_usable_ah = usable_energy_wh / battery_voltage
+    final_ah = (true_usable_ah * ((battery_current * discharge_hr) ** peukert_exponent)) ** inv_peukert
+    
+    return (speeds, gradients, distances_km, F_drag, F_roll, F_climb, motor_input, motor_output,
+            battery_current, usable_energy_wh, true_usable_ah, final_ah)
+
+
+class GraphDataTableModel(QAbstractTableModel):
+    """Read-only table model over the graph simulation columns (dict of column arrays)"""
+    
+    # Every cell is read-only and selectable, so flags never depend on the index
+    ITEM_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = []
+        self._headers = []
+        self._row_count = 0
+        self._int_rows = {}  # col -> rows whose value is shown as an int
+        self._display_cache = {}  # (row, col) -> formatted cell text
+    
+    def set_columns(self, columns, int_rows=None):
+        """Swap in a new set of column arrays with a single model reset
+        
+        int_rows maps a column name to the rows that hold an integer result (shown as 74, not 74.0).
+        """
+        self.beginResetModel()
+        self._headers = list(columns.keys())
+        self._columns = list(columns.values())
+        self._row_count = len(self._columns[0]) if self._columns else 0
+        self._int_rows = {self._headers.index(name): set(rows) for name, rows in (int_rows or {}).items()}
+        self._display_cache = {}
+        self.endResetModel()
+    
+    def clear(self):
+        self.set_columns({})
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Repaints ask for the same cells repeatedly; format each one only once
+            key = (index.row(), index.column())
+            text = self._display_cache.get(key)
+            if text is None:
+                value = self._columns[key[1]][key[0]]
+                text = str(int(value)) if key[0] in self._int_rows.get(key[1], ()) else str(value)
+                self._display_cache[key] = text
+            return text
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+    
+    def flags(self, index):
+        return self.ITEM_FLAGS
 
 
 class PlotCanvas(FigureCanvas):
     """Canvas for matplotlib plots"""
     
     def __init__(self, parent=None, width=8, height=6, dpi=100):
-        self.fig = Figure(figsize=(width, height), dpi=dpi, facecolor='white', edgecolor='black')
+        # Constrained layout is solved by the draw itself, so no per-plot tight_layout pass is needed
+        self.fig = Figure(figsize=(width, height), dpi=dpi, facecolor='white', edgecolor='black', layout='constrained')
         super().__init__(self.fig)
         self.setParent(parent)
         self.setStyleSheet("background-color: white;")
+        # The Agg buffer covers the whole widget (FigureCanvasQT already sets WA_OpaquePaintEvent),
+        # so Qt need not clear the background first
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        self._plot_builders = {
+            'speed': self._build_speed_plot,
+            'power': self._build_power_plot,
+            'forces': self._build_forces_plot,
+            'motor': self._build_motor_plot,
+            'energy': self._build_energy_plot,
+        }
     
     def plot_results(self, history, plot_type='speed'):
         """Plot simulation results"""
         self.fig.clear()
         
-        if plot_type == 'speed':
-            ax = self.fig.add_subplot(111)
-            ax.plot(history['time'], history['speed_kmh'], color='orange', linewidth=2.5, label='Vehicle Speed (Kmph)')
-            ax.set_xlabel('Time (Sec)', fontsize=10, fontweight='bold')
-            ax.set_ylabel('Vehicle Speed (Kmph)', fontsize=10)
-            ax.set_title('Vehicle Speed (Kmph)', fontsize=12, fontweight='bold')
-            ax.legend(loc='lower right', fontsize=9)
-            ax.grid(True, alpha=0.3, linestyle='--')
-        
-        elif plot_type == 'power':
-            ax = self.fig.add_subplot(111)
-            ax.plot(history['time'], history['motor_power'], color='orange', linewidth=2.5, label='PerMotor Power (Watts)')
-            ax.set_xlabel('Time (Sec)', fontsize=10, fontweight='bold')
-            ax.set_ylabel('PerMotor Power (Watts)', fontsize=10)
-            ax.set_title('Power', fontsize=12, fontweight='bold')
-            ax.legend(loc='upper right', fontsize=9)
-            ax.grid(True, alpha=0.3, linestyle='--')
-        
-        elif plot_type == 'forces':
-            ax = self.fig.add_subplot(111)
-            ax.plot(history['time'], history['tractive_force'], color='orange', 
-                   linewidth=2.5, label='Motoring Tractive Force F_Tractive (N)')
-            ax.plot(history['time'], history['rolling_resistance'], color='blue', 
-                   linewidth=2.5, label='Froll (N)')
-            ax.plot(history['time'], history['drag_force'], color='yellow', 
-                   linewidth=2.5, label='Fdrag (N)')
-            ax.plot(history['time'], history['total_resistance'], color='gray', 
-                   linewidth=2.5, label='F_Load Resistance (N)')
-            ax.set_xlabel('Time (Sec)', fontsize=10, fontweight='bold')
-            ax.set_ylabel('Force (N)', fontsize=10)
-            ax.set_title('Forces', fontsize=12, fontweight='bold')
-            ax.legend(fontsize=8, loc='upper right')
-            ax.grid(True, alpha=0.3, linestyle='--')
-        
-        elif plot_type == 'motor':
-            ax1 = self.fig.add_subplot(211)
-            ax1.plot(history['time'], history['motor_rpm'], color='blue', linewidth=2.5, label='Motor Speed (RPM)')
-            ax1.set_ylabel('Motor Speed (RPM)', fontsize=10)
-            ax1.set_title('Motor Speed (RPM)', fontsize=12, fontweight='bold')
-            ax1.legend(loc='lower right', fontsize=8)
-            ax1.grid(True, alpha=0.3, linestyle='--')
-            
-            ax2 = self.fig.add_subplot(212)
-            ax2.plot(history['time'], history['motor_torque'], color='blue', linewidth=2.5, label='Total Motor Torque (Nm)')
-            ax2.set_xlabel('Time (Sec)', fontsize=10, fontweight='bold')
-            ax2.set_ylabel('Total Motor Torque (Nm)', fontsize=10)
-            ax2.set_title('Total Motor Torque (Nm)', fontsize=12, fontweight='bold')
-            ax2.legend(loc='upper right', fontsize=8)
-            ax2.grid(True, alpha=0.3, linestyle='--')
-        
-        elif plot_type == 'energy':
-            ax = self.fig.add_subplot(111)
-            ax.plot(history['time'], history['energy'], 'purple', linewidth=2)
-            ax.set_xlabel('Time (s)', fontsize=10)
-            ax.set_ylabel('Energy Consumed (kWh)', fontsize=10)
-            ax.set_title('Energy Consumption', fontsize=12, fontweight='bold')
-            ax.grid(True, alpha=0.3)
-        
-        self.fig.tight_layout()
-        self.draw()
+        build_plot = self._plot_builders.get(plot_type)
+        if build_plot is not None:
+            build_plot(history)
+        
+        self.draw_idle()
+    
+    def _build_speed_plot(self, history):
+        """Vehicle speed over time"""
+        ax = self.fig.add_subplot(111)
+        ax.plot(history['time'], history['speed_kmh'], color='orange', linewidth=2.5, label='Vehicle Speed (Kmph)')
+        ax.set_xlabel('Time (Sec)', fontsize=10, fontweight='bold')
+        ax.set_ylabel('Vehicle Speed (Kmph)', fontsize=10)
+        ax.set_title('Vehicle Speed (Kmph)', fontsize=12, fontweight='bold')
+        ax.legend(loc='lower right', fontsize=9)
+        ax.grid(True, alpha=0.3, linestyle='--')
+    
+    def _build_power_plot(self, history):
+        """Per-motor power over time"""
+        ax = self.fig.add_subplot(111)
+        ax.plot(history['time'], history['motor_power'], color='orange', linewidth=2.5, label='PerMotor Power (Watts)')
+        ax.set_xlabel('Time (Sec)', fontsize=10, fontweight='bold')
+        ax.set_ylabel('PerMotor Power (Watts)', fontsize=10)
+        ax.set_title('Power', fontsize=12, fontweight='bold')
+        ax.legend(loc='upper right', fontsize=9)
+        ax.grid(True, alpha=0.3, linestyle='--')
+    
+    def _build_forces_plot(self, history):
+        """Tractive force against the resistance forces"""
+        ax = self.fig.add_subplot(111)
+        ax.plot(history['time'], history['tractive_force'], color='orange', 
+               linewidth=2.5, label='Motoring Tractive Force F_Tractive (N)')
+        ax.plot(history['time'], history['rolling_resistance'], color='blue', 
+               linewidth=2.5, label='Froll (N)')
+        ax.plot(history['time'], history['drag_force'], color='yellow', 
+               linewidth=2.5, label='Fdrag (N)')
+        ax.plot(history['time'], history['total_resistance'], color='gray', 
+               linewidth=2.5, label='F_Load Resistance (N)')
+        ax.set_xlabel('Time (Sec)', fontsize=10, fontweight='bold')
+        ax.set_ylabel('Force (N)', fontsize=10)
+        ax.set_title('Forces', fontsize=12, fontweight='bold')
+        ax.legend(fontsize=8, loc='upper right')
+        ax.grid(True, alpha=0.3, linestyle='--')
+    
+    def _build_motor_plot(self, history):
+        """Motor speed and total motor torque, stacked"""
+        ax1 = self.fig.add_subplot(211)
+        ax1.plot(history['time'], history['motor_rpm'], color='blue', linewidth=2.5, label='Motor Speed (RPM)')
+        ax1.set_ylabel('Motor Speed (RPM)', fontsize=10)
+        ax1.set_title('Motor Speed (RPM)', fontsize=12, fontweight='bold')
+        ax1.legend(loc='lower right', fontsize=8)
+        ax1.grid(True, alpha=0.3, linestyle='--')
+        
+        ax2 = self.fig.add_subplot(212)
+        ax2.plot(history['time'], history['motor_torque'], color='blue', linewidth=2.5, label='Total Motor Torque (Nm)')
+        ax2.set_xlabel('Time (Sec)', fontsize=10, fontweight='bold')
+        ax2.set_ylabel('Total Motor Torque (Nm)', fontsize=10)
+        ax2.set_title('Total Motor Torque (Nm)', fontsize=12, fontweight='bold')
+        ax2.legend(loc='upper right', fontsize=8)
+        ax2.grid(True, alpha=0.3, linestyle='--')
+    
+    def _build_energy_plot(self, history):
+        """Cumulative energy consumption"""
+        ax = self.fig.add_subplot(111)
+        ax.plot(history['time'], history['energy'], 'purple', linewidth=2)
+        ax.set_xlabel('Time (s)', fontsize=10)
+        ax.set_ylabel('Energy Consumed (kWh)', fontsize=10)
+        ax.set_title('Energy Consumption', fontsize=12, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+    
+    def plot_heatmap(self, x_values, y_values, grid, xlabel, ylabel, title):
+        """Plot a regular 2-D grid of values as a heatmap"""
+        self.fig.clear()
+        ax = self.fig.add_subplot(111)
+        # pcolorfast on a uniform grid is far cheaper than pcolormesh/imshow for redraws
+        image = ax.pcolorfast((x_values[0], x_values[-1]), (y_values[0], y_values[-1]), grid, cmap='viridis')
+        self.fig.colorbar(image, ax=ax, label=title)
+        ax.set_xlabel(xlabel, fontsize=10, fontweight='bold')
+        ax.set_ylabel(ylabel, fontsize=10)
+        ax.set_title(title, fontsize=12, fontweight='bold')
+        
+        self.draw_idle()
+
+
+# ========== OUTPUT HTML ==========
+# Output panel stylesheet, installed once as the output document's default stylesheet
+OUTPUT_CSS = """
+    table.data { width:100%; border-collapse:collapse; margin:5px 0; border:1px solid #999; }
+    table.data th, table.data td { padding:8px; text-align:left; border:1px solid #999; font-family:Segoe UI; font-size:15px; }
+    table.data th { background-color:#f2f2f2; font-weight:bold; }
+    table.data td.value { text-align:right; }
+    table.layout { width:100%; border:none; border-collapse:collapse; }
+    table.layout td { vertical-align:top; padding:10px; border:none; }
+    table.layout td:first-child { border-right: 2px solid #ddd; padding-right:15px; }
+    table.layout td:last-child { padding-left:15px; }
+    h3 { margin:4px 0; font-family:Segoe UI; font-size:16px; font-weight:bold; }
+    h4 { margin:8px 0 4px 0; font-family:Segoe UI; font-size:15px; color:#2c3e50; font-weight:bold; }
+    .category { background-color: #dc3545; color: white; padding: 8px; margin: 15px 0 5px 0; font-weight: bold; font-size: 15px; border-radius: 4px; }
+"""
+
+# EV output panel body; placeholders are filled from compute_output_values' locals
+EV_OUTPUT_TEMPLATE = """
+    <h3>EV Computed Output Values</h3>
+
+    <div class='category'>Motor Performance</div>
+    <table class='layout'>
+        <tr>
+            <td width='50%'>
+                <h4>Motor Input Power</h4>
+                <table class='data'>
+                    <tr><th>Scenario</th><th class='value'>Power (W)</th></tr>
+                    <tr><td>Zero Gradient Max Speed Power</td><td class='value'>{motor_input_max:.0f}</td></tr>
+                    <tr><td>Max Slope- Max Slope Speed Power</td><td class='value'>{motor_input_slope:.0f}</td></tr>
+                    <tr><td>Acceleration Power</td><td class='value'>{motor_input_accel:.0f}</td></tr>
+                </table>
+            </td>
+            <td width='50%'>
+                <h4>Total Required Motor Output Power</h4>
+                <table class='data'>
+                    <tr><th>Scenario</th><th class='value'>Power (W)</th></tr>
+                    <tr><td>Zero Gradient Max Speed Power</td><td class='value'>{motor_output_max:.0f}</td></tr>
+                    <tr><td>Max Slope- Max Slope Speed Power</td><td class='value'>{motor_output_slope:.0f}</td></tr>
+                    <tr><td>Acceleration Power</td><td class='value'>{motor_output_accel:.0f}</td></tr>
+                </table>
+            </td>
+        </tr>
+    </table>
+
+    <h4>Total Torque and RPM at Motor Output</h4>
+    <table class='data'>
+        <tr><th>Scenario</th><th class='value'>RPM</th><th class='value'>Torque (Nm)</th></tr>
+        <tr><td>Zero Gradient Max Speed</td><td class='value'>{rpm_motor_max:.0f}</td><td class='value'>{torque_motor_max:.2f}</td></tr>
+        <tr><td>Acceleration</td><td class='value'>{rpm_motor_accel:.0f}</td><td class='value'>{torque_motor_accel:.0f}</td></tr>
+        <tr><td>Max Slope- Max Slope Speed</td><td class='value'>{rpm_motor_slope:.0f}</td><td class='value'>{torque_motor_slope:.0f}</td></tr>
+    </table>
+
+    <div class='category'>Wheel Performance</div>
+    <table class='layout'>
+        <tr>
+            <td width='50%'>
+                <h4>Total Required Power Output at Wheels</h4>
+                <table class='data'>
+                    <tr><th>Scenario</th><th class='value'>Power (W)</th></tr>
+                    <tr><td>Zero Gradient Max Speed Power</td><td class='value'>{wheel_power_max:.0f}</td></tr>
+                    <tr><td>Acceleration Power</td><td class='value'>{wheel_power_accel:.0f}</td></tr>
+                    <tr><td>Max Slope- Max Slope Speed Power</td><td class='value'>{wheel_power_slope:.0f}</td></tr>
+                </table>
+            </td>
+            <td width='50%'>
+                <h4>Total Torque and RPM at Wheels</h4>
+                <table class='data'>
+                    <tr><th>Scenario</th><th class='value'>RPM</th><th class='value'>Torque (Nm)</th></tr>
+                    <tr><td>Zero Gradient Max Speed Torque</td><td class='value'>{rpm_wheel_max:.0f}</td><td class='value'>{torque_wheel_max:.0f}</td></tr>
+                    <tr><td>Acceleration Torque</td><td class='value'>{rpm_wheel_accel:.0f}</td><td class='value'>{torque_wheel_accel:.0f}</td></tr>
+                    <tr><td>Max Slope- Max Slope Speed Torque</td><td class='value'>{rpm_wheel_slope:.0f}</td><td class='value'>{torque_wheel_slope:.0f}</td></tr>
+                </table>
+            </td>
+        </tr>
+    </table>
+
+    <div class='category'>Weight Analysis</div>
+    <table class='layout'>
+        <tr>
+            <td width='50%'>
+                <h4>Weight Components</h4>
+                <table class='data'>
+                    <tr><th>Component</th><th class='value'>Weight (kg)</th></tr>
+                    <tr><td>Kerb Weight</td><td class='value'>{ev_weight_breakdown.kerb_weight:.1f}</td></tr>
+                    <tr><td>Passenger/Load Weight</td><td class='value'>{ev_weight_breakdown.passenger_weight:.1f}</td></tr>
+                    <tr><td>Motor & Controller Weight</td><td class='value'>{ev_weight_breakdown.motor_controller_weight:.1f}</td></tr>
+                    <tr><td>Battery Weight</td><td class='value'>{ev_weight_breakdown.battery_weight_total:.1f}</td></tr>
+                    <tr><td>Other Weights</td><td class='value'>{ev_weight_breakdown.other_weights:.1f}</td></tr>
+                    <tr><td>Generator Weight</td><td class='value'>{ev_weight_breakdown.generator_weight:.1f}</td></tr>
+                    <tr style='background-color:#e8f4f8; font-weight:bold;'>
+                        <td>Calculated Total Vehicle Weight</td>
+                        <td class='value'>{ev_weight_breakdown.calculated_total:.1f}</td>
+                    </tr>
+                    <tr style='background-color:#ffeaa7; font-weight:bold;'>
+                        <td>Input Vehicle Weight (used in calc)</td>
+                        <td class='value'>{ev_weight_breakdown.input_vehicle_weight:.1f}</td>
+                    </tr>
+                    <tr style='background-color:#d3f8e2; font-weight:bold;'>
+                        <td>Calculated GVW</td>
+                        <td class='value'>{ev_weight_breakdown.calculated_gvw:.1f}</td>
+                    </tr>
+                </table>
+            </td>
+            <td width='50%'>
+                <h4>Battery Analysis</h4>
+                <table class='data'>
+                    <tr><th>Parameter</th><th class='value'>Value</th></tr>
+                    <tr><td>Battery Requirements</td><td class='value'>{ev_battery_analysis.requirements}</td></tr>
+                    <tr><td>Battery Chemistry</td><td class='value'>{ev_battery_analysis.chemistry}</td></tr>
+                    <tr><td>Battery voltage</td><td class='value'>{ev_battery_analysis.battery_voltage:.0f}</td></tr>
+                    <tr><td>Weight per unit Wh</td><td class='value'>{ev_battery_analysis.weight_per_wh}</td></tr>
+                    <tr><td>Peukert's Coefficient</td><td class='value'>{ev_battery_analysis.peukert_coeff}</td></tr>
+                    <tr><td>Battery Discharge hour rating (Hr)</td><td class='value'>{ev_battery_analysis.discharge_hr:.0f}</td></tr>
+                    <tr><td>DepthOfDischarge%</td><td class='value'>{ev_battery_analysis.dod_pct:.0f}</td></tr>
+                    <tr><td>Constant Speed Battery Current (A)</td><td class='value'>{ev_battery_analysis.battery_current:.0f}</td></tr>
+                    <tr><td>True usable Battery Capacity Wh</td><td class='value'>{ev_battery_analysis.nominal_capacity_wh:.0f}</td></tr>
+                    <tr><td>True usable Battery Ah</td><td class='value'>{ev_battery_analysis.nominal_capacity_ah:.0f}</td></tr>
+                    <tr><td>Tentative  battery Ah for given Discharge Hr</td><td class='value'>{ev_battery_analysis.peukert_adjusted_ah:.0f}</td></tr>
+                    <tr><td>Tentative battery Capacity Wh</td><td class='value'>{ev_battery_analysis.peukert_adjusted_wh:.0f}</td></tr>
+                    <tr><td>Battery Weight</td><td class='value'>{ev_battery_analysis.calculated_battery_weight:.0f}</td></tr>
+                </table>
+            </td>
+        </tr>
+    </table>
+
+    <div class='category'>Force Calculations & Acceleration Analysis</div>
+    <table class='layout'>
+        <tr>
+            <td width='50%'>
+                <h4>Force Calculations</h4>
+                <table class='data'>
+                    <tr><th>Force Type</th><th class='value'>Value (N)</th></tr>
+                    <tr><td>F<sub>drag-const</sub></td><td class='value'>{F_drag_max:.2f}</td></tr>
+                    <tr><td>F<sub>drag-slope</sub></td><td class='value'>{F_drag_slope:.2f}</td></tr>
+                    <tr><td>F<sub>roll</sub></td><td class='value'>{F_roll:.2f}</td></tr>
+                    <tr><td>F<sub>climb</sub></td><td class='value'>{F_climb:.2f}</td></tr>
+                </table>
+            </td>
+            <td width='50%'>
+                <h4>Vehicle Acceleration Power</h4>
+                <table class='data'>
+                    <tr><th>Parameter</th><th class='value'>Value</th></tr>
+                    <tr><td>Vehicle Speed for Motor Base Speed RPM (m/s)</td><td class='value'>{vehicle_speed_motor_base:.3f}</td></tr>
+                    <tr><td>Vehicle End of Acc Speed (m/s)</td><td class='value'>{Vehicle_End_Acc_Speed:.3f}</td></tr>
+                    <tr><td>Term1</td><td class='value'>{term1:.0f}</td></tr>
+                    <tr><td>Term2</td><td class='value'>{term2:.0f}</td></tr>
+                    <tr><td>Term3</td><td class='value'>{term3:.0f}</td></tr>
+                    <tr><td><b>Required Power for Acceleration</b></td><td class='value'><b>{req_power_accel:.0f}</b></td></tr>
+                </table>
+            </td>
+        </tr>
+    </table>
+
+    <div class='category'>Battery Capacity Analysis</div>
+    <h4>Battery Capacity with Respect to Drive Pattern</h4>
+    <table class='data'>
+        <tr>
+            <th>Speed Slab</th>
+            <th class='value'>Speed (km/h)</th>
+            <th class='value'>Drive %</th>
+            <th class='value'>Gradient (°)</th>
+            <th class='value'>Distance (km)</th>
+            <th class='value'>F<sub>climb</sub> (N)</th>
+            <th class='value'>F<sub>drag</sub> (N)</th>
+            <th class='value'>F<sub>roll</sub> (N)</th>
+            <th class='value'>Motor Input (W)</th>
+            <th class='value'>Motor Output (W)</th>
+            <th class='value'>Battery Current (A)</th>
+            <th class='value'>Useable Energy (Wh)</th>
+            <th class='value'>True Usable Ah</th>
+            <th class='value'>Final Ah</th>
+        </tr>
+        {slab_rows}
+        <tr style='background-color:#e8f4f8; font-weight:bold;'>
+            <td colspan='12'>Final Battery Capacity</td>
+            <td class='value' colspan='2'>{final_battery_capacity_ah:.0f} Ah</td>
+        </tr>
+        <tr style='background-color:#e8f4f8; font-weight:bold;'>
+            <td colspan='12'>Vehicle Range</td>
+            <td class='value' colspan='2'>{vehicle_range_total:.0f} km</td>
+        </tr>
+    </table>
+"""
+
+# One drive pattern slab row of the battery capacity table, filled from a slab_data record
+EV_SLAB_ROW_TEMPLATE = """<tr>
+    <td>%s</td>
+    <td class='value'>%.0f</td>
+    <td class='value'>%d%%</td>
+    <td class='value'>%.1f</td>
+    <td class='value'>%.2f</td>
+    <td class='value'>%.0f</td>
+    <td class='value'>%.0f</td>
+    <td class='value'>%.0f</td>
+    <td class='value'>%.0f</td>
+    <td class='value'>%.0f</td>
+    <td class='value'>%.0f</td>
+    <td class='value'>%.0f</td>
+    <td class='value'>%.0f</td>
+    <td class='value'>%.0f</td>
+</tr>"""
+
+
+# UGV output panel body; placeholders are filled from compute_output_values' locals
+UGV_OUTPUT_TEMPLATE = """
+    <h3>UGV Computed Output Values</h3>
+
+    <div class='category'>Force Calculations & Acceleration Analysis</div>
+    <table class='layout'>
+        <tr>
+            <td width='50%'>
+                <h4>Force Calculations</h4>
+                <table class='data'>
+                    <tr><th>Force Type</th><th class='value'>Value (N)</th></tr>
+                    <tr><td>F<sub>drag-const</sub></td><td class='value'>{F_drag_max:.2f}</td></tr>
+                    <tr><td>F<sub>drag-slope</sub></td><td class='value'>{F_drag_slope:.2f}</td></tr>
+                    <tr><td>F<sub>roll</sub></td><td class='value'>{F_roll:.2f}</td></tr>
+                    <tr><td>F<sub>climb</sub></td><td class='value'>{F_climb:.2f}</td></tr>
+                </table>
+            </td>
+            <td width='50%'>
+                <h4>Vehicle Acceleration Power</h4>
+                <table class='data'>
+                    <tr><th>Parameter</th><th class='value'>Value</th></tr>
+                    <tr><td>Vehicle Speed for Motor Base Speed RPM (m/s)</td><td class='value'>{vehicle_speed_motor_base:.3f}</td></tr>
+                    <tr><td>Vehicle End of Acc Speed (m/s)</td><td class='value'>{Vehicle_End_Acc_Speed:.3f}</td></tr>
+                    <tr><td>Term1</td><td class='value'>{term1:.0f}</td></tr>
+                    <tr><td>Term2</td><td class='value'>{term2:.0f}</td></tr>
+                    <tr><td>Term3</td><td class='value'>{term3:.0f}</td></tr>
+                    <tr><td><b>Required Power for Acceleration</b></td><td class='value'><b>{req_power_accel:.0f}</b></td></tr>
+                </table>
+            </td>
+        </tr>
+    </table>
+
+    <div class='category'>Motor Performance</div>
+    <table class='layout'>
+        <tr>
+            <td width='50%'>
+                <h4>Per Motor Output Power</h4>
+                <table class='data'>
+                    <tr><th>Scenario</th><th class='value'>Power (W)</th></tr>
+                    <tr><td>Zero Gradient Max Speed Power</td><td class='value'>{per_motor_output_max:.0f}</td></tr>
+                    <tr><td>Max Slope- Max Slope Speed Power</td><td class='value'>{per_motor_output_slope:.0f}</td></tr>
+                    <tr><td>Acceleration Power</td><td class='value'>{per_motor_output_accel:.0f}</td></tr>
+                </table>
+            </td>
+            <td width='50%'>
+                <h4>Per Motor Torque and RPM</h4>
+                <table class='data'>
+                    <tr><th>Scenario</th><th class='value'>RPM</th><th class='value'>Torque (Nm)</th></tr>
+                    <tr><td>Zero Gradient Max Speed</td><td class='value'>{rpm_motor_max:.0f}</td><td class='value'>{per_motor_torque_max:.2f}</td></tr>
+                    <tr><td>Acceleration</td><td class='value'>{rpm_motor_accel:.0f}</td><td class='value'>{per_motor_torque_accel:.2f}</td></tr>
+                    <tr><td>Max Slope- Max Slope Speed</td><td class='value'>{rpm_motor_slope:.0f}</td><td class='value'>{per_motor_torque_slope:.2f}</td></tr>
+                </table>
+            </td>
+        </tr>
+    </table>
+
+    <div class='category'>Wheel Performance</div>
+    <table class='layout'>
+        <tr>
+            <td width='50%'>
+                <h4>Power Output Per Wheels</h4>
+                <table class='data'>
+                    <tr><th>Scenario</th><th class='value'>Power (W)</th></tr>
+                    <tr><td>Zero Gradient Max Speed Power</td><td class='value'>{per_wheel_power_max:.0f}</td></tr>
+                    <tr><td>Acceleration Power</td><td class='value'>{per_wheel_power_accel:.0f}</td></tr>
+                    <tr><td>Max Slope- Max Slope Speed Power</td><td class='value'>{per_wheel_power_slope:.0f}</td></tr>
+                </table>
+            </td>
+            <td width='50%'>
+                <h4>Torque and RPM Per Wheel</h4>
+                <table class='data'>
+                    <tr><th>Scenario</th><th class='value'>RPM</th><th class='value'>Torque (Nm)</th></tr>
+                    <tr><td>Zero Gradient Max Speed Torque</td><td class='value'>{rpm_wheel_max:.0f}</td><td class='value'>{per_wheel_torque_max:.0f}</td></tr>
+                    <tr><td>Acceleration Torque</td><td class='value'>{rpm_wheel_accel:.0f}</td><td class='value'>{per_wheel_torque_accel:.0f}</td></tr>
+                    <tr><td>Max Slope- Max Slope Speed Torque</td><td class='value'>{rpm_wheel_slope:.0f}</td><td class='value'>{per_wheel_torque_slope:.0f}</td></tr>
+                </table>
+            </td>
+        </tr>
+    </table>
+
+    <div class='category'>Skid Parameters & Power Estimation</div>
+    <h4>Skid Parameters and Power Estimation</h4>
+    <table class='data'>
+        <tr><th>Parameter</th><th class='value'>Value</th><th class='value'>Unit</th></tr>
+        <tr><td>Total Skid Friction Force (F<sub>skid</sub>)</td><td class='value'>{total_skid_friction:.0f}</td><td class='value'>N</td></tr>
+        <tr><td>Per Wheel Skid Friction Force (F<sub>side</sub>)</td><td class='value'>{per_wheel_skid_friction:.0f}</td><td class='value'>N</td></tr>
+        <tr><td>Wheel Linear Speed During Turning (v<sub>wheel</sub>)</td><td class='value'>{wheel_linear_speed_turn:.2f}</td><td class='value'>m/s</td></tr>
+        <tr><td>Power for Each Motor (P<sub>turn</sub>)</td><td class='value'>{power_per_motor_turn:.0f}</td><td class='value'>Watts</td></tr>
+        <tr><td>Total Power for All Motors (P<sub>total</sub>)</td><td class='value'>{total_power_turn:.0f}</td><td class='value'>Watts</td></tr>
+        <tr><td>Wheel RPM</td><td class='value'>{wheel_rpm_turn:.0f}</td><td class='value'>rpm</td></tr>
+        <tr><td>Vehicle Rotational Degree per Second</td><td class='value'>{vehicle_rot_deg_per_sec:.0f}</td><td class='value'>degree/sec</td></tr>
+        <tr><td>Total Wheel Torque</td><td class='value'>{total_wheel_torque:.0f}</td><td class='value'>Nm</td></tr>
+        <tr><td>Total Motor Wheel Torque</td><td class='value'>{total_motor_wheel_torque:.2f}</td><td class='value'>Nm</td></tr>
+        <tr><td>Per Motor Wheel Torque</td><td class='value'>{per_motor_wheel_torque:.2f}</td><td class='value'>Nm</td></tr>
+    </table>
+"""
+
+
+@lru_cache(maxsize=1)
+def ev_output_layout():
+    """
+    Parse the EV output templates once into a static skeleton document.
+    
+    Returns (skeleton_html, markers, cells): the skeleton has a unique marker text where
+    every value goes, and cells lists (template field name, format spec) per marker, with
+    a None field for the slab table cells, which take %-format specs from the slab tuples.
+    """
+    import re
+    import string
+    
+    row_field = re.compile(r'%(?:\.\d+)?[sdf]')
+    row_literals = [literal.replace('%%', '%') for literal in row_field.split(EV_SLAB_ROW_TEMPLATE)]
+    row_specs = row_field.findall(EV_SLAB_ROW_TEMPLATE)
+    
+    parts = []
+    markers = []
+    cells = []
+    
+    def add_cell(field, spec):
+        markers.append(f'[[{len(markers)}]]')
+        cells.append((field, spec))
+        parts.append(markers[-1])
+    
+    for literal, field, spec, _ in string.Formatter().parse(EV_OUTPUT_TEMPLATE):
+        parts.append(literal)
+        if field == 'slab_rows':
+            for _ in SLAB_NAMES:
+                parts.append(row_literals[0])
+                for row_spec, row_literal in zip(row_specs, row_literals[1:]):
+                    add_cell(None, row_spec)
+                    parts.append(row_literal)
+        elif field is not None:
+            add_cell(field, spec)
+    return ''.join(parts), tuple(markers), tuple(cells)
+
+
+def ev_output_cell_texts(namespace, slab_data):
+    """Format every EV output value, in ev_output_layout() cell order"""
+    import string
+    
+    formatter = string.Formatter()
+    slab_values = (value for slab in slab_data for value in slab)
+    return tuple(spec % next(slab_values) if field is None
+                 else format(formatter.get_field(field, (), namespace)[0], spec)
+                 for field, spec in ev_output_layout()[2])
 
 
 class EVSimulationApp(QMainWindow):
@@ -529,7 +1523,23 @@ class EVSimulationApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.current_view = 'split'  # split, graphs_only, controls_only
-        self.init_ui()
+        self._dirty_canvases = set()  # Graph canvases holding a plot that reset must clear
+        self._sin_grade = {}  # 'ev'/'ugv' -> sin(gradeability), refreshed when the input changes
+        self._derived_inputs = {}  # 'ev'/'ugv'/'graph' -> inputs the calculated fields were last derived from
+        self._ev_output_cache = {}  # EVSnapshot -> formatted EV output cell texts, oldest first
+        self._shown_ev_snapshot = None  # EVSnapshot whose output is on screen, None for anything else
+        self._ev_output_cells = None  # Text cursors over the value cells of the EV skeleton, once loaded
+        self._pending_output = None  # Output render deferred while the Results tab is hidden
+        self._pending_graph_plots = {}  # Graph canvas attribute -> plot call deferred until its tab is shown
+        self._efficiency_map_grid = None  # (RPM, TORQUE, EFFICIENCY) of the base efficiency map, once computed
+        self._status = self.statusBar()  # Resolved once; QMainWindow creates it lazily
+        
+        # Suspend painting while the widget tree is assembled so it is drawn once, fully built
+        self.setUpdatesEnabled(False)
+        try:
+            self.init_ui()
+        finally:
+            self.setUpdatesEnabled(True)
     
     def init_ui(self):
         """Initialize user interface"""
@@ -542,9 +1552,7 @@ class EVSimulationApp(QMainWindow):
         self.setMinimumSize(800, 600)
 
         # Set application icon
-        icon_path = 'ePropelled Logo.jpg'
-        app_icon = QIcon(icon_path)
-        self.setWindowIcon(app_icon)
+        self.setWindowIcon(load_app_icon())
         
         # Create menu bar
         self.create_menu_bar()
@@ -566,9 +1574,8 @@ class EVSimulationApp(QMainWindow):
         
         # ePropelled_Text.jpg Logo (200px width, fixed size, centered)
         logo_label = QLabel()
-        logo_pixmap = QPixmap('ePropelled_Text.jpg')
-        if not logo_pixmap.isNull():
-            scaled_logo = logo_pixmap.scaledToWidth(200, Qt.TransformationMode.SmoothTransformation)
+        scaled_logo = load_header_logo()
+        if not scaled_logo.isNull():
             logo_label.setPixmap(scaled_logo)
             logo_label.setFixedSize(200, scaled_logo.height())
             logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -592,6 +1599,28 @@ class EVSimulationApp(QMainWindow):
         self.left_panel = self.create_control_panel()
         self.splitter.addWidget(self.left_panel)
         
+        # Control spin boxes only emit valueChanged once an edit is committed, not per keystroke;
+        # calculated (read-only) ones can't be stepped, so they skip the arrow buttons entirely
+        for spin_box in self.left_panel.findChildren(QAbstractSpinBox):
+            spin_box.setKeyboardTracking(False)
+            if spin_box.isReadOnly():
+                spin_box.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.NoButtons)
+        
+        # Resolve the EV default-reset plan once, now that the parameter widgets exist
+        self._ev_reset_plan = [(getattr(self, f'ev_{attr}'), key, setter)
+                               for attr, key, setter in VEHICLE_RESET_FIELDS]
+        # Cache sin(gradeability) so compute does not redo the trig (UGV wires its own when built)
+        self.ev_gradeability_input.valueChanged.connect(lambda value: self._cache_sin_grade('ev', value))
+        self._cache_sin_grade('ev', self.ev_gradeability_input.value())
+        
+        # Mirror the EV parameter widgets into plain values on edit, so compute never reads Qt
+        self._ev_params = {}
+        for field in fields(EVSnapshot):
+            widget = getattr(self, f'ev_{field.name}_input')
+            changed = widget.currentTextChanged if field.type is str else widget.valueChanged
+            changed.connect(partial(self._ev_params.__setitem__, field.name))
+        self._sync_ev_params()
+        
         # Right side uses a stacked widget to switch between Output and Graph views
         self.right_stack = QStackedWidget()
         
@@ -603,9 +1632,11 @@ class EVSimulationApp(QMainWindow):
         self.right_panel = self.create_visualization_panel()
         self.right_stack.addWidget(self.right_panel)
         
-        # Page 2: Testing Point panel
-        self.testing_point_panel = self.create_testing_point_panel()
-        self.right_stack.addWidget(self.testing_point_panel)
+        # Page 2: Testing Point panel, an empty page until the tab is first opened
+        self.testing_point_panel = None
+        self._testing_point_page = QWidget()
+        QVBoxLayout(self._testing_point_page).setContentsMargins(0, 0, 0, 0)
+        self.right_stack.addWidget(self._testing_point_page)
         
         self.splitter.addWidget(self.right_stack)
         
@@ -622,90 +1653,111 @@ class EVSimulationApp(QMainWindow):
         
         # Initialize calculated weight fields
         self.update_ev_calculated_weights()
-        self.update_ugv_calculated_weights()
         
         # Initialize graph simulation calculated fields
         self.update_graph_sim_calculated_values()
+        
+        # Only the Matplotlib canvases need hover events; keep every other widget untracked
+        for widget in self.findChildren(QWidget):
+            if not isinstance(widget, FigureCanvas):
+                widget.setMouseTracking(False)
 
-        self.statusBar().showMessage('Ready')
+        self._status.showMessage('Ready')
     
     def on_nav_changed(self, index: int):
         """Handle navbar tab changes to switch right view and buttons"""
-        if index == 0:  # Output Value Simulation (default first tab)
-            # Show output panel with comprehensive EV/UGV parameters
-            self.right_stack.setCurrentIndex(0)  # Output panel
-            self.left_panel.setVisible(True)
-            # Hide graph simulation controls
-            self.graph_sim_params_group.setVisible(False)
-            self.runtime_params_group.setVisible(False)  # Hide runtime params in Output mode
-            self.scenario_group.setVisible(False)
-            self.btn_layout_widget.setVisible(False)
-            # Show Vehicle Parameters for Output mode
-            self.vehicle_group.setVisible(True)
-            # Show comprehensive EV/UGV params and compute button
-            if self.vehicle_type_combo.currentText() == 'EV':
+        # Freeze the control scroll area so the group visibility toggles reflow once
+        self.control_scroll_area.setUpdatesEnabled(False)
+        try:
+            if index == 0:  # Output Value Simulation (default first tab)
+                # Show output panel with comprehensive EV/UGV parameters
+                self.right_stack.setCurrentIndex(0)  # Output panel
+                self.left_panel.setVisible(True)
+                # Hide graph simulation controls
+                self.graph_sim_params_group.setVisible(False)
+                self.runtime_params_group.setVisible(False)  # Hide runtime params in Output mode
+                self.scenario_group.setVisible(False)
+                self.btn_layout_widget.setVisible(False)
+                # Show Vehicle Parameters for Output mode
+                self.vehicle_group.setVisible(True)
+                # Show comprehensive EV/UGV params and compute button
+                if self.vehicle_type_combo.currentText() == 'EV':
+                    self.ev_params_group.setVisible(True)
+                    if self.ugv_params_group is not None:
+                        self.ugv_params_group.setVisible(False)
+                    self.reset_ev_defaults()  # Load default values
+                else:  # UGV
+                    self.ev_params_group.setVisible(False)
+                    self._ensure_ugv_params_group().setVisible(True)
+                    self.reset_ugv_defaults()  # Load default values
+                self.output_compute_btn.setVisible(True)
+                self.output_compute_btn.setEnabled(True)
+                # Give space for comprehensive params
+                try:
+                    self.splitter.setSizes([400, 800])
+                except Exception:  
+                    pass
+                self._status.showMessage('Output Value Simulation mode - Comprehensive Parameters')
+            elif index == 1:  # Graph Simulation
+                # Show graphs with basic simulation controls on the left
+                self.right_stack.setCurrentIndex(1)  # Graphs panel
+                self.left_panel.setVisible(True)
+                # Show only basic simulation controls for running simulations
+                self.graph_sim_params_group.setVisible(True)
+                self.runtime_params_group.setVisible(True)  # Show runtime params in Graph mode
+                self.scenario_group.setVisible(True)
+                self.btn_layout_widget.setVisible(True)
+                # Hide Vehicle Parameters and comprehensive EV/UGV params
+                self.vehicle_group.setVisible(False)
+                self.ev_params_group.setVisible(False)
+                if self.ugv_params_group is not None:
+                    self.ugv_params_group.setVisible(False)
+                self.output_compute_btn.setVisible(False)
+                # Give space for basic params and graphs
+                try:
+                    self.splitter.setSizes([400, 800])
+                except Exception:
+                    pass
+                self._status.showMessage('Graph Simulation mode')
+            else:  # Testing Point (index == 2)
+                # Show testing point panel - HIDE left panel completely for full width
+                self._ensure_testing_point_panel()
+                self.right_stack.setCurrentIndex(2)  # Testing Point panel
+                self.left_panel.setVisible(False)  # Hide left panel to use full width
+                # Hide all controls (they're not needed in Testing Point mode)
+                self.graph_sim_params_group.setVisible(False)
+                self.runtime_params_group.setVisible(False)
+                self.scenario_group.setVisible(False)
+                self.btn_layout_widget.setVisible(False)
+                self.vehicle_group.setVisible(False)
+                self.ev_params_group.setVisible(False)
+                if self.ugv_params_group is not None:
+                    self.ugv_params_group.setVisible(False)
+                self.output_compute_btn.setVisible(False)
+                self._status.showMessage('Testing Point mode')
+        finally:
+            self.control_scroll_area.setUpdatesEnabled(True)
+            self.control_scroll_area.viewport().update()
+    
+    def on_vehicle_type_changed(self, vehicle_type: str):
+        """Handle vehicle type selection change to show/hide appropriate parameter sections"""
+        # Freeze the control scroll area so the group visibility toggles reflow once
+        self.control_scroll_area.setUpdatesEnabled(False)
+        try:
+            if vehicle_type == 'EV':
                 self.ev_params_group.setVisible(True)
-                self.ugv_params_group.setVisible(False)
+                if self.ugv_params_group is not None:
+                    self.ugv_params_group.setVisible(False)
                 self.reset_ev_defaults()  # Load default values
+                self._status.showMessage('EV parameters displayed')
             else:  # UGV
                 self.ev_params_group.setVisible(False)
-                self.ugv_params_group.setVisible(True)
+                self._ensure_ugv_params_group().setVisible(True)
                 self.reset_ugv_defaults()  # Load default values
-            self.output_compute_btn.setVisible(True)
-            self.output_compute_btn.setEnabled(True)
-            # Give space for comprehensive params
-            try:
-                self.splitter.setSizes([400, 800])
-            except Exception:  
-                pass
-            self.statusBar().showMessage('Output Value Simulation mode - Comprehensive Parameters')
-        elif index == 1:  # Graph Simulation
-            # Show graphs with basic simulation controls on the left
-            self.right_stack.setCurrentIndex(1)  # Graphs panel
-            self.left_panel.setVisible(True)
-            # Show only basic simulation controls for running simulations
-            self.graph_sim_params_group.setVisible(True)
-            self.runtime_params_group.setVisible(True)  # Show runtime params in Graph mode
-            self.scenario_group.setVisible(True)
-            self.btn_layout_widget.setVisible(True)
-            # Hide Vehicle Parameters and comprehensive EV/UGV params
-            self.vehicle_group.setVisible(False)
-            self.ev_params_group.setVisible(False)
-            self.ugv_params_group.setVisible(False)
-            self.output_compute_btn.setVisible(False)
-            # Give space for basic params and graphs
-            try:
-                self.splitter.setSizes([400, 800])
-            except Exception:
-                pass
-            self.statusBar().showMessage('Graph Simulation mode')
-        else:  # Testing Point (index == 2)
-            # Show testing point panel - HIDE left panel completely for full width
-            self.right_stack.setCurrentIndex(2)  # Testing Point panel
-            self.left_panel.setVisible(False)  # Hide left panel to use full width
-            # Hide all controls (they're not needed in Testing Point mode)
-            self.graph_sim_params_group.setVisible(False)
-            self.runtime_params_group.setVisible(False)
-            self.scenario_group.setVisible(False)
-            self.btn_layout_widget.setVisible(False)
-            self.vehicle_group.setVisible(False)
-            self.ev_params_group.setVisible(False)
-            self.ugv_params_group.setVisible(False)
-            self.output_compute_btn.setVisible(False)
-            self.statusBar().showMessage('Testing Point mode')
-    
-    def on_vehicle_type_changed(self, vehicle_type: str):
-        """Handle vehicle type selection change to show/hide appropriate parameter sections"""
-        if vehicle_type == 'EV':
-            self.ev_params_group.setVisible(True)
-            self.ugv_params_group.setVisible(False)
-            self.reset_ev_defaults()  # Load default values
-            self.statusBar().showMessage('EV parameters displayed')
-        else:  # UGV
-            self.ev_params_group.setVisible(False)
-            self.ugv_params_group.setVisible(True)
-            self.reset_ugv_defaults()  # Load default values
-            self.statusBar().showMessage('UGV parameters displayed')
+                self._status.showMessage('UGV parameters displayed')
+        finally:
+            self.control_scroll_area.setUpdatesEnabled(True)
+            self.control_scroll_area.viewport().update()
     
     def on_motor_selection_changed(self, motor_key: str):
         """Handle motor model selection change to show/hide custom fields and update calculations"""
@@ -723,9 +1775,9 @@ class EVSimulationApp(QMainWindow):
         # Update status bar with motor info
         if motor_key in GPM_MOTORS:
             motor = GPM_MOTORS[motor_key]
-            self.statusBar().showMessage(f"Motor: {motor['name']} - Peak: {motor['peak_torque_nm']} Nm, {motor['peak_power_w']/1000:.0f} kW")
+            self._status.showMessage(f"Motor: {motor['name']} - Peak: {motor['peak_torque_nm']} Nm, {motor['peak_power_w']/1000:.0f} kW")
         elif is_custom:
-            self.statusBar().showMessage('Custom motor mode - Enter peak torque and power values')
+            self._status.showMessage('Custom motor mode - Enter peak torque and power values')
 
     
     def create_menu_bar(self):
@@ -747,28 +1799,28 @@ class EVSimulationApp(QMainWindow):
             self.left_panel.setVisible(True)
             self.right_panel.setVisible(True)
             self.splitter.setSizes([400, 800])
-            self.statusBar().showMessage('Split View: Controls & Graphs')
+            self._status.showMessage('Split View: Controls & Graphs')
             
         elif view_mode == 'graphs_only':
             # Hide controls, show only graphs
             self.left_panel.setVisible(False)
             self.right_panel.setVisible(True)
-            self.statusBar().showMessage('Graphs Only View')
+            self._status.showMessage('Graphs Only View')
             
         elif view_mode == 'controls_only':
             # Hide graphs, show only controls
             self.left_panel.setVisible(True)
             self.right_panel.setVisible(False)
-            self.statusBar().showMessage('Controls Only View')
+            self._status.showMessage('Controls Only View')
     
     def toggle_fullscreen(self):
         """Toggle fullscreen mode"""
         if self.isFullScreen():
             self.showNormal()
-            self.statusBar().showMessage('Exited Fullscreen')
+            self._status.showMessage('Exited Fullscreen')
         else:
             self.showFullScreen()
-            self.statusBar().showMessage('Entered Fullscreen Mode')
+            self._status.showMessage('Entered Fullscreen Mode')
     
     def create_output_panel(self):
         """Create right-side panel for Output Value Simulation"""
@@ -780,9 +1832,136 @@ class EVSimulationApp(QMainWindow):
         v.addWidget(header)
         self.output_text = QTextEdit()
         self.output_text.setReadOnly(True)
-        v.addWidget(self.output_text)
+        # The output CSS is parsed once here; the EV/UGV HTML carries no <style> block
+        self.output_text.document().setDefaultStyleSheet(OUTPUT_CSS)
+        
+        # Results and parameter sweep share the panel as tabs
+        self.output_tabs = QTabWidget()
+        self.output_tabs.addTab(self.output_text, 'Results')
+        self.output_tabs.addTab(self.create_sweep_panel(), 'Parameter Sweep')
+        self.output_tabs.currentChanged.connect(self._flush_pending_output)
+        v.addWidget(self.output_tabs)
         return panel
     
+    def create_sweep_panel(self):
+        """Create the parameter sweep tab: two swept parameters, a metric and a heatmap"""
+        sweep_widget = QWidget()
+        sweep_layout = QVBoxLayout(sweep_widget)
+        
+        controls_layout = QGridLayout()
+        controls_layout.addWidget(QLabel('Min'), 0, 2)
+        controls_layout.addWidget(QLabel('Max'), 0, 3)
+        controls_layout.addWidget(QLabel('Steps'), 0, 4)
+        
+        for row, (axis, default_label) in enumerate((('x', 'Max Speed (km/h)'), ('y', 'Gradeability (°)')), start=1):
+            controls_layout.addWidget(QLabel(f'{axis.upper()} Parameter:'), row, 0)
+            combo = QComboBox()
+            combo.addItems(list(SWEEP_PARAMETERS))
+            combo.setCurrentText(default_label)
+            controls_layout.addWidget(combo, row, 1)
+            
+            min_input = QDoubleSpinBox()
+            max_input = QDoubleSpinBox()
+            for bound_input in (min_input, max_input):
+                bound_input.setRange(0.0, 100000.0)
+                bound_input.setDecimals(2)
+                bound_input.setKeyboardTracking(False)
+            controls_layout.addWidget(min_input, row, 2)
+            controls_layout.addWidget(max_input, row, 3)
+            
+            steps_input = QSpinBox()
+            steps_input.setRange(2, 500)
+            steps_input.setValue(50)
+            controls_layout.addWidget(steps_input, row, 4)
+            
+            setattr(self, f'sweep_{axis}_combo', combo)
+            setattr(self, f'sweep_{axis}_min', min_input)
+            setattr(self, f'sweep_{axis}_max', max_input)
+            setattr(self, f'sweep_{axis}_steps', steps_input)
+            combo.currentTextChanged.connect(lambda label, a=axis: self.on_sweep_parameter_changed(a, label))
+            self.on_sweep_parameter_changed(axis, default_label)
+        
+        controls_layout.addWidget(QLabel('Metric:'), 3, 0)
+        self.sweep_metric_combo = QComboBox()
+        self.sweep_metric_combo.addItems(list(SWEEP_METRICS))
+        controls_layout.addWidget(self.sweep_metric_combo, 3, 1, 1, 2)
+        
+        sweep_btn = QPushButton('Run Sweep')
+        sweep_btn.clicked.connect(self.run_parameter_sweep)
+        controls_layout.addWidget(sweep_btn, 3, 3, 1, 2)
+        
+        sweep_layout.addLayout(controls_layout)
+        self.sweep_canvas = PlotCanvas(self, width=8, height=5)
+        sweep_layout.addWidget(self.sweep_canvas)
+        return sweep_widget
+    
+    def on_sweep_parameter_changed(self, axis, label):
+        """Load the default sweep range for the parameter chosen on the given axis"""
+        _, range_min, range_max = SWEEP_PARAMETERS[label]
+        getattr(self, f'sweep_{axis}_min').setValue(range_min)
+        getattr(self, f'sweep_{axis}_max').setValue(range_max)
+    
+    def read_drive_params(self, prefix):
+        """Read the compute_drive_outputs inputs from the 'ev' or 'ugv' parameter panel"""
+        value = lambda name: getattr(self, f'{prefix}_{name}_input').value()
+        return {
+            'wheel_radius': value('wheel_radius'),
+            'cd': value('cd'),
+            'cr': value('cr'),
+            'frontal_area': value('frontal_area'),
+            'air_density': value('air_density'),
+            'gear_ratio': value('gear_ratio'),
+            'gear_efficiency': value('gear_efficiency') / 100.0,
+            'motor_efficiency': value('motor_efficiency') / 100.0,
+            'motor_base_rpm': value('motor_base_rpm'),
+            'gvw': value('gvw'),
+            'max_speed': value('max_speed'),
+            'slope_speed': value('slope_speed'),
+            'gradeability': value('gradeability'),
+            'accel_end_speed': value('accel_end_speed'),
+            'accel_period': value('accel_period'),
+            'rotary_inertia': value('rotary_inertia'),
+        }
+    
+    def run_parameter_sweep(self):
+        """Evaluate the selected metric over the X/Y parameter grid and plot it as a heatmap"""
+        import numpy as np
+        
+        self._flush_weight_updates()
+        
+        x_label = self.sweep_x_combo.currentText()
+        y_label = self.sweep_y_combo.currentText()
+        if x_label == y_label:
+            QMessageBox.warning(self, 'Parameter Sweep', 'Please choose two different parameters to sweep.')
+            return
+        
+        x_values = np.linspace(self.sweep_x_min.value(), self.sweep_x_max.value(), self.sweep_x_steps.value())
+        y_values = np.linspace(self.sweep_y_min.value(), self.sweep_y_max.value(), self.sweep_y_steps.value())
+        
+        # Every grid point is evaluated in one broadcast pass over the current vehicle parameters
+        prefix = self.vehicle_type_combo.currentText().lower()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            outputs = sweep_drive_outputs(self.read_drive_params(prefix),
+                                          [(SWEEP_PARAMETERS[y_label][0], y_values),
+                                           (SWEEP_PARAMETERS[x_label][0], x_values)])
+        
+        metric_label = self.sweep_metric_combo.currentText()
+        output_name, scenario = SWEEP_METRICS[metric_label]
+        grid = np.broadcast_to(outputs[output_name][scenario], (len(y_values), len(x_values)))
+        
+        self.sweep_canvas.plot_heatmap(x_values, y_values, grid, x_label, y_label, metric_label)
+        self._status.showMessage(f'Parameter sweep evaluated {grid.size} design points')
+    
+    def _ensure_testing_point_panel(self):
+        """Build the Testing Point panel (table and both plots) the first time its tab is opened"""
+        if self.testing_point_panel is None:
+            self.testing_point_panel = self.create_testing_point_panel()
+            for widget in self.testing_point_panel.findChildren(QWidget):
+                if not isinstance(widget, FigureCanvas):
+                    widget.setMouseTracking(False)
+            self._testing_point_page.layout().addWidget(self.testing_point_panel)
+        return self.testing_point_panel
+    
     def create_testing_point_panel(self):
         """Create right-side panel for Testing Point - Motor Efficiency Map with Comprehensive Test Points"""
         panel = QWidget()
@@ -825,69 +2004,8 @@ class EVSimulationApp(QMainWindow):
         # Store input widgets for each test point
         self.test_point_inputs = []
         
-        # Different default values for each of the 10 test points
-        # Varying RPM, Torque, Gradient and some vehicle parameters for diverse analysis
-        self.test_point_defaults = [
-            # Point 1: Low speed, low torque, flat road
-            {'rpm': 500, 'torque': 20, 'gvw': EV_DEFAULTS['gvw'], 'cd': EV_DEFAULTS['cd'], 
-             'cr': EV_DEFAULTS['cr'], 'air_density': EV_DEFAULTS['air_density'], 
-             'frontal_area': EV_DEFAULTS['frontal_area'], 'gear_ratio': EV_DEFAULTS['gear_ratio'], 
-             'wheel_radius': EV_DEFAULTS['wheel_radius'], 'gradient': 0.0},
-            
-            # Point 2: Medium speed, medium torque, flat road
-            {'rpm': 1500, 'torque': 50, 'gvw': EV_DEFAULTS['gvw'], 'cd': EV_DEFAULTS['cd'], 
-             'cr': EV_DEFAULTS['cr'], 'air_density': EV_DEFAULTS['air_density'], 
-             'frontal_area': EV_DEFAULTS['frontal_area'], 'gear_ratio': EV_DEFAULTS['gear_ratio'], 
-             'wheel_radius': EV_DEFAULTS['wheel_radius'], 'gradient': 0.0},
-            
-            # Point 3: Optimal efficiency zone (mid RPM, mid-high torque)
-            {'rpm': 2500, 'torque': 75, 'gvw': EV_DEFAULTS['gvw'], 'cd': EV_DEFAULTS['cd'], 
-             'cr': EV_DEFAULTS['cr'], 'air_density': EV_DEFAULTS['air_density'], 
-             'frontal_area': EV_DEFAULTS['frontal_area'], 'gear_ratio': EV_DEFAULTS['gear_ratio'], 
-             'wheel_radius': EV_DEFAULTS['wheel_radius'], 'gradient': 0.0},
-            
-            # Point 4: High torque climbing - gentle slope
-            {'rpm': 2000, 'torque': 100, 'gvw': EV_DEFAULTS['gvw'], 'cd': EV_DEFAULTS['cd'], 
-             'cr': EV_DEFAULTS['cr'], 'air_density': EV_DEFAULTS['air_density'], 
-             'frontal_area': EV_DEFAULTS['frontal_area'], 'gear_ratio': EV_DEFAULTS['gear_ratio'], 
-             'wheel_radius': EV_DEFAULTS['wheel_radius'], 'gradient': 5.0},
-            
-            # Point 5: High speed cruise
-            {'rpm': 4000, 'torque': 40, 'gvw': EV_DEFAULTS['gvw'], 'cd': EV_DEFAULTS['cd'], 
-             'cr': EV_DEFAULTS['cr'], 'air_density': EV_DEFAULTS['air_density'], 
-             'frontal_area': EV_DEFAULTS['frontal_area'], 'gear_ratio': EV_DEFAULTS['gear_ratio'], 
-             'wheel_radius': EV_DEFAULTS['wheel_radius'], 'gradient': 0.0},
-            
-            # Point 6: Steep climb - high torque
-            {'rpm': 1000, 'torque': 120, 'gvw': EV_DEFAULTS['gvw'], 'cd': EV_DEFAULTS['cd'], 
-             'cr': EV_DEFAULTS['cr'], 'air_density': EV_DEFAULTS['air_density'], 
-             'frontal_area': EV_DEFAULTS['frontal_area'], 'gear_ratio': EV_DEFAULTS['gear_ratio'], 
-             'wheel_radius': EV_DEFAULTS['wheel_radius'], 'gradient': 15.0},
-            
-            # Point 7: Highway speed
-            {'rpm': 5000, 'torque': 60, 'gvw': EV_DEFAULTS['gvw'], 'cd': EV_DEFAULTS['cd'], 
-             'cr': EV_DEFAULTS['cr'], 'air_density': EV_DEFAULTS['air_density'], 
-             'frontal_area': EV_DEFAULTS['frontal_area'], 'gear_ratio': EV_DEFAULTS['gear_ratio'], 
-             'wheel_radius': EV_DEFAULTS['wheel_radius'], 'gradient': 0.0},
-            
-            # Point 8: Very high speed
-            {'rpm': 7000, 'torque': 30, 'gvw': EV_DEFAULTS['gvw'], 'cd': EV_DEFAULTS['cd'], 
-             'cr': EV_DEFAULTS['cr'], 'air_density': EV_DEFAULTS['air_density'], 
-             'frontal_area': EV_DEFAULTS['frontal_area'], 'gear_ratio': EV_DEFAULTS['gear_ratio'], 
-             'wheel_radius': EV_DEFAULTS['wheel_radius'], 'gradient': 0.0},
-            
-            # Point 9: Heavy load condition
-            {'rpm': 3000, 'torque': 90, 'gvw': EV_DEFAULTS['gvw'] * 1.3, 'cd': EV_DEFAULTS['cd'], 
-             'cr': EV_DEFAULTS['cr'], 'air_density': EV_DEFAULTS['air_density'], 
-             'frontal_area': EV_DEFAULTS['frontal_area'], 'gear_ratio': EV_DEFAULTS['gear_ratio'], 
-             'wheel_radius': EV_DEFAULTS['wheel_radius'], 'gradient': 3.0},
-            
-            # Point 10: Downhill regeneration
-            {'rpm': 3500, 'torque': 25, 'gvw': EV_DEFAULTS['gvw'], 'cd': EV_DEFAULTS['cd'], 
-             'cr': EV_DEFAULTS['cr'], 'air_density': EV_DEFAULTS['air_density'], 
-             'frontal_area': EV_DEFAULTS['frontal_area'], 'gear_ratio': EV_DEFAULTS['gear_ratio'], 
-             'wheel_radius': EV_DEFAULTS['wheel_radius'], 'gradient': -5.0},
-        ]
+        # Different default values for each of the 10 test points (see TEST_POINT_DEFAULTS)
+        self.test_point_defaults = TEST_POINT_DEFAULTS
         
         # Create input widgets for each row
         for i in range(10):
@@ -1007,67 +2125,19 @@ class EVSimulationApp(QMainWindow):
         
         # Plot button
         self.plot_test_points_btn = QPushButton('📊 Plot Test Points')
-        self.plot_test_points_btn.setStyleSheet('''
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 20px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        ''')
+        style_button(self.plot_test_points_btn, 'plotTestPointsButton')
         self.plot_test_points_btn.clicked.connect(self.plot_efficiency_test_points)
         btn_layout.addWidget(self.plot_test_points_btn)
         
         # Reset to Defaults button
         self.reset_test_points_btn = QPushButton('🔄 Reset to Defaults')
-        self.reset_test_points_btn.setStyleSheet('''
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 20px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #1565C0;
-            }
-        ''')
+        style_button(self.reset_test_points_btn, 'resetTestPointsButton')
         self.reset_test_points_btn.clicked.connect(self.reset_test_points_to_defaults)
         btn_layout.addWidget(self.reset_test_points_btn)
         
         # Clear button
         self.clear_test_points_btn = QPushButton('🗑️ Clear All')
-        self.clear_test_points_btn.setStyleSheet('''
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 20px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-            QPushButton:pressed {
-                background-color: #c41808;
-            }
-        ''')
+        style_button(self.clear_test_points_btn, 'clearTestPointsButton')
         self.clear_test_points_btn.clicked.connect(self.clear_test_points)
         btn_layout.addWidget(self.clear_test_points_btn)
         
@@ -1227,25 +2297,15 @@ class EVSimulationApp(QMainWindow):
         # Create RPM range
         rpm_range = np.linspace(0, max_rpm, 500)
         
-        # Calculate torque curves (constant torque region + constant power region)
-        # Peak torque curve
-        peak_torque_curve = np.zeros_like(rpm_range)
-        for i, rpm in enumerate(rpm_range):
-            if rpm <= base_rpm:
-                peak_torque_curve[i] = peak_torque
-            else:
-                # Constant power region: P = T * omega, so T = P / omega
-                omega = rpm * 2 * np.pi / 60
-                peak_torque_curve[i] = min(peak_torque, peak_power / omega if omega > 0 else peak_torque)
-        
-        # Continuous torque curve
-        continuous_torque_curve = np.zeros_like(rpm_range)
-        for i, rpm in enumerate(rpm_range):
-            if rpm <= base_rpm:
-                continuous_torque_curve[i] = continuous_torque
-            else:
-                omega = rpm * 2 * np.pi / 60
-                continuous_torque_curve[i] = min(continuous_torque, continuous_power / omega if omega > 0 else continuous_torque)
+        # Calculate torque curves (constant torque region + constant power region) over the
+        # whole RPM range at once. Constant power region: P = T * omega, so T = P / omega
+        omega = rpm_range * 2 * np.pi / 60
+        constant_torque_region = rpm_range <= base_rpm
+        with np.errstate(divide='ignore'):
+            peak_torque_curve = np.where(constant_torque_region, peak_torque,
+                                         np.minimum(peak_torque, peak_power / omega))
+            continuous_torque_curve = np.where(constant_torque_region, continuous_torque,
+                                               np.minimum(continuous_torque, continuous_power / omega))
         
         # Plot motor envelope
         ax.fill_between(rpm_range, 0, continuous_torque_curve, alpha=0.3, color='green', label='Continuous Operation')
@@ -1326,8 +2386,7 @@ class EVSimulationApp(QMainWindow):
         ax.legend(loc='upper right', fontsize=8)
         ax.grid(True, alpha=0.3, linestyle='--')
         
-        self.motor_suitability_canvas.fig.tight_layout()
-        self.motor_suitability_canvas.draw()
+        self.motor_suitability_canvas.draw_idle()
     
     def update_motor_suitability_plot(self):
         """Update motor suitability plot when motor selection changes"""
@@ -1345,16 +2404,7 @@ class EVSimulationApp(QMainWindow):
         
         # Use default params if not provided
         if params is None:
-            params = {
-                'gvw': EV_DEFAULTS['gvw'],
-                'cd': EV_DEFAULTS['cd'],
-                'cr': EV_DEFAULTS['cr'],
-                'air_density': EV_DEFAULTS['air_density'],
-                'frontal_area': EV_DEFAULTS['frontal_area'],
-                'gear_ratio': EV_DEFAULTS['gear_ratio'],
-                'wheel_radius': EV_DEFAULTS['wheel_radius'],
-                'gradient': 0.0
-            }
+            params = EFFICIENCY_DEFAULT_PARAMS
         
         # Motor efficiency model parameters (tuned to match reference image)
         # Peak efficiency occurs around 2000-4000 RPM and 50-150 Nm
@@ -1392,7 +2442,7 @@ class EVSimulationApp(QMainWindow):
         
         # Aerodynamic drag penalty at high speed
         drag_factor = params['cd'] * params['frontal_area'] * params['air_density']
-        drag_penalty = 0.02 * (drag_factor / (EV_DEFAULTS['cd'] * EV_DEFAULTS['frontal_area'] * EV_DEFAULTS['air_density']) - 1) if drag_factor > 0 else 0
+        drag_penalty = 0.02 * (drag_factor / EFFICIENCY_REFERENCE_DRAG - 1) if drag_factor > 0 else 0
         drag_penalty = max(0, drag_penalty)
         
         # Calculate final efficiency
@@ -1442,16 +2492,20 @@ class EVSimulationApp(QMainWindow):
         # Store test points data for hover functionality
         self.current_test_points = test_points
         
-        # Create grid for contour plot
-        rpm_range = np.linspace(0, 10000, 150)
-        torque_range = np.linspace(0, 200, 150)
-        RPM, TORQUE = np.meshgrid(rpm_range, torque_range)
-        
-        # Calculate efficiency for each point (using default params for base map)
-        EFFICIENCY = np.zeros_like(RPM)
-        for i in range(RPM.shape[0]):
-            for j in range(RPM.shape[1]):
-                EFFICIENCY[i, j] = self.calculate_motor_efficiency(RPM[i, j], TORQUE[i, j])
+        # The base map only depends on the default params, so its grid is evaluated once
+        if self._efficiency_map_grid is None:
+            # Create grid for contour plot
+            rpm_range = np.linspace(0, 10000, 150)
+            torque_range = np.linspace(0, 200, 150)
+            RPM, TORQUE = np.meshgrid(rpm_range, torque_range)
+            
+            # Calculate efficiency for each point (using default params for base map)
+            EFFICIENCY = np.zeros_like(RPM)
+            for i in range(RPM.shape[0]):
+                for j in range(RPM.shape[1]):
+                    EFFICIENCY[i, j] = self.calculate_motor_efficiency(RPM[i, j], TORQUE[i, j])
+            self._efficiency_map_grid = (RPM, TORQUE, EFFICIENCY)
+        RPM, TORQUE, EFFICIENCY = self._efficiency_map_grid
         
         # Create contour plot with color map similar to reference
         levels = np.linspace(0, 0.96, 12)
@@ -1520,8 +2574,7 @@ class EVSimulationApp(QMainWindow):
         # Grid
         ax.grid(True, alpha=0.3, linestyle='--')
         
-        self.efficiency_canvas.fig.tight_layout()
-        self.efficiency_canvas.draw()
+        self.efficiency_canvas.draw_idle()
     
     def on_efficiency_hover(self, event):
         """Handle hover events on the efficiency map to show tooltips"""
@@ -1553,6 +2606,8 @@ class EVSimulationApp(QMainWindow):
                 break
         
         if not visible:
+            if not self.hover_annotation.get_visible():
+                return  # Tooltip already hidden - nothing on the map changed
             self.hover_annotation.set_visible(False)
         
         self.efficiency_canvas.draw_idle()
@@ -1661,13 +2716,13 @@ class EVSimulationApp(QMainWindow):
         
         html_results += '</table>'
         
-        # Calculate statistics
-        efficiencies = [p['efficiency'] for p in test_points]
-        avg_efficiency = np.mean(efficiencies)
+        # Calculate statistics - one array of efficiencies serves the mean and the best/worst lookups
+        efficiencies = np.array([p['efficiency'] for p in test_points])
+        avg_efficiency = efficiencies.mean()
         
         # Find best and worst points
-        best_point = max(test_points, key=lambda x: x['efficiency'])
-        worst_point = min(test_points, key=lambda x: x['efficiency'])
+        best_point = test_points[efficiencies.argmax()]
+        worst_point = test_points[efficiencies.argmin()]
         
         html_results += f'''
         <div style="margin-top:10px; padding:10px; background:#f5f5f5; border-radius:5px; border:1px solid #ddd;">
@@ -1706,23 +2761,19 @@ class EVSimulationApp(QMainWindow):
         # Plot the motor suitability graph with test points
         self.plot_motor_suitability(test_points=test_points)
         
-        self.statusBar().showMessage(f'Plotted {valid_points} test points | Avg Efficiency: {avg_efficiency*100:.1f}%')
+        self._status.showMessage(f'Plotted {valid_points} test points | Avg Efficiency: {avg_efficiency*100:.1f}%')
+    
+    def _set_test_point_values(self, rows):
+        """Write one values dict per test point row, as one batch with the row signals blocked"""
+        widgets = [widget for inputs in self.test_point_inputs for widget in inputs.values()]
+        with self._bulk_update(widgets):
+            for inputs, values in zip(self.test_point_inputs, rows):
+                for name, widget in inputs.items():
+                    widget.setValue(values[name])
     
     def reset_test_points_to_defaults(self):
         """Reset all test point parameters to their original default values and clear graphs"""
-        for i in range(10):
-            inputs = self.test_point_inputs[i]
-            defaults = self.test_point_defaults[i]
-            inputs['rpm'].setValue(defaults['rpm'])
-            inputs['torque'].setValue(defaults['torque'])
-            inputs['gvw'].setValue(defaults['gvw'])
-            inputs['cd'].setValue(defaults['cd'])
-            inputs['cr'].setValue(defaults['cr'])
-            inputs['air_density'].setValue(defaults['air_density'])
-            inputs['frontal_area'].setValue(defaults['frontal_area'])
-            inputs['gear_ratio'].setValue(defaults['gear_ratio'])
-            inputs['wheel_radius'].setValue(defaults['wheel_radius'])
-            inputs['gradient'].setValue(defaults['gradient'])
+        self._set_test_point_values(self.test_point_defaults)
         
         # Clear test points data
         self.current_test_points = None
@@ -1734,22 +2785,11 @@ class EVSimulationApp(QMainWindow):
         self.plot_efficiency_map()
         self.plot_motor_suitability()
         
-        self.statusBar().showMessage('All test points reset to original defaults')
+        self._status.showMessage('All test points reset to original defaults')
     
     def clear_test_points(self):
         """Clear all test point inputs and reset the graphs"""
-        for i in range(10):
-            inputs = self.test_point_inputs[i]
-            inputs['rpm'].setValue(0)
-            inputs['torque'].setValue(0)
-            inputs['gvw'].setValue(EV_DEFAULTS['gvw'])
-            inputs['cd'].setValue(EV_DEFAULTS['cd'])
-            inputs['cr'].setValue(EV_DEFAULTS['cr'])
-            inputs['air_density'].setValue(EV_DEFAULTS['air_density'])
-            inputs['frontal_area'].setValue(EV_DEFAULTS['frontal_area'])
-            inputs['gear_ratio'].setValue(EV_DEFAULTS['gear_ratio'])
-            inputs['wheel_radius'].setValue(EV_DEFAULTS['wheel_radius'])
-            inputs['gradient'].setValue(0.0)
+        self._set_test_point_values([TEST_POINT_CLEARED] * len(self.test_point_inputs))
         
         # Clear test points data
         self.current_test_points = None
@@ -1761,63 +2801,142 @@ class EVSimulationApp(QMainWindow):
         self.plot_efficiency_map()
         self.plot_motor_suitability()
         
-        self.statusBar().showMessage('All test points cleared')
+        self._status.showMessage('All test points cleared')
+    
+    def _sync_ev_params(self):
+        """Re-read every EV parameter widget into the _ev_params mirror"""
+        for field in fields(EVSnapshot):
+            widget = getattr(self, f'ev_{field.name}_input')
+            self._ev_params[field.name] = widget.currentText() if field.type is str else widget.value()
+    
+    def _snapshot_ev_params(self):
+        """Build an EVSnapshot from the _ev_params mirror without touching the widgets"""
+        return EVSnapshot(**self._ev_params)
+    
+    def _present_output(self, render):
+        """Run an output render now if the Results tab is showing, else keep it for when it is"""
+        if self.output_tabs.currentWidget() is self.output_text:
+            self._pending_output = None
+            render()
+        else:
+            self._pending_output = render
+    
+    def _flush_pending_output(self, index):
+        """Apply the deferred output render once the Results tab is shown"""
+        if self._pending_output is not None and self.output_tabs.widget(index) is self.output_text:
+            render, self._pending_output = self._pending_output, None
+            render()
+    
+    def _display_ev_output(self, ev, cell_texts):
+        """Show EV output cell texts and remember which snapshot they belong to"""
+        self._show_ev_output(cell_texts)
+        self._shown_ev_snapshot = ev
+    
+    def _display_ugv_output(self, html):
+        """Replace the output document with UGV output HTML"""
+        self.output_text.setHtml(html)
+        self._shown_ev_snapshot = None
+        self._ev_output_cells = None
+    
+    def _show_ev_output(self, cell_texts):
+        """Show EV output values, parsing the static HTML skeleton only the first time"""
+        document = self.output_text.document()
+        if self._ev_output_cells is None:
+            skeleton_html, markers, _ = ev_output_layout()
+            self.output_text.setHtml(skeleton_html)
+            document.setUndoRedoEnabled(False)
+            self._ev_output_cells = [document.find(marker) for marker in markers]
+        
+        # Rewrite only the value cells; each cursor keeps its cell's text selected for the next update
+        batch = QTextCursor(document)
+        batch.beginEditBlock()
+        for cursor, text in zip(self._ev_output_cells, cell_texts):
+            start = cursor.selectionStart()
+            cursor.insertText(text)
+            cursor.setPosition(start)
+            cursor.setPosition(start + len(text), QTextCursor.MoveMode.KeepAnchor)
+        batch.endEditBlock()
+    
+    def _flush_weight_updates(self):
+        """Apply weight edits still waiting on the debounce timers, so kerb weight and GVW are current"""
+        for prefix in ('ev', 'ugv'):
+            timer = getattr(self, f'_{prefix}_weights_timer', None)
+            if timer is not None:
+                timer.stop()
+                getattr(self, f'update_{prefix}_calculated_weights')()
     
     def compute_output_values(self):
         """Process current inputs and show output values for selected vehicle type"""
         import math
         
+        self._flush_weight_updates()
+        
         # Read inputs
         vehicle_type = self.vehicle_type_combo.currentText()
         
         # Get EV or UGV parameters based on vehicle type
         if vehicle_type == 'EV':
+            ev = self._snapshot_ev_params()
+            
+            # Unchanged inputs keep the document on screen, skipping the HTML re-parse and re-layout
+            if ev == self._shown_ev_snapshot:
+                self._pending_output = None
+                self._status.showMessage('EV Output values unchanged')
+                return
+            
+            # Repeated parameter sets skip the whole calculation
+            cached_texts = self._ev_output_cache.get(ev)
+            if cached_texts is not None:
+                self._present_output(partial(self._display_ev_output, ev, cached_texts))
+                self._status.showMessage('EV Output values computed successfully')
+                return
+            
             # Physical parameters
-            wheel_radius = self.ev_wheel_radius_input.value()
-            cd = self.ev_cd_input.value()
-            cr = self.ev_cr_input.value()
-            frontal_area = self.ev_frontal_area_input.value()
-            air_density = self.ev_air_density_input.value()
+            wheel_radius = ev.wheel_radius
+            cd = ev.cd
+            cr = ev.cr
+            frontal_area = ev.frontal_area
+            air_density = ev.air_density
             
             # Drivetrain parameters
-            gear_ratio = self.ev_gear_ratio_input.value()
-            gear_efficiency = self.ev_gear_efficiency_input.value() / 100.0
-            motor_efficiency = self.ev_motor_efficiency_input.value() / 100.0
-            motor_base_rpm = self.ev_motor_base_rpm_input.value()
+            gear_ratio = ev.gear_ratio
+            gear_efficiency = ev.gear_efficiency / 100.0
+            motor_efficiency = ev.motor_efficiency / 100.0
+            motor_base_rpm = ev.motor_base_rpm
             
             # Weight parameters (ALL components) 
-            passenger_weight = self.ev_passenger_weight_input.value()
-            motor_controller_weight = self.ev_motor_controller_weight_input.value()
-            battery_weight_input = self.ev_battery_weight_input.value()
-            vehicle_weight_input = self.ev_vehicle_weight_input.value()
-            other_weights = self.ev_other_weights_input.value()
-            generator_weight = self.ev_generator_weight_input.value()
+            passenger_weight = ev.passenger_weight
+            motor_controller_weight = ev.motor_controller_weight
+            battery_weight_input = ev.battery_weight
+            vehicle_weight_input = ev.vehicle_weight
+            other_weights = ev.other_weights
+            generator_weight = ev.generator_weight
             kerb_weight = battery_weight_input + vehicle_weight_input
             gvw_input = kerb_weight + passenger_weight
 
             # Battery parameters (ALL)
-            battery_requirements = self.ev_battery_req_input.currentText()
-            battery_chemistry = self.ev_battery_chem_input.currentText()
-            battery_voltage = self.ev_battery_voltage_input.value()
-            weight_per_wh = self.ev_weight_per_wh_input.value()
-            peukert_coeff = self.ev_peukert_input.value()
-            discharge_hr = self.ev_discharge_hr_input.value()
-            dod_pct = self.ev_dod_input.value()
-            battery_current = self.ev_battery_current_input.value()
-            true_capacity_wh = self.ev_true_capacity_wh_input.value()
-            true_capacity_ah = self.ev_true_capacity_ah_input.value()
-            tentative_ah = self.ev_tentative_ah_input.value()
-            tentative_wh = self.ev_tentative_wh_input.value()
-            battery_weight_total = self.ev_battery_weight_total_input.value()
+            battery_requirements = ev.battery_req
+            battery_chemistry = ev.battery_chem
+            battery_voltage = ev.battery_voltage
+            weight_per_wh = ev.weight_per_wh
+            peukert_coeff = ev.peukert
+            discharge_hr = ev.discharge_hr
+            dod_pct = ev.dod
+            battery_current = ev.battery_current
+            true_capacity_wh = ev.true_capacity_wh
+            true_capacity_ah = ev.true_capacity_ah
+            tentative_ah = ev.tentative_ah
+            tentative_wh = ev.tentative_wh
+            battery_weight_total = ev.battery_weight_total
             
             # Performance parameters
-            max_speed = self.ev_max_speed_input.value()
-            slope_speed = self.ev_slope_speed_input.value()
-            gradeability = self.ev_gradeability_input.value()
-            accel_end_speed = self.ev_accel_end_speed_input.value()
-            accel_period = self.ev_accel_period_input.value()
-            rotary_inertia = self.ev_rotary_inertia_input.value()
-            vehicle_range = self.ev_vehicle_range_input.value()
+            max_speed = ev.max_speed
+            slope_speed = ev.slope_speed
+            gradeability = ev.gradeability
+            accel_end_speed = ev.accel_end_speed
+            accel_period = ev.accel_period
+            rotary_inertia = ev.rotary_inertia
+            vehicle_range = ev.vehicle_range
             
             # Calculate total vehicle mass from components
             calculated_vehicle_mass = gvw_input
@@ -1832,14 +2951,7 @@ class EVSimulationApp(QMainWindow):
                 vehicle_mass = calculated_vehicle_mass
             
             # Battery calculations with chemistry
-            # Energy density by chemistry (Wh/kg)
-            energy_density_map = {
-                'NCM': 250,  # Nickel Cobalt Manganese
-                'NCA': 260,  # Nickel Cobalt Aluminum
-                'LFP': 160,  # Lithium Iron Phosphate
-                'LTO': 80    # Lithium Titanate Oxide
-            }
-            energy_density = energy_density_map.get(battery_chemistry, 200)
+            energy_density = BATTERY_ENERGY_DENSITY.get(battery_chemistry, 200)
             
             # Placeholder for battery calculations - will be calculated after power analysis
             calculated_battery_current = 0
@@ -1852,142 +2964,58 @@ class EVSimulationApp(QMainWindow):
             available_capacity_ah = 0
             
             # Store all calculated values for display
-            ev_weight_breakdown = {
-                'kerb_weight': kerb_weight,
-                'passenger_weight': passenger_weight,
-                'motor_controller_weight': motor_controller_weight,
-                'battery_weight_total': battery_weight_total,
-                'other_weights': other_weights,
-                'generator_weight': generator_weight,
-                'calculated_total': calculated_vehicle_mass,
-                'calculated_gvw': calculated_gvw,
-                'input_vehicle_weight': vehicle_weight_input
-            }
+            ev_weight_breakdown = WeightBreakdown(
+                kerb_weight=kerb_weight,
+                passenger_weight=passenger_weight,
+                motor_controller_weight=motor_controller_weight,
+                battery_weight_total=battery_weight_total,
+                other_weights=other_weights,
+                generator_weight=generator_weight,
+                calculated_total=calculated_vehicle_mass,
+                calculated_gvw=calculated_gvw,
+                input_vehicle_weight=vehicle_weight_input
+            )
             
             # ev_battery_analysis will be created after battery calculations
             
             vehicle_mass = calculated_vehicle_mass if vehicle_weight_input <= 0 else vehicle_weight_input
         else:  # UGV
-            wheel_radius = self.ugv_wheel_radius_input.value()
-            gear_ratio = self.ugv_gear_ratio_input.value()
-            gear_efficiency = self.ugv_gear_efficiency_input.value() / 100.0
-            motor_efficiency = self.ugv_motor_efficiency_input.value() / 100.0
-            motor_base_rpm = self.ugv_motor_base_rpm_input.value()
-            vehicle_weight_input = self.ugv_vehicle_weight_input.value()
-            cd = self.ugv_cd_input.value()
-            cr = self.ugv_cr_input.value()
-            frontal_area = self.ugv_frontal_area_input.value()
-            air_density = self.ugv_air_density_input.value()
-            max_speed = self.ugv_max_speed_input.value()
-            slope_speed = self.ugv_slope_speed_input.value()
-            gradeability = self.ugv_gradeability_input.value()
-            accel_end_speed = self.ugv_accel_end_speed_input.value()
-            accel_period = self.ugv_accel_period_input.value()
-            rotary_inertia = self.ugv_rotary_inertia_input.value()
+            # One pass over the UGV_COMPUTE_INPUTS widgets, resolved when the UGV group was built
+            (wheel_radius, gear_ratio, gear_efficiency_pct, motor_efficiency_pct, motor_base_rpm,
+             vehicle_weight_input, cd, cr, frontal_area, air_density, max_speed, slope_speed, gradeability,
+             accel_end_speed, accel_period, rotary_inertia, gvw_input,
+             num_wheels, num_powered_wheels, track_width, skid_coefficient, spin_angular_rad,
+             spin_angular_deg) = [widget.value() for widget in self._ugv_compute_inputs]
+            gear_efficiency = gear_efficiency_pct / 100.0
+            motor_efficiency = motor_efficiency_pct / 100.0
             
             # For UGV, use GVW field (same as EV)
-            gvw_input = self.ugv_gvw_input.value()
             calculated_gvw = gvw_input
             vehicle_mass = vehicle_weight_input
         
-        # Convert speeds to m/s
-        max_speed_ms = max_speed / 3.6
-        slope_speed_ms = slope_speed / 3.6
-        accel_end_speed_ms = accel_end_speed / 3.6
-        
-        # Vehicle Speed for Motor Base Speed RPM
-        vehicle_speed_motor_base = (motor_base_rpm * 2 * math.pi * wheel_radius) / (60 * gear_ratio)
-        
-        # --- FORCE CALCULATIONS ---
-        # Drag force at max speed (F = 0.5 * Cd * ρ * A * v²)
-        F_drag_max = 0.5 * cd * air_density * frontal_area * max_speed_ms * max_speed_ms
-        
-        # Drag force at slope speed (F = 0.5 * Cd * ρ * A * v²)
-        F_drag_slope = 0.5 * cd * air_density * frontal_area * slope_speed_ms * slope_speed_ms
-        
-        # Rolling resistance (zero gradient)
-        F_roll = cr * gvw_input * 9.81
-        
-        # Climbing force (gradeability in degrees)
-        F_climb = gvw_input * 9.81 * math.sin(gradeability * 0.01745329)
-        
-        # Convert acceleration end speed to m/s
-        Vehicle_End_Acc_Speed = accel_end_speed * 0.277777777777777
-        
-        # --- VEHICLE ACCELERATION POWER ---
-        # Term1: ((GVW * rotary_inertia) / (2 * accel_period)) * ((Vehicle_End_Acc_Speed^2) + (vehicle_speed_motor_base^2))
-        term1 = ((calculated_gvw * rotary_inertia) / (2 * accel_period)) * ((Vehicle_End_Acc_Speed ** 2) + (vehicle_speed_motor_base ** 2))
-        
-        # Term2: (Cd * rho * A * Vehicle_End_Acc_Speed^3) / 5
-        term2 = (cd * air_density * frontal_area * Vehicle_End_Acc_Speed * Vehicle_End_Acc_Speed * Vehicle_End_Acc_Speed) / 5
-        
-        # Term3: (2 * Cr * GVW * g * Vehicle_End_Acc_Speed) / 3
-        term3 = (2 * cr * calculated_gvw * 9.81 * Vehicle_End_Acc_Speed) / 3
-        
-        # Required Power for Acceleration
-        req_power_accel = (term1 + term2 + term3) / (gear_efficiency * motor_efficiency)
-        
-        # --- MOTOR INPUT POWER (accounting for efficiencies) ---
-        # Zero Gradient Max Speed Power
-        motor_input_max = ((F_drag_max + F_roll) * (max_speed * 0.2777778)) / (gear_efficiency * motor_efficiency)
-        
-        # Max Slope - Max Slope Speed Power
-        motor_input_slope = ((F_drag_slope + F_roll + F_climb) * (slope_speed * 0.2777778)) / (gear_efficiency * motor_efficiency)
-        
-        # Acceleration Power
-        motor_input_accel = req_power_accel
-        
-        # --- TOTAL REQUIRED MOTOR OUTPUT POWER ---
-        motor_output_max = ((F_drag_max + F_roll) * (max_speed * 0.2777778)) / gear_efficiency
-        motor_output_slope = ((F_drag_slope + F_roll + F_climb) * (slope_speed * 0.2777778)) / gear_efficiency
-        motor_output_accel = (term1 + term2 + term3) / gear_efficiency
-        
-        # --- TOTAL TORQUE AND RPM AT MOTOR OUTPUT ---
-        # RPM at max speed
-        rpm_motor_max = (max_speed * gear_ratio) / (2 * math.pi * wheel_radius * 0.001 * 60)
-        torque_motor_max = (motor_output_max * 60) / (2 * math.pi * rpm_motor_max)
-        
-        # RPM at slope speed
-        rpm_motor_slope = (slope_speed * gear_ratio) / (2 * math.pi * wheel_radius * 0.001 * 60)
-        torque_motor_slope = (motor_output_slope * 60) / (2 * math.pi * rpm_motor_slope)
-        
-        # RPM at acceleration (use motor base RPM)
-        rpm_motor_accel = (accel_end_speed * gear_ratio) / (2 * math.pi * wheel_radius * 0.001 * 60)
-        torque_motor_accel = (motor_output_accel * 60) / (2 * math.pi * rpm_motor_accel)
-        
-        # --- TOTAL REQUIRED POWER OUTPUT AT WHEELS ---
-        wheel_power_max = motor_output_max * gear_efficiency
-        wheel_power_slope = motor_output_slope * gear_efficiency
-        wheel_power_accel = motor_output_accel * gear_efficiency
-        
-        # --- TOTAL TORQUE AND RPM AT WHEELS ---
-        # RPM at wheels (max speed)
-        rpm_wheel_max = (max_speed_ms* 60) / (2 * math.pi * wheel_radius)
-        torque_wheel_max = (wheel_power_max * 60) / (2 * math.pi * rpm_wheel_max) if rpm_wheel_max > 0 else 0
-        
-        # RPM at wheels (slope speed)
-        rpm_wheel_slope = (slope_speed_ms * 60) / (2 * math.pi * wheel_radius)
-        torque_wheel_slope = (wheel_power_slope * 60) / (2 * math.pi * rpm_wheel_slope) if rpm_wheel_slope > 0 else 0
-        
-        # RPM at wheels (acceleration - using motor base RPM)
-        rpm_wheel_accel = (accel_end_speed_ms * 60) / (2 * math.pi * wheel_radius)
-        torque_wheel_accel = (wheel_power_accel * 60) / (2 * math.pi * rpm_wheel_accel) 
+        # --- FORCE, POWER, TORQUE AND RPM FOR EACH SCENARIO ---
+        (F_drag_max, F_drag_slope, F_roll, F_climb, vehicle_speed_motor_base, Vehicle_End_Acc_Speed,
+         term1, term2, term3, req_power_accel,
+         motor_input, motor_output, rpm_motor, torque_motor,
+         wheel_power, rpm_wheel, torque_wheel) = compute_drive_outputs(
+            wheel_radius, cd, cr, frontal_area, air_density, gear_ratio, gear_efficiency,
+            motor_efficiency, motor_base_rpm, gvw_input, calculated_gvw, max_speed, slope_speed,
+            self._sin_grade[vehicle_type.lower()], accel_end_speed, accel_period, rotary_inertia)
+        
+        # Unpack per-scenario values (max speed, max slope, acceleration) for display
+        motor_input_max, motor_input_slope, motor_input_accel = motor_input
+        motor_output_max, motor_output_slope, motor_output_accel = motor_output
+        rpm_motor_max, rpm_motor_slope, rpm_motor_accel = rpm_motor
+        torque_motor_max, torque_motor_slope, torque_motor_accel = torque_motor
+        wheel_power_max, wheel_power_slope, wheel_power_accel = wheel_power
+        rpm_wheel_max, rpm_wheel_slope, rpm_wheel_accel = rpm_wheel
+        torque_wheel_max, torque_wheel_slope, torque_wheel_accel = torque_wheel
         
         # --- BATTERY CALCULATIONS USING FORMULAS (EV ONLY) ---
         if vehicle_type == 'EV':
-            # Get battery voltage and vehicle range
-            battery_voltage = self.ev_battery_voltage_input.value()
-            vehicle_range_km = self.ev_vehicle_range_input.value()
-            
-            # Battery parameters from inputs
-            battery_chemistry = self.ev_battery_chem_input.currentText()
-            battery_requirements = self.ev_battery_req_input.currentText()
-            weight_per_wh = self.ev_weight_per_wh_input.value()
-            peukert_coeff = self.ev_peukert_input.value()
-            discharge_hr = self.ev_discharge_hr_input.value()
-            dod_pct = self.ev_dod_input.value()
+            # Battery voltage and vehicle range come from the snapshot read above
+            vehicle_range_km = vehicle_range
 
-            
             # Formula 1: Constant Speed Battery Current (A) = (Zero Gradient Max Speed Power (W)) / Battery Voltage
             calculated_battery_current = motor_input_max / battery_voltage 
             
@@ -2008,317 +3036,94 @@ class EVSimulationApp(QMainWindow):
             calculated_battery_weight = calculated_tentative_wh * weight_per_wh
             
             # Store battery analysis results
-            ev_battery_analysis = {
-                'requirements': battery_requirements,
-                'chemistry': battery_chemistry,
-                'battery_voltage': battery_voltage,
-                'weight_per_wh': weight_per_wh,
-                'peukert_coeff': peukert_coeff,
-                'discharge_hr': discharge_hr,
-                'dod_pct': dod_pct,
-                'battery_current': calculated_battery_current,
-                'nominal_capacity_wh': calculated_true_capacity_wh,
-                'nominal_capacity_ah': calculated_true_capacity_ah,
-                'peukert_adjusted_ah': calculated_tentative_ah,
-                'peukert_adjusted_wh': calculated_tentative_wh,
-                'calculated_battery_weight': calculated_battery_weight
-            }
+            ev_battery_analysis = BatteryAnalysis(
+                requirements=battery_requirements,
+                chemistry=battery_chemistry,
+                battery_voltage=battery_voltage,
+                weight_per_wh=weight_per_wh,
+                peukert_coeff=peukert_coeff,
+                discharge_hr=discharge_hr,
+                dod_pct=dod_pct,
+                battery_current=calculated_battery_current,
+                nominal_capacity_wh=calculated_true_capacity_wh,
+                nominal_capacity_ah=calculated_true_capacity_ah,
+                peukert_adjusted_ah=calculated_tentative_ah,
+                peukert_adjusted_wh=calculated_tentative_wh,
+                calculated_battery_weight=calculated_battery_weight
+            )
             
             # --- BATTERY CAPACITY WITH DRIVE PATTERN ---
-            # Define drive pattern slabs (speed, drive%, gradient, distance%)
-            slabs = [
-                {'name': 'Slab-1 Max Speed', 'speed': max_speed, 'drive_pct': 35, 'gradient': 0.0},
-                {'name': 'Slab-2 Speed', 'speed': max_speed * 0.7, 'drive_pct': 40, 'gradient': 0.0},  # 35 km/h
-                {'name': 'Slab-3 Speed', 'speed': max_speed * 0.5, 'drive_pct': 20, 'gradient': 0.0},  # 25 km/h
-                {'name': 'Slab-4 Speed', 'speed': slope_speed, 'drive_pct': 5, 'gradient': gradeability},
-            ]
-            
-            # Use vehicle_range_km (already defined above) for slab calculations
+            # All four drive pattern slabs (speed, drive%, gradient, distance%) in one array kernel call;
+            # vehicle_range_km (already defined above) is used for the slab distances
             vehicle_range_total = vehicle_range_km
+            (speeds, gradients, distances_km, F_drag_slabs, F_roll_slab, F_climb_slabs,
+             motor_input_slabs, motor_output_slabs, battery_current_slabs, usable_energy_wh,
+             true_usable_ah, final_ah) = compute_slab_outputs(
+                max_speed, slope_speed, gradeability, self._sin_grade['ev'], vehicle_range_total, cd,
+                air_density, frontal_area, cr, calculated_gvw, gear_efficiency, motor_efficiency,
+                battery_voltage, dod_pct, discharge_hr, peukert_coeff)
             
-            slab_data = []
-            total_usable_ah = 0
+            # One structured record per slab, filled column-wise from the kernel arrays
+            import numpy as np
+            slab_data = np.empty(len(SLAB_NAMES), dtype=SLAB_FIELDS)
+            slab_data['name'] = SLAB_NAMES
+            slab_data['speed'] = speeds
+            slab_data['drive_pct'] = SLAB_DRIVE_PCT
+            slab_data['gradient'] = gradients
+            slab_data['distance'] = distances_km
+            slab_data['F_climb'] = F_climb_slabs
+            slab_data['F_drag'] = F_drag_slabs
+            slab_data['F_roll'] = F_roll_slab
+            slab_data['motor_input'] = motor_input_slabs
+            slab_data['motor_output'] = motor_output_slabs
+            slab_data['battery_current'] = battery_current_slabs
+            slab_data['usable_energy'] = usable_energy_wh
+            slab_data['true_usable_ah'] = true_usable_ah
+            slab_data['final_ah'] = final_ah
             
-            for slab in slabs:
-                speed_kmh = slab['speed']
-                speed_ms = speed_kmh / 3.6
-                gradient_deg = slab['gradient']
-                drive_pct = slab['drive_pct']
-                distance_km = (vehicle_range_total * drive_pct)/100
-                
-                # Calculate forces
-                F_drag_slab = cd * air_density * frontal_area * speed_kmh * speed_kmh * 0.03858025308642
-                F_roll_slab = cr * calculated_gvw * 9.81
-                F_climb_slab =  calculated_gvw * 9.81 * math.sin(gradient_deg*0.01745329)
-                
-                # Power calculations
-                power_wheel_slab = (F_drag_slab + F_roll_slab + F_climb_slab)
-                motor_output_slab = power_wheel_slab * (speed_kmh * 0.2777778) / gear_efficiency
-                motor_input_slab = power_wheel_slab * (speed_kmh * 0.2777778) / (gear_efficiency * motor_efficiency)
-                
-                # Battery current
-                battery_current_slab = motor_input_slab / battery_voltage 
-        
-                # Energy and capacity
-                usable_energy_wh = (motor_input_slab * distance_km) / (speed_kmh * (dod_pct/100))
-                true_usable_ah = usable_energy_wh / battery_voltage
-                final_ah = (true_usable_ah * ((battery_current_slab * discharge_hr) ** (peukert_coeff - 1))) ** (1/peukert_coeff)
-                
-                total_usable_ah += true_usable_ah
-                
-                slab_data.append({
-                    'name': slab['name'],
-                    'speed': speed_kmh,
-                    'drive_pct': drive_pct,
-                    'gradient': gradient_deg,
-                    'distance': distance_km,
-                    'F_climb': F_climb_slab,
-                    'F_drag': F_drag_slab,
-                    'F_roll': F_roll_slab,
-                    'motor_input': motor_input_slab,
-                    'motor_output': motor_output_slab,
-                    'battery_current': battery_current_slab,
-                    'usable_energy': usable_energy_wh,
-                    'true_usable_ah': true_usable_ah,
-                    'final_ah': final_ah
-                })
-            
-            final_battery_capacity_ah = sum(slab['final_ah'] for slab in slab_data)
+            final_battery_capacity_ah = slab_data['final_ah'].sum()
         
         # Build HTML output - Only for EV
         if vehicle_type == 'EV':
-            html = f"""
-            <style>
-                table.data {{ width:100%; border-collapse:collapse; margin:5px 0; border:1px solid #999; }}
-                table.data th, table.data td {{ padding:8px; text-align:left; border:1px solid #999; font-family:Segoe UI; font-size:15px; }}
-                table.data th {{ background-color:#f2f2f2; font-weight:bold; }}
-                table.data td.value {{ text-align:right; }}
-                table.layout {{ width:100%; border:none; border-collapse:collapse; }}
-                table.layout td {{ vertical-align:top; padding:10px; border:none; }}
-                table.layout td:first-child {{ border-right: 2px solid #ddd; padding-right:15px; }}
-                table.layout td:last-child {{ padding-left:15px; }}
-                h3 {{ margin:4px 0; font-family:Segoe UI; font-size:16px; font-weight:bold; }}
-                h4 {{ margin:8px 0 4px 0; font-family:Segoe UI; font-size:15px; color:#2c3e50; font-weight:bold; }}
-                .category {{ background-color: #dc3545; color: white; padding: 8px; margin: 15px 0 5px 0; font-weight: bold; font-size: 15px; border-radius: 4px; }}
-            </style>
-            
-            <h3>EV Computed Output Values</h3>
-            
-            <div class='category'>Motor Performance</div>
-            <table class='layout'>
-                <tr>
-                    <td width='50%'>
-                        <h4>Motor Input Power</h4>
-                        <table class='data'>
-                            <tr><th>Scenario</th><th class='value'>Power (W)</th></tr>
-                            <tr><td>Zero Gradient Max Speed Power</td><td class='value'>{motor_input_max:.0f}</td></tr>
-                            <tr><td>Max Slope- Max Slope Speed Power</td><td class='value'>{motor_input_slope:.0f}</td></tr>
-                            <tr><td>Acceleration Power</td><td class='value'>{motor_input_accel:.0f}</td></tr>
-                        </table>
-                    </td>
-                    <td width='50%'>
-                        <h4>Total Required Motor Output Power</h4>
-                        <table class='data'>
-                            <tr><th>Scenario</th><th class='value'>Power (W)</th></tr>
-                            <tr><td>Zero Gradient Max Speed Power</td><td class='value'>{motor_output_max:.0f}</td></tr>
-                            <tr><td>Max Slope- Max Slope Speed Power</td><td class='value'>{motor_output_slope:.0f}</td></tr>
-                            <tr><td>Acceleration Power</td><td class='value'>{motor_output_accel:.0f}</td></tr>
-                        </table>
-                    </td>
-                </tr>
-            </table>
-            
-            <h4>Total Torque and RPM at Motor Output</h4>
-            <table class='data'>
-                <tr><th>Scenario</th><th class='value'>RPM</th><th class='value'>Torque (Nm)</th></tr>
-                <tr><td>Zero Gradient Max Speed</td><td class='value'>{rpm_motor_max:.0f}</td><td class='value'>{torque_motor_max:.2f}</td></tr>
-                <tr><td>Acceleration</td><td class='value'>{rpm_motor_accel:.0f}</td><td class='value'>{torque_motor_accel:.0f}</td></tr>
-                <tr><td>Max Slope- Max Slope Speed</td><td class='value'>{rpm_motor_slope:.0f}</td><td class='value'>{torque_motor_slope:.0f}</td></tr>
-            </table>
-            
-            <div class='category'>Wheel Performance</div>
-            <table class='layout'>
-                <tr>
-                    <td width='50%'>
-                        <h4>Total Required Power Output at Wheels</h4>
-                        <table class='data'>
-                            <tr><th>Scenario</th><th class='value'>Power (W)</th></tr>
-                            <tr><td>Zero Gradient Max Speed Power</td><td class='value'>{wheel_power_max:.0f}</td></tr>
-                            <tr><td>Acceleration Power</td><td class='value'>{wheel_power_accel:.0f}</td></tr>
-                            <tr><td>Max Slope- Max Slope Speed Power</td><td class='value'>{wheel_power_slope:.0f}</td></tr>
-                        </table>
-                    </td>
-                    <td width='50%'>
-                        <h4>Total Torque and RPM at Wheels</h4>
-                        <table class='data'>
-                            <tr><th>Scenario</th><th class='value'>RPM</th><th class='value'>Torque (Nm)</th></tr>
-                            <tr><td>Zero Gradient Max Speed Torque</td><td class='value'>{rpm_wheel_max:.0f}</td><td class='value'>{torque_wheel_max:.0f}</td></tr>
-                            <tr><td>Acceleration Torque</td><td class='value'>{rpm_wheel_accel:.0f}</td><td class='value'>{torque_wheel_accel:.0f}</td></tr>
-                            <tr><td>Max Slope- Max Slope Speed Torque</td><td class='value'>{rpm_wheel_slope:.0f}</td><td class='value'>{torque_wheel_slope:.0f}</td></tr>
-                        </table>
-                    </td>
-                </tr>
-            </table>
-            
-            <div class='category'>Weight Analysis</div>
-            <table class='layout'>
-                <tr>
-                    <td width='50%'>
-                        <h4>Weight Components</h4>
-                        <table class='data'>
-                            <tr><th>Component</th><th class='value'>Weight (kg)</th></tr>
-                            <tr><td>Kerb Weight</td><td class='value'>{ev_weight_breakdown['kerb_weight']:.1f}</td></tr>
-                            <tr><td>Passenger/Load Weight</td><td class='value'>{ev_weight_breakdown['passenger_weight']:.1f}</td></tr>
-                            <tr><td>Motor & Controller Weight</td><td class='value'>{ev_weight_breakdown['motor_controller_weight']:.1f}</td></tr>
-                            <tr><td>Battery Weight</td><td class='value'>{ev_weight_breakdown['battery_weight_total']:.1f}</td></tr>
-                            <tr><td>Other Weights</td><td class='value'>{ev_weight_breakdown['other_weights']:.1f}</td></tr>
-                            <tr><td>Generator Weight</td><td class='value'>{ev_weight_breakdown['generator_weight']:.1f}</td></tr>
-                            <tr style='background-color:#e8f4f8; font-weight:bold;'>
-                                <td>Calculated Total Vehicle Weight</td>
-                                <td class='value'>{ev_weight_breakdown['calculated_total']:.1f}</td>
-                            </tr>
-                            <tr style='background-color:#ffeaa7; font-weight:bold;'>
-                                <td>Input Vehicle Weight (used in calc)</td>
-                                <td class='value'>{ev_weight_breakdown['input_vehicle_weight']:.1f}</td>
-                            </tr>
-                            <tr style='background-color:#d3f8e2; font-weight:bold;'>
-                                <td>Calculated GVW</td>
-                                <td class='value'>{ev_weight_breakdown['calculated_gvw']:.1f}</td>
-                            </tr>
-                        </table>
-                    </td>
-                    <td width='50%'>
-                        <h4>Battery Analysis</h4>
-                        <table class='data'>
-                            <tr><th>Parameter</th><th class='value'>Value</th></tr>
-                            <tr><td>Battery Requirements</td><td class='value'>{ev_battery_analysis['requirements']}</td></tr>
-                            <tr><td>Battery Chemistry</td><td class='value'>{ev_battery_analysis['chemistry']}</td></tr>
-                            <tr><td>Battery voltage</td><td class='value'>{ev_battery_analysis['battery_voltage']:.0f}</td></tr>
-                            <tr><td>Weight per unit Wh</td><td class='value'>{ev_battery_analysis['weight_per_wh']}</td></tr>
-                            <tr><td>Peukert's Coefficient</td><td class='value'>{ev_battery_analysis['peukert_coeff']}</td></tr>
-                            <tr><td>Battery Discharge hour rating (Hr)</td><td class='value'>{ev_battery_analysis['discharge_hr']:.0f}</td></tr>
-                            <tr><td>DepthOfDischarge%</td><td class='value'>{ev_battery_analysis['dod_pct']:.0f}</td></tr>
-                            <tr><td>Constant Speed Battery Current (A)</td><td class='value'>{ev_battery_analysis['battery_current']:.0f}</td></tr>
-                            <tr><td>True usable Battery Capacity Wh</td><td class='value'>{ev_battery_analysis['nominal_capacity_wh']:.0f}</td></tr>
-                            <tr><td>True usable Battery Ah</td><td class='value'>{ev_battery_analysis['nominal_capacity_ah']:.0f}</td></tr>
-                            <tr><td>Tentative  battery Ah for given Discharge Hr</td><td class='value'>{ev_battery_analysis['peukert_adjusted_ah']:.0f}</td></tr>
-                            <tr><td>Tentative battery Capacity Wh</td><td class='value'>{ev_battery_analysis['peukert_adjusted_wh']:.0f}</td></tr>
-                            <tr><td>Battery Weight</td><td class='value'>{ev_battery_analysis['calculated_battery_weight']:.0f}</td></tr>
-                        </table>
-                    </td>
-                </tr>
-            </table>
-            
-            <div class='category'>Force Calculations & Acceleration Analysis</div>
-            <table class='layout'>
-                <tr>
-                    <td width='50%'>
-                        <h4>Force Calculations</h4>
-                        <table class='data'>
-                            <tr><th>Force Type</th><th class='value'>Value (N)</th></tr>
-                            <tr><td>F<sub>drag-const</sub></td><td class='value'>{F_drag_max:.2f}</td></tr>
-                            <tr><td>F<sub>drag-slope</sub></td><td class='value'>{F_drag_slope:.2f}</td></tr>
-                            <tr><td>F<sub>roll</sub></td><td class='value'>{F_roll:.2f}</td></tr>
-                            <tr><td>F<sub>climb</sub></td><td class='value'>{F_climb:.2f}</td></tr>
-                        </table>
-                    </td>
-                    <td width='50%'>
-                        <h4>Vehicle Acceleration Power</h4>
-                        <table class='data'>
-                            <tr><th>Parameter</th><th class='value'>Value</th></tr>
-                            <tr><td>Vehicle Speed for Motor Base Speed RPM (m/s)</td><td class='value'>{vehicle_speed_motor_base:.3f}</td></tr>
-                            <tr><td>Vehicle End of Acc Speed (m/s)</td><td class='value'>{Vehicle_End_Acc_Speed:.3f}</td></tr>
-                            <tr><td>Term1</td><td class='value'>{term1:.0f}</td></tr>
-                            <tr><td>Term2</td><td class='value'>{term2:.0f}</td></tr>
-                            <tr><td>Term3</td><td class='value'>{term3:.0f}</td></tr>
-                            <tr><td><b>Required Power for Acceleration</b></td><td class='value'><b>{req_power_accel:.0f}</b></td></tr>
-                        </table>
-                    </td>
-                </tr>
-            </table>
-            
-            <div class='category'>Battery Capacity Analysis</div>
-            <h4>Battery Capacity with Respect to Drive Pattern</h4>
-            <table class='data'>
-                <tr>
-                    <th>Speed Slab</th>
-                    <th class='value'>Speed (km/h)</th>
-                    <th class='value'>Drive %</th>
-                    <th class='value'>Gradient (°)</th>
-                    <th class='value'>Distance (km)</th>
-                    <th class='value'>F<sub>climb</sub> (N)</th>
-                    <th class='value'>F<sub>drag</sub> (N)</th>
-                    <th class='value'>F<sub>roll</sub> (N)</th>
-                    <th class='value'>Motor Input (W)</th>
-                    <th class='value'>Motor Output (W)</th>
-                    <th class='value'>Battery Current (A)</th>
-                    <th class='value'>Useable Energy (Wh)</th>
-                    <th class='value'>True Usable Ah</th>
-                    <th class='value'>Final Ah</th>
-                </tr>
-                {''.join([f'''<tr>
-                    <td>{s["name"]}</td>
-                    <td class='value'>{s["speed"]:.0f}</td>
-                    <td class='value'>{s["drive_pct"]}%</td>
-                    <td class='value'>{s["gradient"]:.1f}</td>
-                    <td class='value'>{s["distance"]:.2f}</td>
-                    <td class='value'>{s["F_climb"]:.0f}</td>
-                    <td class='value'>{s["F_drag"]:.0f}</td>
-                    <td class='value'>{s["F_roll"]:.0f}</td>
-                    <td class='value'>{s["motor_input"]:.0f}</td>
-                    <td class='value'>{s["motor_output"]:.0f}</td>
-                    <td class='value'>{s["battery_current"]:.0f}</td>
-                    <td class='value'>{s["usable_energy"]:.0f}</td>
-                    <td class='value'>{s["true_usable_ah"]:.0f}</td>
-                    <td class='value'>{s["final_ah"]:.0f}</td>
-                </tr>''' for s in slab_data])}
-                <tr style='background-color:#e8f4f8; font-weight:bold;'>
-                    <td colspan='12'>Final Battery Capacity</td>
-                    <td class='value' colspan='2'>{final_battery_capacity_ah:.0f} Ah</td>
-                </tr>
-                <tr style='background-color:#e8f4f8; font-weight:bold;'>
-                    <td colspan='12'>Vehicle Range</td>
-                    <td class='value' colspan='2'>{vehicle_range_total:.0f} km</td>
-                </tr>
-            </table>
-            """
-            self.output_text.setHtml(html)
-            self.statusBar().showMessage('EV Output values computed successfully')
+            cell_texts = ev_output_cell_texts(locals(), slab_data)
+            if len(self._ev_output_cache) >= EV_OUTPUT_CACHE_SIZE:
+                del self._ev_output_cache[next(iter(self._ev_output_cache))]
+            self._ev_output_cache[ev] = cell_texts
+            self._present_output(partial(self._display_ev_output, ev, cell_texts))
+            self._status.showMessage('EV Output values computed successfully')
         else:
-            # UGV - Comprehensive output calculations
-            # Get UGV-specific parameters
-            num_wheels = self.ugv_num_wheels_input.value()
-            num_powered_wheels = self.ugv_num_powered_wheels_input.value()
-            track_width = self.ugv_track_width_input.value()
-            skid_coefficient = self.ugv_skid_coefficient_input.value()
-            spin_angular_rad = self.ugv_spin_angular_rad_input.value()
-            spin_angular_deg = self.ugv_spin_angular_deg_input.value()
+            # UGV - Comprehensive output calculations (UGV-specific parameters were read above)
+            # Reciprocals taken once and multiplied through below
+            inv_powered_wheels = 1.0 / num_powered_wheels
+            inv_gear_ratio = 1.0 / gear_ratio if gear_ratio > 0 else 0.0
             
             # --- PER MOTOR OUTPUT POWER ---
-            per_motor_output_max = ((F_drag_max + F_roll) * (max_speed * 0.2777778))/(gear_efficiency * num_powered_wheels)
-            per_motor_output_slope = ((F_drag_slope + F_roll + F_climb) * (slope_speed * 0.2777778))/(gear_efficiency * num_powered_wheels)
+            max_speed_ms = max_speed * KMH_TO_MS
+            slope_speed_ms = slope_speed * KMH_TO_MS
+            per_motor_output_max = ((F_drag_max + F_roll) * max_speed_ms)/gear_efficiency * inv_powered_wheels
+            per_motor_output_slope = ((F_drag_slope + F_roll + F_climb) * slope_speed_ms)/gear_efficiency * inv_powered_wheels
             per_motor_output_accel = (term1 + term2 + term3)/gear_efficiency
             
             # --- PER MOTOR TORQUE AND RPM ---
-            per_motor_torque_max = (per_motor_output_max * 60)/(2 * math.pi * rpm_motor_max)
-            per_motor_torque_accel = (per_motor_output_accel * 60)/(2 * math.pi * rpm_motor_accel)
-            per_motor_torque_slope = (per_motor_output_slope * 60)/(2 * math.pi * rpm_motor_slope)
+            per_motor_torque_max = (per_motor_output_max * 60)/(math.tau * rpm_motor_max)
+            per_motor_torque_accel = (per_motor_output_accel * 60)/(math.tau * rpm_motor_accel)
+            per_motor_torque_slope = (per_motor_output_slope * 60)/(math.tau * rpm_motor_slope)
             
             # --- POWER OUTPUT PER WHEELS (Powered wheels only) ---
             per_wheel_power_max = per_motor_output_max * gear_efficiency
             per_wheel_power_accel = per_motor_output_accel * gear_efficiency
             per_wheel_power_slope = per_motor_output_slope * gear_efficiency
             # --- TORQUE AND RPM PER WHEEL (Powered wheels only) ---
-            per_wheel_torque_max = (per_wheel_power_max * 60)/(2 * math.pi * rpm_wheel_max)
-            per_wheel_torque_accel = (per_wheel_power_accel * 60)/(2 * math.pi * rpm_wheel_accel)
-            per_wheel_torque_slope = (per_wheel_power_slope * 60)/(2 * math.pi * rpm_wheel_slope)
+            per_wheel_torque_max = (per_wheel_power_max * 60)/(math.tau * rpm_wheel_max)
+            per_wheel_torque_accel = (per_wheel_power_accel * 60)/(math.tau * rpm_wheel_accel)
+            per_wheel_torque_slope = (per_wheel_power_slope * 60)/(math.tau * rpm_wheel_slope)
             
             # --- SKID PARAMETERS AND POWER ESTIMATION ---
             # Total Skid Friction Force
             total_skid_friction = calculated_gvw * 9.81 * skid_coefficient
             
             # Per wheel Skid Friction Force
-            per_wheel_skid_friction = total_skid_friction / num_powered_wheels 
+            per_wheel_skid_friction = total_skid_friction * inv_powered_wheels
             
             # Wheel linear speed during turning
             wheel_linear_speed_turn = spin_angular_rad * track_width / 2
@@ -2339,122 +3144,14 @@ class EVSimulationApp(QMainWindow):
             total_wheel_torque = total_skid_friction * wheel_radius
             
             # Total Motor Wheel Torque (accounting for gear efficiency)
-            total_motor_wheel_torque = total_wheel_torque / gear_ratio 
+            total_motor_wheel_torque = total_wheel_torque * inv_gear_ratio
             
             # Per Motor Wheel Torque
-            per_motor_wheel_torque = total_motor_wheel_torque / num_powered_wheels 
-            
-            html = f"""
-            <style>
-                table.data {{ width:100%; border-collapse:collapse; margin:5px 0; border:1px solid #999; }}
-                table.data th, table.data td {{ padding:8px; text-align:left; border:1px solid #999; font-family:Segoe UI; font-size:15px; }}
-                table.data th {{ background-color:#f2f2f2; font-weight:bold; }}
-                table.data td.value {{ text-align:right; }}
-                table.layout {{ width:100%; border:none; border-collapse:collapse; }}
-                table.layout td {{ vertical-align:top; padding:10px; border:none; }}
-                table.layout td:first-child {{ border-right: 2px solid #ddd; padding-right:15px; }}
-                table.layout td:last-child {{ padding-left:15px; }}
-                h3 {{ margin:4px 0; font-family:Segoe UI; font-size:16px; font-weight:bold; }}
-                h4 {{ margin:8px 0 4px 0; font-family:Segoe UI; font-size:15px; color:#2c3e50; font-weight:bold; }}
-                .category {{ background-color: #dc3545; color: white; padding: 8px; margin: 15px 0 5px 0; font-weight: bold; font-size: 15px; border-radius: 4px; }}
-            </style>
-            
-            <h3>UGV Computed Output Values</h3>
-            
-            <div class='category'>Force Calculations & Acceleration Analysis</div>
-            <table class='layout'>
-                <tr>
-                    <td width='50%'>
-                        <h4>Force Calculations</h4>
-                        <table class='data'>
-                            <tr><th>Force Type</th><th class='value'>Value (N)</th></tr>
-                            <tr><td>F<sub>drag-const</sub></td><td class='value'>{F_drag_max:.2f}</td></tr>
-                            <tr><td>F<sub>drag-slope</sub></td><td class='value'>{F_drag_slope:.2f}</td></tr>
-                            <tr><td>F<sub>roll</sub></td><td class='value'>{F_roll:.2f}</td></tr>
-                            <tr><td>F<sub>climb</sub></td><td class='value'>{F_climb:.2f}</td></tr>
-                        </table>
-                    </td>
-                    <td width='50%'>
-                        <h4>Vehicle Acceleration Power</h4>
-                        <table class='data'>
-                            <tr><th>Parameter</th><th class='value'>Value</th></tr>
-                            <tr><td>Vehicle Speed for Motor Base Speed RPM (m/s)</td><td class='value'>{vehicle_speed_motor_base:.3f}</td></tr>
-                            <tr><td>Vehicle End of Acc Speed (m/s)</td><td class='value'>{Vehicle_End_Acc_Speed:.3f}</td></tr>
-                            <tr><td>Term1</td><td class='value'>{term1:.0f}</td></tr>
-                            <tr><td>Term2</td><td class='value'>{term2:.0f}</td></tr>
-                            <tr><td>Term3</td><td class='value'>{term3:.0f}</td></tr>
-                            <tr><td><b>Required Power for Acceleration</b></td><td class='value'><b>{req_power_accel:.0f}</b></td></tr>
-                        </table>
-                    </td>
-                </tr>
-            </table>
-            
-            <div class='category'>Motor Performance</div>
-            <table class='layout'>
-                <tr>
-                    <td width='50%'>
-                        <h4>Per Motor Output Power</h4>
-                        <table class='data'>
-                            <tr><th>Scenario</th><th class='value'>Power (W)</th></tr>
-                            <tr><td>Zero Gradient Max Speed Power</td><td class='value'>{per_motor_output_max:.0f}</td></tr>
-                            <tr><td>Max Slope- Max Slope Speed Power</td><td class='value'>{per_motor_output_slope:.0f}</td></tr>
-                            <tr><td>Acceleration Power</td><td class='value'>{per_motor_output_accel:.0f}</td></tr>
-                        </table>
-                    </td>
-                    <td width='50%'>
-                        <h4>Per Motor Torque and RPM</h4>
-                        <table class='data'>
-                            <tr><th>Scenario</th><th class='value'>RPM</th><th class='value'>Torque (Nm)</th></tr>
-                            <tr><td>Zero Gradient Max Speed</td><td class='value'>{rpm_motor_max:.0f}</td><td class='value'>{per_motor_torque_max:.2f}</td></tr>
-                            <tr><td>Acceleration</td><td class='value'>{rpm_motor_accel:.0f}</td><td class='value'>{per_motor_torque_accel:.2f}</td></tr>
-                            <tr><td>Max Slope- Max Slope Speed</td><td class='value'>{rpm_motor_slope:.0f}</td><td class='value'>{per_motor_torque_slope:.2f}</td></tr>
-                        </table>
-                    </td>
-                </tr>
-            </table>
+            per_motor_wheel_torque = total_motor_wheel_torque * inv_powered_wheels
             
-            <div class='category'>Wheel Performance</div>
-            <table class='layout'>
-                <tr>
-                    <td width='50%'>
-                        <h4>Power Output Per Wheels</h4>
-                        <table class='data'>
-                            <tr><th>Scenario</th><th class='value'>Power (W)</th></tr>
-                            <tr><td>Zero Gradient Max Speed Power</td><td class='value'>{per_wheel_power_max:.0f}</td></tr>
-                            <tr><td>Acceleration Power</td><td class='value'>{per_wheel_power_accel:.0f}</td></tr>
-                            <tr><td>Max Slope- Max Slope Speed Power</td><td class='value'>{per_wheel_power_slope:.0f}</td></tr>
-                        </table>
-                    </td>
-                    <td width='50%'>
-                        <h4>Torque and RPM Per Wheel</h4>
-                        <table class='data'>
-                            <tr><th>Scenario</th><th class='value'>RPM</th><th class='value'>Torque (Nm)</th></tr>
-                            <tr><td>Zero Gradient Max Speed Torque</td><td class='value'>{rpm_wheel_max:.0f}</td><td class='value'>{per_wheel_torque_max:.0f}</td></tr>
-                            <tr><td>Acceleration Torque</td><td class='value'>{rpm_wheel_accel:.0f}</td><td class='value'>{per_wheel_torque_accel:.0f}</td></tr>
-                            <tr><td>Max Slope- Max Slope Speed Torque</td><td class='value'>{rpm_wheel_slope:.0f}</td><td class='value'>{per_wheel_torque_slope:.0f}</td></tr>
-                        </table>
-                    </td>
-                </tr>
-            </table>
-            
-            <div class='category'>Skid Parameters & Power Estimation</div>
-            <h4>Skid Parameters and Power Estimation</h4>
-            <table class='data'>
-                <tr><th>Parameter</th><th class='value'>Value</th><th class='value'>Unit</th></tr>
-                <tr><td>Total Skid Friction Force (F<sub>skid</sub>)</td><td class='value'>{total_skid_friction:.0f}</td><td class='value'>N</td></tr>
-                <tr><td>Per Wheel Skid Friction Force (F<sub>side</sub>)</td><td class='value'>{per_wheel_skid_friction:.0f}</td><td class='value'>N</td></tr>
-                <tr><td>Wheel Linear Speed During Turning (v<sub>wheel</sub>)</td><td class='value'>{wheel_linear_speed_turn:.2f}</td><td class='value'>m/s</td></tr>
-                <tr><td>Power for Each Motor (P<sub>turn</sub>)</td><td class='value'>{power_per_motor_turn:.0f}</td><td class='value'>Watts</td></tr>
-                <tr><td>Total Power for All Motors (P<sub>total</sub>)</td><td class='value'>{total_power_turn:.0f}</td><td class='value'>Watts</td></tr>
-                <tr><td>Wheel RPM</td><td class='value'>{wheel_rpm_turn:.0f}</td><td class='value'>rpm</td></tr>
-                <tr><td>Vehicle Rotational Degree per Second</td><td class='value'>{vehicle_rot_deg_per_sec:.0f}</td><td class='value'>degree/sec</td></tr>
-                <tr><td>Total Wheel Torque</td><td class='value'>{total_wheel_torque:.0f}</td><td class='value'>Nm</td></tr>
-                <tr><td>Total Motor Wheel Torque</td><td class='value'>{total_motor_wheel_torque:.2f}</td><td class='value'>Nm</td></tr>
-                <tr><td>Per Motor Wheel Torque</td><td class='value'>{per_motor_wheel_torque:.2f}</td><td class='value'>Nm</td></tr>
-            </table>
-            """
-            self.output_text.setHtml(html)
-            self.statusBar().showMessage('UGV Output values computed successfully')
+            html = UGV_OUTPUT_TEMPLATE.format_map(locals())
+            self._present_output(partial(self._display_ugv_output, html))
+            self._status.showMessage('UGV Output values computed successfully')
     
     def generate_graph_simulation_data(self):
         """
@@ -2509,18 +3206,12 @@ class EVSimulationApp(QMainWindow):
         # Generate time steps starting from init_time
         time_steps = np.arange(init_time, init_time + duration + dt, dt)
         
-        # Prepare data storage
-        data = []
+        # Prepare data storage - one preallocated contiguous row per output column
+        num_steps = len(time_steps)
+        step_values = np.empty((len(GRAPH_SIM_STEP_COLUMNS), num_steps))
         
         # Get constants needed for calculations
-        gvw = EV_DEFAULTS['gvw']
-        gear_efficiency = EV_DEFAULTS['gear_efficiency'] / 100.0
-        gear_ratio = EV_DEFAULTS['gear_ratio']
-        wheel_radius = EV_DEFAULTS['wheel_radius']
-        cr = EV_DEFAULTS['cr']
-        cd = EV_DEFAULTS['cd']
-        air_density = EV_DEFAULTS['air_density']
-        frontal_area = EV_DEFAULTS['frontal_area']
+        gvw, gear_efficiency, gear_ratio, wheel_radius, cr, cd, air_density, frontal_area = GRAPH_SIM_VEHICLE
         
         # Get motor parameters from selection
         motor_key = self.motor_combo.currentText()
@@ -2562,6 +3253,17 @@ class EVSimulationApp(QMainWindow):
         F_net = init_fnet
         acceleration = init_accel
         
+        # Loop-invariant terms, hoisted so each step only does the speed-dependent math.
+        # Each is the leading sub-expression of the original formula, so results are unchanged.
+        two_pi = TWO_PI
+        rpm_denominator = TWO_PI * wheel_radius * 0.001 * 60
+        constant_power_numerator = power_per_motor * 60
+        drag_area = cd * air_density * frontal_area
+        F_roll_const = cr * gvw * 9.81
+        F_climb_const = gvw * 9.81 * math.sin(gradient_deg * DEG_TO_RAD)
+        
+        previous_speed_ms = previous_acceleration = None  # State of the previous step, for the steady-state check
+        
         # ⚠️ LOCKED: Iterative integration loop - DO NOT CHANGE
         for i, t in enumerate(time_steps):
             # For t=0, we already have initial values set above
@@ -2570,11 +3272,11 @@ class EVSimulationApp(QMainWindow):
                 # ⚠️ CRITICAL: Euler integration step
                 # Update speed using previous acceleration: v_new = v_old + a * dt
                 current_speed_ms = current_speed_ms + (acceleration * dt)
-                current_speed_ms = max(0, current_speed_ms)  # Prevent negative
+                current_speed_ms = current_speed_ms if current_speed_ms > 0 else 0  # Prevent negative (same result as max(0, v))
                 current_speed_kmh = current_speed_ms * 3.6
                 
                 # Calculate Motor Speed (RPM) from current vehicle speed
-                motor_speed_rpm = (current_speed_kmh * gear_ratio) / (2 * 3.14159 * wheel_radius * 0.001 * 60)
+                motor_speed_rpm = (current_speed_kmh * gear_ratio) / rpm_denominator
                 
                 # Calculate Total Motor Torque based on selected motor and RPM
                 # Constant torque below base RPM, constant power above
@@ -2582,21 +3284,21 @@ class EVSimulationApp(QMainWindow):
                     torque = torque_per_motor  # Constant torque region
                 else:
                     # Constant power region: T = (P × 60) / (2π × RPM)
-                    torque = (power_per_motor * 60) / (2 * 3.14159 * motor_speed_rpm)
+                    torque = constant_power_numerator / (two_pi * motor_speed_rpm)
                 
                 total_motor_torque = torque * init_num_power_wheels
                 
                 # Per motor calculations
                 per_motor_torque = total_motor_torque / init_num_power_wheels
-                per_motor_power = (2 * 3.14159 * motor_speed_rpm * per_motor_torque) / 60
+                per_motor_power = (two_pi * motor_speed_rpm * per_motor_torque) / 60
                 
                 # Tractive force
                 F_tractive = (total_motor_torque * gear_efficiency * gear_ratio) / wheel_radius
                 
                 # Resistance forces
-                F_roll = cr * gvw * 9.81
-                F_drag = cd * air_density * frontal_area * current_speed_kmh * current_speed_kmh * 0.03858025308642
-                F_climb = gvw * 9.81 * math.sin(gradient_deg * 0.01745329)
+                F_roll = F_roll_const
+                F_drag = drag_area * current_speed_kmh * current_speed_kmh * 0.03858025308642
+                F_climb = F_climb_const
                 
                 # Total load and net force
                 F_load = F_roll + F_drag + F_climb
@@ -2605,64 +3307,100 @@ class EVSimulationApp(QMainWindow):
                 # Acceleration for NEXT step
                 acceleration = F_net / gvw
             
-            # Store data
-            data.append({
-                'Time': round(t, 1),
-                'Vehicle Speed (m/s)': round(current_speed_ms, 3),
-                'Vehicle Speed (Kmph)': round(current_speed_kmh, 2),
-                'Motor Speed (RPM)': round(motor_speed_rpm, 1),
-                'Gradient (Degree)': gradient_deg,
-                'Mode': mode_display,
-                'Total Motor Torque (Nm)': round(total_motor_torque, 2),
-                'Total Number of Power Wheels': init_num_power_wheels,
-                'PerMotor Torque (Nm)': round(per_motor_torque, 2),
-                'PerMotor Power (Watts)': round(per_motor_power, 1),
-                'Motoring Tractive Force F_Tractive (N)': round(F_tractive, 2),
-                'Froll (N)': round(F_roll, 2),
-                'Fdrag (N)': round(F_drag, 2),
-                'Fclimb (N)': round(F_climb, 2),
-                'F_Load Resistance (N)': round(F_load, 2),
-                'Net Force F_Net (N)': round(F_net, 2),
-                'Vehicle Acceleration (m/s)': round(acceleration, 3)
-            })
+            # Store data (order matches GRAPH_SIM_STEP_COLUMNS)
+            step_values[:, i] = (
+                round(t, 1),
+                round(current_speed_ms, 3),
+                round(current_speed_kmh, 2),
+                round(motor_speed_rpm, 1),
+                round(total_motor_torque, 2),
+                round(per_motor_torque, 2),
+                round(per_motor_power, 1),
+                round(F_tractive, 2),
+                round(F_roll, 2),
+                round(F_drag, 2),
+                round(F_climb, 2),
+                round(F_load, 2),
+                round(F_net, 2),
+                round(acceleration, 3)
+            )
+            
+            # Steady state reached bit for bit: speed and acceleration repeat the previous step
+            # exactly, so every later step computes this same row - copy it and only fill in time
+            if current_speed_ms == previous_speed_ms and acceleration == previous_acceleration:
+                step_values[1:, i + 1:] = step_values[1:, i, None]
+                step_values[0, i + 1:] = [round(t, 1) for t in time_steps[i + 1:]]
+                break
+            previous_speed_ms = current_speed_ms
+            previous_acceleration = acceleration
+        
+        # Column-oriented (SoA) results: each column is a contiguous row view into the
+        # preallocated buffer, handed to the plots, table model and export without copying
+        step_columns = dict(zip(GRAPH_SIM_STEP_COLUMNS, step_values))
+        constant_columns = {
+            'Gradient (Degree)': np.full(num_steps, gradient_deg),
+            'Mode': np.full(num_steps, mode_display, dtype=object),
+            'Total Number of Power Wheels': np.full(num_steps, init_num_power_wheels),
+        }
+        data = {name: step_columns.get(name, constant_columns.get(name)) for name in GRAPH_SIM_COLUMNS}
         
         # Store data for export
         self.graph_simulation_data = data
         
+        # Cells the march stored as a Python int (speed clamped to 0, integer motor torque in the
+        # constant torque region) are shown without '.0'; the float buffer keeps no types, so the
+        # rows are recovered from the finished columns. RPM is rounded to 0.1, so a row that rounds
+        # to exactly base_rpm counts as constant torque only if it holds that torque.
+        speed_ms = step_columns['Vehicle Speed (m/s)'][1:]
+        int_rows = {'Vehicle Speed (m/s)': (np.flatnonzero(speed_ms == 0) + 1).tolist()}
+        if isinstance(torque_per_motor, int):
+            rpm = step_columns['Motor Speed (RPM)'][1:]
+            constant_torque = (rpm < base_rpm) | (
+                (rpm == base_rpm)
+                & (step_columns['Total Motor Torque (Nm)'][1:] == torque_per_motor * init_num_power_wheels))
+            int_rows['Total Motor Torque (Nm)'] = (np.flatnonzero(constant_torque) + 1).tolist()
+        
         # Populate table
-        self.populate_graph_table(data)
+        self.populate_graph_table(data, int_rows)
         
-        # Plot in Speed, Power, Forces, and Motor tabs
-        self.plot_graph_simulation_speed(data)
-        self.plot_graph_simulation_power(data)
-        self.plot_graph_simulation_forces(data)
-        self.plot_graph_simulation_motor(data)
+        # Plot the Speed, Power, Forces, and Motor tabs - only the visible one is drawn now,
+        # the others the first time they are selected, with this run's tick interval
+        xtick_interval = int(self.graph_xtick_interval.value())
+        self._pending_graph_plots = {
+            'speed_canvas': partial(self.plot_graph_simulation_speed, data, xtick_interval),
+            'power_canvas': partial(self.plot_graph_simulation_power, data, xtick_interval),
+            'forces_canvas': partial(self.plot_graph_simulation_forces, data, xtick_interval),
+            'motor_canvas': partial(self.plot_graph_simulation_motor, data, xtick_interval),
+        }
+        self._flush_graph_plot(self.tab_widget.currentIndex())
         
-        self.statusBar().showMessage(f'Generated {len(data)} data points - All graph tabs updated with table data')
+        self._status.showMessage(f'Generated {num_steps} data points - All graph tabs updated with table data')
     
-    def populate_graph_table(self, data):
+    def _flush_graph_plot(self, index):
+        """Draw the graph tab at index if a simulation plot is still waiting for it"""
+        page = self.tab_widget.widget(index)
+        attr = self._graph_canvas_pages.get(page)
+        plot = self._pending_graph_plots.pop(attr, None)
+        if plot is None:
+            return
+        if getattr(self, attr) is None:
+            canvas = PlotCanvas(page, width=8, height=6)
+            page.layout().addWidget(canvas)
+            setattr(self, attr, canvas)
+        plot()
+    
+    def populate_graph_table(self, data, int_rows=None):
         """Populate the graph data table with calculated values"""
         if not data:
             return
         
-        # Set up table
-        headers = list(data[0].keys())
-        self.graph_data_table.setColumnCount(len(headers))
-        self.graph_data_table.setRowCount(len(data))
-        self.graph_data_table.setHorizontalHeaderLabels(headers)
-        
-        # Populate data
-        for row_idx, row_data in enumerate(data):
-            for col_idx, header in enumerate(headers):
-                value = row_data[header]
-                item = QTableWidgetItem(str(value))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.graph_data_table.setItem(row_idx, col_idx, item)
+        # Hand the columns to the model - one reset instead of a QTableWidgetItem per cell
+        self.graph_table_model.set_columns(data, int_rows)
         
         # Resize columns to content
         self.graph_data_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
     
-    def plot_graph_simulation_speed(self, data):
+    def plot_graph_simulation_speed(self, data, xtick_interval=None):
         """
         Plot graph simulation speed data in the Speed tab.
         This uses data from the Data Table (generate_graph_simulation_data).
@@ -2670,13 +3408,13 @@ class EVSimulationApp(QMainWindow):
         if not data:
             return
         
-        # Extract time and speed data from table
-        time = [row['Time'] for row in data]
-        speed_kmh = [row['Vehicle Speed (Kmph)'] for row in data]
+        # Time and speed columns from table
+        time = data['Time']
+        speed_kmh = data['Vehicle Speed (Kmph)']
         
-        print(f"DEBUG: Plotting {len(data)} data points from table")
+        print(f"DEBUG: Plotting {len(time)} data points from table")
         print(f"DEBUG: Time range: {time[0]} to {time[-1]} seconds")
-        print(f"DEBUG: Speed range: {speed_kmh[0]} to {max(speed_kmh)} km/h")
+        print(f"DEBUG: Speed range: {speed_kmh[0]} to {speed_kmh.max()} km/h")
         
         # Clear and plot on speed canvas
         self.speed_canvas.fig.clear()
@@ -2687,8 +3425,9 @@ class EVSimulationApp(QMainWindow):
         
         # Set custom X-axis ticks based on user input
         import numpy as np
-        xtick_interval = int(self.graph_xtick_interval.value())
-        max_time = max(time)
+        if xtick_interval is None:
+            xtick_interval = int(self.graph_xtick_interval.value())
+        max_time = time[-1]  # Time column is ascending, so the last sample is the maximum
         xticks = np.arange(0, max_time + xtick_interval, xtick_interval)
         ax.set_xticks(xticks)
         
@@ -2699,11 +3438,11 @@ class EVSimulationApp(QMainWindow):
         ax.legend(loc='lower right', fontsize=9)
         ax.grid(True, alpha=0.3, linestyle='--')
         
-        # Adjust and draw
-        self.speed_canvas.fig.tight_layout()
-        self.speed_canvas.draw()
+        # Draw (the figure's constrained layout places the axes)
+        self.speed_canvas.draw_idle()
+        self._dirty_canvases.add(self.speed_canvas)
     
-    def plot_graph_simulation_power(self, data):
+    def plot_graph_simulation_power(self, data, xtick_interval=None):
         """
         Plot graph simulation power data in the Power tab.
         This uses data from the Data Table (generate_graph_simulation_data).
@@ -2711,9 +3450,9 @@ class EVSimulationApp(QMainWindow):
         if not data:
             return
         
-        # Extract time and power data from table
-        time = [row['Time'] for row in data]
-        power_watts = [row['PerMotor Power (Watts)'] for row in data]
+        # Time and power columns from table
+        time = data['Time']
+        power_watts = data['PerMotor Power (Watts)']
         
         # Clear and plot on power canvas
         self.power_canvas.fig.clear()
@@ -2724,8 +3463,9 @@ class EVSimulationApp(QMainWindow):
         
         # Set custom X-axis ticks based on user input
         import numpy as np
-        xtick_interval = int(self.graph_xtick_interval.value())
-        max_time = max(time)
+        if xtick_interval is None:
+            xtick_interval = int(self.graph_xtick_interval.value())
+        max_time = time[-1]  # Time column is ascending, so the last sample is the maximum
         xticks = np.arange(0, max_time + xtick_interval, xtick_interval)
         ax.set_xticks(xticks)
         
@@ -2736,11 +3476,11 @@ class EVSimulationApp(QMainWindow):
         ax.legend(loc='upper right', fontsize=9)
         ax.grid(True, alpha=0.3, linestyle='--')
         
-        # Adjust and draw
-        self.power_canvas.fig.tight_layout()
-        self.power_canvas.draw()
+        # Draw (the figure's constrained layout places the axes)
+        self.power_canvas.draw_idle()
+        self._dirty_canvases.add(self.power_canvas)
     
-    def plot_graph_simulation_forces(self, data):
+    def plot_graph_simulation_forces(self, data, xtick_interval=None):
         """
         Plot graph simulation forces data in the Forces tab.
         This uses data from the Data Table (generate_graph_simulation_data).
@@ -2748,12 +3488,12 @@ class EVSimulationApp(QMainWindow):
         if not data:
             return
         
-        # Extract time and force data from table
-        time = [row['Time'] for row in data]
-        f_tractive = [row['Motoring Tractive Force F_Tractive (N)'] for row in data]
-        f_roll = [row['Froll (N)'] for row in data]
-        f_drag = [row['Fdrag (N)'] for row in data]
-        f_load = [row['F_Load Resistance (N)'] for row in data]
+        # Time and force columns from table
+        time = data['Time']
+        f_tractive = data['Motoring Tractive Force F_Tractive (N)']
+        f_roll = data['Froll (N)']
+        f_drag = data['Fdrag (N)']
+        f_load = data['F_Load Resistance (N)']
         
         # Clear and plot on forces canvas
         self.forces_canvas.fig.clear()
@@ -2767,8 +3507,9 @@ class EVSimulationApp(QMainWindow):
         
         # Set custom X-axis ticks based on user input
         import numpy as np
-        xtick_interval = int(self.graph_xtick_interval.value())
-        max_time = max(time)
+        if xtick_interval is None:
+            xtick_interval = int(self.graph_xtick_interval.value())
+        max_time = time[-1]  # Time column is ascending, so the last sample is the maximum
         xticks = np.arange(0, max_time + xtick_interval, xtick_interval)
         ax.set_xticks(xticks)
         
@@ -2779,11 +3520,11 @@ class EVSimulationApp(QMainWindow):
         ax.legend(fontsize=8, loc='upper right')
         ax.grid(True, alpha=0.3, linestyle='--')
         
-        # Adjust and draw
-        self.forces_canvas.fig.tight_layout()
-        self.forces_canvas.draw()
+        # Draw (the figure's constrained layout places the axes)
+        self.forces_canvas.draw_idle()
+        self._dirty_canvases.add(self.forces_canvas)
     
-    def plot_graph_simulation_motor(self, data):
+    def plot_graph_simulation_motor(self, data, xtick_interval=None):
         """
         Plot graph simulation motor data in the Motor tab.
         This uses data from the Data Table (generate_graph_simulation_data).
@@ -2792,18 +3533,19 @@ class EVSimulationApp(QMainWindow):
         if not data:
             return
         
-        # Extract time and motor data from table
-        time = [row['Time'] for row in data]
-        motor_rpm = [row['Motor Speed (RPM)'] for row in data]
-        motor_torque = [row['Total Motor Torque (Nm)'] for row in data]
+        # Time and motor columns from table
+        time = data['Time']
+        motor_rpm = data['Motor Speed (RPM)']
+        motor_torque = data['Total Motor Torque (Nm)']
         
         # Clear and plot on motor canvas
         self.motor_canvas.fig.clear()
         
         # Get X-axis tick settings
         import numpy as np
-        xtick_interval = int(self.graph_xtick_interval.value())
-        max_time = max(time)
+        if xtick_interval is None:
+            xtick_interval = int(self.graph_xtick_interval.value())
+        max_time = time[-1]  # Time column is ascending, so the last sample is the maximum
         xticks = np.arange(0, max_time + xtick_interval, xtick_interval)
         
         # Top subplot - Motor Speed (RPM)
@@ -2825,9 +3567,9 @@ class EVSimulationApp(QMainWindow):
         ax2.legend(loc='upper right', fontsize=8)
         ax2.grid(True, alpha=0.3, linestyle='--')
         
-        # Adjust and draw
-        self.motor_canvas.fig.tight_layout()
-        self.motor_canvas.draw()
+        # Draw (the figure's constrained layout places the axes)
+        self.motor_canvas.draw_idle()
+        self._dirty_canvases.add(self.motor_canvas)
     
     def show_about(self):
         """Show about dialog"""
@@ -2862,13 +3604,100 @@ class EVSimulationApp(QMainWindow):
         # Close button
         from PyQt6.QtWidgets import QPushButton
         close_btn = QPushButton('Close')
-        close_btn.setStyleSheet('padding: 8px; background-color: #2196F3; color: white; border-radius: 4px;')
+        style_button(close_btn, 'aboutCloseButton')
         close_btn.clicked.connect(dialog.accept)
         layout.addWidget(close_btn)
         
         dialog.setLayout(layout)
         dialog.exec()
     
+    def _add_spin(self, form, prefix, suffix, label, value_range, value, decimals, step):
+        """Add a labelled parameter spin box as a form row and store it as self.<prefix>_<suffix>"""
+        spin_box = QSpinBox() if decimals is None else QDoubleSpinBox()
+        # Defaults are applied silently; derived fields are refreshed once after the build
+        with QSignalBlocker(spin_box):
+            spin_box.setRange(*value_range)
+            spin_box.setValue(value)
+            if decimals is not None:
+                spin_box.setDecimals(decimals)
+            spin_box.setSingleStep(step)
+        form.addRow(label, spin_box)
+        setattr(self, f'{prefix}_{suffix}', spin_box)
+        return spin_box
+    
+    def _set_calculated(self, spin_box):
+        """Make a spin box a read-only calculated field with the grey background"""
+        spin_box.setReadOnly(True)
+        spin_box.setPalette(build_read_only_palette())
+    
+    def _build_vehicle_params(self, prefix, param_groups):
+        """Build an EV or UGV parameter group box; its inputs are stored as self.<prefix>_<suffix>"""
+        params_group = QGroupBox(f'{prefix.upper()} Parameters')
+        main_layout = QVBoxLayout()
+        
+        for title, combo_specs, spin_specs in param_groups:
+            group = QGroupBox(title)
+            form = QFormLayout()
+            for suffix, label, items, current in combo_specs:
+                combo = QComboBox()
+                with QSignalBlocker(combo):
+                    combo.addItems(items)
+                    combo.setCurrentText(current)
+                form.addRow(label, combo)
+                setattr(self, f'{prefix}_{suffix}', combo)
+            for spec in spin_specs:
+                self._add_spin(form, prefix, *spec)
+            group.setLayout(form)
+            main_layout.addWidget(group)
+        for suffix in ('kerb_weight_input', 'gvw_input'):  # Calculated fields
+            self._set_calculated(getattr(self, f'{prefix}_{suffix}'))
+        
+        # Connect signals for auto-calculation of kerb_weight and gvw
+        # All three inputs funnel into one single-shot timer so a burst of edits
+        # only triggers a single recompute
+        weights_timer = QTimer(self)
+        weights_timer.setSingleShot(True)
+        weights_timer.setInterval(150)
+        weights_timer.timeout.connect(getattr(self, f'update_{prefix}_calculated_weights'))
+        for suffix in ('battery_weight_input', 'vehicle_weight_input', 'passenger_weight_input'):
+            getattr(self, f'{prefix}_{suffix}').valueChanged.connect(lambda _: weights_timer.start())
+        setattr(self, f'_{prefix}_weights_timer', weights_timer)
+        
+        # Reset to Defaults button
+        reset_btn = QPushButton('🔄 Reset to Default Values')
+        style_button(reset_btn, 'vehicleResetButton')  # Styled by BUTTON_STYLESHEET
+        reset_btn.clicked.connect(getattr(self, f'reset_{prefix}_defaults'))
+        main_layout.addWidget(reset_btn)
+        
+        params_group.setLayout(main_layout)
+        return params_group
+    
+    def _ensure_ugv_params_group(self):
+        """Build the UGV parameter group the first time UGV is selected and return it"""
+        if self.ugv_params_group is not None:
+            return self.ugv_params_group
+        
+        # UGV Parameters (Shared + UGV-Specific)
+        self.ugv_params_group = self._build_vehicle_params('ugv', UGV_PARAM_GROUPS)
+        self.ugv_params_group.setVisible(False)
+        self._params_layout.insertWidget(self._params_layout.indexOf(self.ev_params_group) + 1,
+                                         self.ugv_params_group)
+        
+        # Wire the new widgets the same way init_ui wires the EV ones
+        self._ugv_reset_plan = [(getattr(self, f'ugv_{attr}'), key, setter)
+                                for attr, key, setter in UGV_RESET_FIELDS]
+        self._ugv_compute_inputs = tuple(getattr(self, f'ugv_{suffix}') for suffix in UGV_COMPUTE_INPUTS)
+        self.ugv_gradeability_input.valueChanged.connect(lambda value: self._cache_sin_grade('ugv', value))
+        self._cache_sin_grade('ugv', self.ugv_gradeability_input.value())
+        self.update_ugv_calculated_weights()
+        for widget in self.ugv_params_group.findChildren(QWidget):
+            widget.setMouseTracking(False)
+        for spin_box in self.ugv_params_group.findChildren(QAbstractSpinBox):
+            spin_box.setKeyboardTracking(False)
+            if spin_box.isReadOnly():
+                spin_box.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.NoButtons)
+        return self.ugv_params_group
+    
     def create_control_panel(self):
         """Create left control panel with scroll area"""
         # Main container
@@ -2878,14 +3707,13 @@ class EVSimulationApp(QMainWindow):
         
         # Vehicle Selection - STICKY at top (outside scroll area)
         self.vehicle_group = QGroupBox('Vehicle Selection')
-        vehicle_layout = QGridLayout()
+        vehicle_layout = QFormLayout()
         
         # Vehicle Type
-        vehicle_layout.addWidget(QLabel('Vehicle Type:'), 0, 0)
         self.vehicle_type_combo = QComboBox()
         self.vehicle_type_combo.addItems(['EV', 'UGV'])
         self.vehicle_type_combo.currentTextChanged.connect(self.on_vehicle_type_changed)
-        vehicle_layout.addWidget(self.vehicle_type_combo, 0, 1)
+        vehicle_layout.addRow('Vehicle Type:', self.vehicle_type_combo)
         
         self.vehicle_group.setLayout(vehicle_layout)
         panel_layout.addWidget(self.vehicle_group)
@@ -2893,6 +3721,7 @@ class EVSimulationApp(QMainWindow):
         # Scrollable area for content
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
+        self.control_scroll_area = scroll_area
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         
         # Content widget inside scroll area
@@ -2901,87 +3730,87 @@ class EVSimulationApp(QMainWindow):
         
         # Runtime Parameters - Separate group for simulation control
         self.runtime_params_group = QGroupBox('Runtime Parameters')
-        runtime_layout = QGridLayout()
+        runtime_layout = QFormLayout()
         
         # Time Step (s) - User customizable
-        runtime_layout.addWidget(QLabel('Time Step (s):'), 0, 0)
         self.time_step_input = QDoubleSpinBox()
         self.time_step_input.setRange(0.01, 10.0)
         self.time_step_input.setValue(0.5)  # Default 0.5 seconds
         self.time_step_input.setDecimals(2)
         self.time_step_input.setSingleStep(0.1)
         self.time_step_input.setToolTip('Time step for simulation data (smaller = more data points, more accurate)')
-        runtime_layout.addWidget(self.time_step_input, 0, 1)
+        runtime_layout.addRow('Time Step (s):', self.time_step_input)
         
         # Graph X-Axis Tick Interval (s) - User customizable
-        runtime_layout.addWidget(QLabel('Graph X-Axis Interval (s):'), 1, 0)
         self.graph_xtick_interval = QDoubleSpinBox()
         self.graph_xtick_interval.setRange(1, 60)
         self.graph_xtick_interval.setValue(5)  # Default 5 seconds (0, 5, 10, 15...)
         self.graph_xtick_interval.setDecimals(0)
         self.graph_xtick_interval.setSingleStep(5)
         self.graph_xtick_interval.setToolTip('X-axis tick interval for graphs (e.g., 5 = 0, 5, 10, 15...)')
-        runtime_layout.addWidget(self.graph_xtick_interval, 1, 1)
+        runtime_layout.addRow('Graph X-Axis Interval (s):', self.graph_xtick_interval)
         
         # Simulation Duration (s) - User customizable
-        runtime_layout.addWidget(QLabel('Simulation Duration (s):'), 2, 0)
         self.simulation_duration_input = QDoubleSpinBox()
         self.simulation_duration_input.setRange(10, 600)
         self.simulation_duration_input.setValue(120)  # Default 120 seconds (2 minutes)
         self.simulation_duration_input.setDecimals(0)
         self.simulation_duration_input.setSingleStep(10)
         self.simulation_duration_input.setToolTip('Total simulation duration in seconds (10-600)')
-        runtime_layout.addWidget(self.simulation_duration_input, 2, 1)
+        runtime_layout.addRow('Simulation Duration (s):', self.simulation_duration_input)
         
         self.runtime_params_group.setLayout(runtime_layout)
         layout.addWidget(self.runtime_params_group)
         
         # Graph Simulation Initial Parameters
         self.graph_sim_params_group = QGroupBox('Graph Simulation Initial Parameters')
-        graph_sim_layout = QGridLayout()
+        graph_sim_layout = QFormLayout()
+        
+        # Spin box edits funnel into one single-shot timer so spinner repeats only trigger
+        # a single recompute of the calculated fields; combo changes still apply immediately
+        self._graph_sim_timer = QTimer(self)
+        self._graph_sim_timer.setSingleShot(True)
+        self._graph_sim_timer.setInterval(150)
+        self._graph_sim_timer.timeout.connect(self.update_graph_sim_calculated_values)
+        schedule_graph_sim_update = lambda _: self._graph_sim_timer.start()
         
         # Gradient
-        graph_sim_layout.addWidget(QLabel('Gradient (°):'), 0, 0)
         self.gradient_input = QDoubleSpinBox()
         self.gradient_input.setRange(-30, 60)
         self.gradient_input.setValue(GRAPH_SIM_DEFAULTS['gradient_deg'])
-        self.gradient_input.valueChanged.connect(self.update_graph_sim_calculated_values)
-        graph_sim_layout.addWidget(self.gradient_input, 0, 1)
+        self.gradient_input.valueChanged.connect(schedule_graph_sim_update)
+        graph_sim_layout.addRow('Gradient (°):', self.gradient_input)
         
         # Mode
-        graph_sim_layout.addWidget(QLabel('Mode:'), 1, 0)
         self.mode_combo = QComboBox()
         self.mode_combo.addItems(['boost', 'eco'])
         self.mode_combo.currentTextChanged.connect(self.update_graph_sim_calculated_values)
-        graph_sim_layout.addWidget(self.mode_combo, 1, 1)
+        graph_sim_layout.addRow('Mode:', self.mode_combo)
         
         # Motor Model Selection
-        graph_sim_layout.addWidget(QLabel('Motor Model:'), 2, 0)
         self.motor_combo = QComboBox()
         self.motor_combo.addItems(['Default', 'GPM35', 'GPM50', 'GPM70', 'Customize'])
         self.motor_combo.currentTextChanged.connect(self.on_motor_selection_changed)
-        graph_sim_layout.addWidget(self.motor_combo, 2, 1)
+        graph_sim_layout.addRow('Motor Model:', self.motor_combo)
         
         # Custom Motor Parameters (hidden by default, shown when "Customize" is selected)
-        graph_sim_layout.addWidget(QLabel('Custom Peak Torque (Nm):'), 3, 0)
         self.custom_peak_torque = QDoubleSpinBox()
         self.custom_peak_torque.setRange(1, 500)
         self.custom_peak_torque.setValue(37)
         self.custom_peak_torque.setDecimals(1)
-        self.custom_peak_torque.valueChanged.connect(self.update_graph_sim_calculated_values)
-        graph_sim_layout.addWidget(self.custom_peak_torque, 3, 1)
+        self.custom_peak_torque.valueChanged.connect(schedule_graph_sim_update)
+        graph_sim_layout.addRow('Custom Peak Torque (Nm):', self.custom_peak_torque)
         
-        graph_sim_layout.addWidget(QLabel('Custom Peak Power (W):'), 4, 0)
         self.custom_peak_power = QDoubleSpinBox()
         self.custom_peak_power.setRange(100, 50000)
         self.custom_peak_power.setValue(2000)
         self.custom_peak_power.setDecimals(0)
-        self.custom_peak_power.valueChanged.connect(self.update_graph_sim_calculated_values)
-        graph_sim_layout.addWidget(self.custom_peak_power, 4, 1)
+        self.custom_peak_power.valueChanged.connect(schedule_graph_sim_update)
+        graph_sim_layout.addRow('Custom Peak Power (W):', self.custom_peak_power)
         
         # Store references for visibility toggle
-        self.custom_torque_label = graph_sim_layout.itemAtPosition(3, 0).widget()
-        self.custom_power_label = graph_sim_layout.itemAtPosition(4, 0).widget()
+        self.custom_torque_label = graph_sim_layout.labelForField(self.custom_peak_torque)
+        self.custom_power_label = graph_sim_layout.labelForField(self.custom_peak_power)
         
         # Hide custom fields by default
         self.custom_torque_label.setVisible(False)
@@ -2990,922 +3819,151 @@ class EVSimulationApp(QMainWindow):
         self.custom_peak_power.setVisible(False)
         
         # Time (s)
-        graph_sim_layout.addWidget(QLabel('Time (s):'), 5, 0)
         self.init_time = QDoubleSpinBox()
         self.init_time.setRange(0, 1000)
         self.init_time.setValue(GRAPH_SIM_DEFAULTS['init_time'])
         self.init_time.setDecimals(1)
         self.init_time.setSingleStep(0.5)
-        graph_sim_layout.addWidget(self.init_time, 5, 1)
+        graph_sim_layout.addRow('Time (s):', self.init_time)
 
         
         # Initial Vehicle Speed (m/s) - BASE VALUE (controls calculated fields)
-        graph_sim_layout.addWidget(QLabel('Initial Vehicle Speed (m/s):'), 6, 0)
         self.init_vehicle_speed_ms = QDoubleSpinBox()
         self.init_vehicle_speed_ms.setRange(0, 100)
         self.init_vehicle_speed_ms.setValue(GRAPH_SIM_DEFAULTS['init_vehicle_speed_ms'])
         self.init_vehicle_speed_ms.setDecimals(3)
         self.init_vehicle_speed_ms.setSingleStep(0.1)
-        self.init_vehicle_speed_ms.valueChanged.connect(self.update_graph_sim_calculated_values)
-        graph_sim_layout.addWidget(self.init_vehicle_speed_ms, 6, 1)
+        self.init_vehicle_speed_ms.valueChanged.connect(schedule_graph_sim_update)
+        graph_sim_layout.addRow('Initial Vehicle Speed (m/s):', self.init_vehicle_speed_ms)
         
         # Initial Motor Speed (RPM) - CALCULATED from vehicle speed and gear ratio
-        graph_sim_layout.addWidget(QLabel('Initial Motor Speed (RPM):'), 7, 0)
         self.init_motor_speed_rpm = QDoubleSpinBox()
         self.init_motor_speed_rpm.setRange(0, 10000)
         self.init_motor_speed_rpm.setValue(GRAPH_SIM_DEFAULTS['init_motor_speed_rpm'])
         self.init_motor_speed_rpm.setDecimals(1)
         self.init_motor_speed_rpm.setSingleStep(10)
-        self.init_motor_speed_rpm.setReadOnly(True)
-        self.init_motor_speed_rpm.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        graph_sim_layout.addWidget(self.init_motor_speed_rpm, 7, 1)
+        self._set_calculated(self.init_motor_speed_rpm)
+        graph_sim_layout.addRow('Initial Motor Speed (RPM):', self.init_motor_speed_rpm)
         
         # Total Number of Power Wheel Motors
-        graph_sim_layout.addWidget(QLabel('Number of Power Wheels:'), 8, 0)
         self.init_num_power_wheels = QSpinBox()
         self.init_num_power_wheels.setRange(1, 8)
         self.init_num_power_wheels.setValue(GRAPH_SIM_DEFAULTS['init_num_power_wheels'])
-        self.init_num_power_wheels.valueChanged.connect(self.update_graph_sim_calculated_values)
-        graph_sim_layout.addWidget(self.init_num_power_wheels, 8, 1)
+        self.init_num_power_wheels.valueChanged.connect(schedule_graph_sim_update)
+        graph_sim_layout.addRow('Number of Power Wheels:', self.init_num_power_wheels)
         
         # Initial Total Motor Torque (Nm) - CALCULATED from mode and motor RPM
-        graph_sim_layout.addWidget(QLabel('Initial Total Motor Torque (Nm):'), 9, 0)
         self.init_total_motor_torque = QDoubleSpinBox()
         self.init_total_motor_torque.setRange(0, 10000)
         self.init_total_motor_torque.setValue(GRAPH_SIM_DEFAULTS['init_total_motor_torque'])
         self.init_total_motor_torque.setDecimals(2)
         self.init_total_motor_torque.setSingleStep(1)
-        self.init_total_motor_torque.setReadOnly(True)
-        self.init_total_motor_torque.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        graph_sim_layout.addWidget(self.init_total_motor_torque, 9, 1)
+        self._set_calculated(self.init_total_motor_torque)
+        graph_sim_layout.addRow('Initial Total Motor Torque (Nm):', self.init_total_motor_torque)
         
         # Initial PerMotor Power (Watts) - CALCULATED from motor RPM and per-motor torque
-        graph_sim_layout.addWidget(QLabel('Initial PerMotor Power (W):'), 10, 0)
         self.init_per_motor_power = QDoubleSpinBox()
         self.init_per_motor_power.setRange(0, 50000)
         self.init_per_motor_power.setValue(GRAPH_SIM_DEFAULTS['init_per_motor_power'])
         self.init_per_motor_power.setDecimals(1)
         self.init_per_motor_power.setSingleStep(100)
-        self.init_per_motor_power.setReadOnly(True)
-        self.init_per_motor_power.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        graph_sim_layout.addWidget(self.init_per_motor_power, 10, 1)
+        self._set_calculated(self.init_per_motor_power)
+        graph_sim_layout.addRow('Initial PerMotor Power (W):', self.init_per_motor_power)
         
         # Initial Tractive Force (N) - CALCULATED from total torque, gear efficiency, gear ratio, wheel radius
-        graph_sim_layout.addWidget(QLabel('Initial Tractive Force (N):'), 11, 0)
         self.init_tractive_force = QDoubleSpinBox()
         self.init_tractive_force.setRange(0, 10000)
         self.init_tractive_force.setValue(GRAPH_SIM_DEFAULTS['init_tractive_force'])
         self.init_tractive_force.setDecimals(2)
         self.init_tractive_force.setSingleStep(10)
-        self.init_tractive_force.setReadOnly(True)
-        self.init_tractive_force.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        graph_sim_layout.addWidget(self.init_tractive_force, 11, 1)
+        self._set_calculated(self.init_tractive_force)
+        graph_sim_layout.addRow('Initial Tractive Force (N):', self.init_tractive_force)
         
         # Initial Froll (N) - CALCULATED from rolling resistance (cr × mass × g)
-        graph_sim_layout.addWidget(QLabel('Initial Froll (N):'), 12, 0)
         self.init_froll = QDoubleSpinBox()
         self.init_froll.setRange(0, 5000)
         self.init_froll.setValue(GRAPH_SIM_DEFAULTS['init_froll'])
         self.init_froll.setDecimals(2)
         self.init_froll.setSingleStep(1)
-        self.init_froll.setReadOnly(True)
-        self.init_froll.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        graph_sim_layout.addWidget(self.init_froll, 12, 1)
+        self._set_calculated(self.init_froll)
+        graph_sim_layout.addRow('Initial Froll (N):', self.init_froll)
         
         # Initial Fdrag (N) - CALCULATED from aerodynamic drag (cd × ρ × A × v²)
-        graph_sim_layout.addWidget(QLabel('Initial Fdrag (N):'), 13, 0)
         self.init_fdrag = QDoubleSpinBox()
         self.init_fdrag.setRange(0, 5000)
         self.init_fdrag.setValue(GRAPH_SIM_DEFAULTS['init_fdrag'])
         self.init_fdrag.setDecimals(2)
         self.init_fdrag.setSingleStep(1)
-        self.init_fdrag.setReadOnly(True)
-        self.init_fdrag.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        graph_sim_layout.addWidget(self.init_fdrag, 13, 1)
+        self._set_calculated(self.init_fdrag)
+        graph_sim_layout.addRow('Initial Fdrag (N):', self.init_fdrag)
         
         # Initial Fclimb (N) - CALCULATED from climbing force (mass × g × sin(gradient))
-        graph_sim_layout.addWidget(QLabel('Initial Fclimb (N):'), 14, 0)
         self.init_fclimb = QDoubleSpinBox()
         self.init_fclimb.setRange(0, 5000)
         self.init_fclimb.setValue(GRAPH_SIM_DEFAULTS['init_fclimb'])
         self.init_fclimb.setDecimals(2)
         self.init_fclimb.setSingleStep(1)
-        self.init_fclimb.setReadOnly(True)
-        self.init_fclimb.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        graph_sim_layout.addWidget(self.init_fclimb, 14, 1)
+        self._set_calculated(self.init_fclimb)
+        graph_sim_layout.addRow('Initial Fclimb (N):', self.init_fclimb)
         
         # Initial Vehicle Speed (Kmph) - CALCULATED from m/s
-        graph_sim_layout.addWidget(QLabel('Initial Vehicle Speed (Kmph):'), 15, 0)
         self.init_vehicle_speed_kmph = QDoubleSpinBox()
         self.init_vehicle_speed_kmph.setRange(0, 300)
         self.init_vehicle_speed_kmph.setValue(GRAPH_SIM_DEFAULTS['init_vehicle_speed_kmph'])
         self.init_vehicle_speed_kmph.setDecimals(2)
         self.init_vehicle_speed_kmph.setSingleStep(1)
-        self.init_vehicle_speed_kmph.setReadOnly(True)
-        self.init_vehicle_speed_kmph.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        graph_sim_layout.addWidget(self.init_vehicle_speed_kmph, 15, 1)
+        self._set_calculated(self.init_vehicle_speed_kmph)
+        graph_sim_layout.addRow('Initial Vehicle Speed (Kmph):', self.init_vehicle_speed_kmph)
         
         # Initial PerMotor Torque (Nm) - CALCULATED from total torque and number of wheels
-        graph_sim_layout.addWidget(QLabel('Initial PerMotor Torque (Nm):'), 16, 0)
         self.init_per_motor_torque = QDoubleSpinBox()
         self.init_per_motor_torque.setRange(0, 10000)
         self.init_per_motor_torque.setValue(GRAPH_SIM_DEFAULTS['init_per_motor_torque'])
         self.init_per_motor_torque.setDecimals(2)
         self.init_per_motor_torque.setSingleStep(1)
-        self.init_per_motor_torque.setReadOnly(True)
-        self.init_per_motor_torque.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        graph_sim_layout.addWidget(self.init_per_motor_torque, 16, 1)
+        self._set_calculated(self.init_per_motor_torque)
+        graph_sim_layout.addRow('Initial PerMotor Torque (Nm):', self.init_per_motor_torque)
         
         # Initial F_Load Resistance (N) - CALCULATED from froll + fdrag + fclimb
-        graph_sim_layout.addWidget(QLabel('Initial F_Load Resistance (N):'), 17, 0)
         self.init_fload = QDoubleSpinBox()
         self.init_fload.setRange(0, 10000)
         self.init_fload.setValue(GRAPH_SIM_DEFAULTS['init_fload'])
         self.init_fload.setDecimals(2)
         self.init_fload.setSingleStep(1)
-        self.init_fload.setReadOnly(True)
-        self.init_fload.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        graph_sim_layout.addWidget(self.init_fload, 17, 1)
+        self._set_calculated(self.init_fload)
+        graph_sim_layout.addRow('Initial F_Load Resistance (N):', self.init_fload)
         
         # Initial Net Force F_Net (N) - CALCULATED from tractive force - load resistance
-        graph_sim_layout.addWidget(QLabel('Initial Net Force F_Net (N):'), 18, 0)
         self.init_fnet = QDoubleSpinBox()
         self.init_fnet.setRange(-10000, 10000)
         self.init_fnet.setValue(GRAPH_SIM_DEFAULTS['init_fnet'])
         self.init_fnet.setDecimals(2)
         self.init_fnet.setSingleStep(1)
-        self.init_fnet.setReadOnly(True)
-        self.init_fnet.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        graph_sim_layout.addWidget(self.init_fnet, 18, 1)
+        self._set_calculated(self.init_fnet)
+        graph_sim_layout.addRow('Initial Net Force F_Net (N):', self.init_fnet)
         
         # Initial Vehicle Acceleration (m/s²) - CALCULATED from net force / mass
-        graph_sim_layout.addWidget(QLabel('Initial Acceleration (m/s²):'), 19, 0)
         self.init_vehicle_accel = QDoubleSpinBox()
         self.init_vehicle_accel.setRange(-10, 10)
         self.init_vehicle_accel.setValue(GRAPH_SIM_DEFAULTS['init_vehicle_accel'])
         self.init_vehicle_accel.setDecimals(3)
         self.init_vehicle_accel.setSingleStep(0.1)
-        self.init_vehicle_accel.setReadOnly(True)
-        self.init_vehicle_accel.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        graph_sim_layout.addWidget(self.init_vehicle_accel, 19, 1)
+        self._set_calculated(self.init_vehicle_accel)
+        graph_sim_layout.addRow('Initial Acceleration (m/s²):', self.init_vehicle_accel)
         
         self.graph_sim_params_group.setLayout(graph_sim_layout)
         layout.addWidget(self.graph_sim_params_group)
         
         # EV-Specific Parameters - Organized into scrollable area
-        self.ev_params_group = QGroupBox('EV Parameters')
-        ev_main_layout = QVBoxLayout()
-        
-        # Physical Parameters
-        ev_physical_group = QGroupBox('Physical Parameters')
-        ev_physical_layout = QGridLayout()
-        
-        ev_physical_layout.addWidget(QLabel('Cd Drag Coefficient:'), 0, 0)
-        self.ev_cd_input = QDoubleSpinBox()
-        self.ev_cd_input.setRange(0.1, 2.0)
-        self.ev_cd_input.setValue(EV_DEFAULTS['cd'])
-        self.ev_cd_input.setDecimals(3)
-        self.ev_cd_input.setSingleStep(0.01)
-        ev_physical_layout.addWidget(self.ev_cd_input, 0, 1)
-        
-        ev_physical_layout.addWidget(QLabel('Cr Rolling Resistance:'), 1, 0)
-        self.ev_cr_input = QDoubleSpinBox()
-        self.ev_cr_input.setRange(0.001, 0.1)
-        self.ev_cr_input.setValue(EV_DEFAULTS['cr'])
-        self.ev_cr_input.setDecimals(4)
-        self.ev_cr_input.setSingleStep(0.001)
-        ev_physical_layout.addWidget(self.ev_cr_input, 1, 1)
-        
-        ev_physical_layout.addWidget(QLabel('Wheel Radius (m):'), 2, 0)
-        self.ev_wheel_radius_input = QDoubleSpinBox()
-        self.ev_wheel_radius_input.setRange(0.05, 1.0)
-        self.ev_wheel_radius_input.setValue(EV_DEFAULTS['wheel_radius'])
-        self.ev_wheel_radius_input.setDecimals(4)
-        self.ev_wheel_radius_input.setSingleStep(0.001)
-        ev_physical_layout.addWidget(self.ev_wheel_radius_input, 2, 1)
-        
-        ev_physical_layout.addWidget(QLabel('ρ Air Density (kg/m³):'), 3, 0)
-        self.ev_air_density_input = QDoubleSpinBox()
-        self.ev_air_density_input.setRange(0.5, 2.0)
-        self.ev_air_density_input.setValue(EV_DEFAULTS['air_density'])
-        self.ev_air_density_input.setDecimals(3)
-        self.ev_air_density_input.setSingleStep(0.001)
-        ev_physical_layout.addWidget(self.ev_air_density_input, 3, 1)
-        
-        ev_physical_layout.addWidget(QLabel('Af Frontal Area (m²):'), 4, 0)
-        self.ev_frontal_area_input = QDoubleSpinBox()
-        self.ev_frontal_area_input.setRange(0.1, 5.0)
-        self.ev_frontal_area_input.setValue(EV_DEFAULTS['frontal_area'])
-        self.ev_frontal_area_input.setDecimals(2)
-        self.ev_frontal_area_input.setSingleStep(0.1)
-        ev_physical_layout.addWidget(self.ev_frontal_area_input, 4, 1)
-        
-        ev_physical_group.setLayout(ev_physical_layout)
-        ev_main_layout.addWidget(ev_physical_group)
-        
-        # Drivetrain Parameters
-        ev_drivetrain_group = QGroupBox('Drivetrain Parameters')
-        ev_drivetrain_layout = QGridLayout()
-        
-        ev_drivetrain_layout.addWidget(QLabel('Gear Ratio:'), 0, 0)
-        self.ev_gear_ratio_input = QDoubleSpinBox()
-        self.ev_gear_ratio_input.setRange(1.0, 20.0)
-        self.ev_gear_ratio_input.setValue(5.221)
-        self.ev_gear_ratio_input.setDecimals(3)
-        self.ev_gear_ratio_input.setSingleStep(0.1)
-        ev_drivetrain_layout.addWidget(self.ev_gear_ratio_input, 0, 1)
-        
-        ev_drivetrain_layout.addWidget(QLabel('Gear Efficiency ηg (%):'), 1, 0)
-        self.ev_gear_efficiency_input = QDoubleSpinBox()
-        self.ev_gear_efficiency_input.setRange(50.0, 99.0)
-        self.ev_gear_efficiency_input.setValue(95.0)
-        self.ev_gear_efficiency_input.setDecimals(1)
-        self.ev_gear_efficiency_input.setSingleStep(0.5)
-        ev_drivetrain_layout.addWidget(self.ev_gear_efficiency_input, 1, 1)
-        
-        ev_drivetrain_layout.addWidget(QLabel('Motor Efficiency ηm (%):'), 2, 0)
-        self.ev_motor_efficiency_input = QDoubleSpinBox()
-        self.ev_motor_efficiency_input.setRange(50.0, 99.0)
-        self.ev_motor_efficiency_input.setValue(85.0)
-        self.ev_motor_efficiency_input.setDecimals(1)
-        self.ev_motor_efficiency_input.setSingleStep(0.5)
-        ev_drivetrain_layout.addWidget(self.ev_motor_efficiency_input, 2, 1)
-        
-        ev_drivetrain_layout.addWidget(QLabel('Motor Base RPM:'), 3, 0)
-        self.ev_motor_base_rpm_input = QSpinBox()
-        self.ev_motor_base_rpm_input.setRange(100, 20000)
-        self.ev_motor_base_rpm_input.setValue(1000)
-        self.ev_motor_base_rpm_input.setSingleStep(100)
-        ev_drivetrain_layout.addWidget(self.ev_motor_base_rpm_input, 3, 1)
-        
-        ev_drivetrain_group.setLayout(ev_drivetrain_layout)
-        ev_main_layout.addWidget(ev_drivetrain_group)
-        
-        # Weight Parameters
-        ev_weight_group = QGroupBox('Weight Parameters')
-        ev_weight_layout = QGridLayout()
-        
-        ev_weight_layout.addWidget(QLabel('Kerb Weight (kg):'), 0, 0)
-        self.ev_kerb_weight_input = QDoubleSpinBox()
-        self.ev_kerb_weight_input.setRange(0.0, 5000.0)
-        self.ev_kerb_weight_input.setValue(150.0)
-        self.ev_kerb_weight_input.setSingleStep(5.0)
-        self.ev_kerb_weight_input.setReadOnly(True)  # Calculated field
-        self.ev_kerb_weight_input.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        ev_weight_layout.addWidget(self.ev_kerb_weight_input, 0, 1)
-        
-        ev_weight_layout.addWidget(QLabel('Passenger/Load Weight (kg):'), 1, 0)
-        self.ev_passenger_weight_input = QDoubleSpinBox()
-        self.ev_passenger_weight_input.setRange(0.0, 1000.0)
-        self.ev_passenger_weight_input.setValue(0.0)
-        self.ev_passenger_weight_input.setSingleStep(5.0)
-        ev_weight_layout.addWidget(self.ev_passenger_weight_input, 1, 1)
-        
-        ev_weight_layout.addWidget(QLabel('GVW (kg):'), 2, 0)
-        self.ev_gvw_input = QDoubleSpinBox()
-        self.ev_gvw_input.setRange(0.0, 6000.0)
-        self.ev_gvw_input.setValue(150.0)
-        self.ev_gvw_input.setSingleStep(5.0)
-        self.ev_gvw_input.setReadOnly(True)  # Calculated field
-        self.ev_gvw_input.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        ev_weight_layout.addWidget(self.ev_gvw_input, 2, 1)
-        
-        ev_weight_layout.addWidget(QLabel('Motor & Controller Weight (kg):'), 3, 0)
-        self.ev_motor_controller_weight_input = QDoubleSpinBox()
-        self.ev_motor_controller_weight_input.setRange(0.0, 500.0)
-        self.ev_motor_controller_weight_input.setValue(0.0)
-        self.ev_motor_controller_weight_input.setSingleStep(1.0)
-        ev_weight_layout.addWidget(self.ev_motor_controller_weight_input, 3, 1)
-        
-        ev_weight_layout.addWidget(QLabel('Battery Weight (kg):'), 4, 0)
-        self.ev_battery_weight_input = QDoubleSpinBox()
-        self.ev_battery_weight_input.setRange(0.0, 1000.0)
-        self.ev_battery_weight_input.setValue(0.0)
-        self.ev_battery_weight_input.setSingleStep(1.0)
-        ev_weight_layout.addWidget(self.ev_battery_weight_input, 4, 1)
-        
-        ev_weight_layout.addWidget(QLabel('Vehicle Weight (kg):'), 5, 0)
-        self.ev_vehicle_weight_input = QDoubleSpinBox()
-        self.ev_vehicle_weight_input.setRange(0.0, 5000.0)
-        self.ev_vehicle_weight_input.setValue(150.0)
-        self.ev_vehicle_weight_input.setSingleStep(5.0)
-        ev_weight_layout.addWidget(self.ev_vehicle_weight_input, 5, 1)
-        
-        ev_weight_layout.addWidget(QLabel('Other Weights (kg):'), 6, 0)
-        self.ev_other_weights_input = QDoubleSpinBox()
-        self.ev_other_weights_input.setRange(0.0, 500.0)
-        self.ev_other_weights_input.setValue(0.0)
-        self.ev_other_weights_input.setSingleStep(1.0)
-        ev_weight_layout.addWidget(self.ev_other_weights_input, 6, 1)
-        
-        ev_weight_layout.addWidget(QLabel('Generator Weight (kg):'), 7, 0)
-        self.ev_generator_weight_input = QDoubleSpinBox()
-        self.ev_generator_weight_input.setRange(0.0, 200.0)
-        self.ev_generator_weight_input.setValue(0.0)
-        self.ev_generator_weight_input.setSingleStep(1.0)
-        ev_weight_layout.addWidget(self.ev_generator_weight_input, 7, 1)
-        
-        ev_weight_group.setLayout(ev_weight_layout)
-        ev_main_layout.addWidget(ev_weight_group)
-        
-        # Connect signals for auto-calculation of kerb_weight and gvw
-        self.ev_battery_weight_input.valueChanged.connect(self.update_ev_calculated_weights)
-        self.ev_vehicle_weight_input.valueChanged.connect(self.update_ev_calculated_weights)
-        self.ev_passenger_weight_input.valueChanged.connect(self.update_ev_calculated_weights)
-        
-        # Battery Parameters
-        ev_battery_group = QGroupBox('Battery Parameters')
-        ev_battery_layout = QGridLayout()
-        
-        ev_battery_layout.addWidget(QLabel('Battery Requirements:'), 0, 0)
-        self.ev_battery_req_input = QComboBox()
-        self.ev_battery_req_input.addItems(['Lithium', 'Lead Acid', 'NiMH'])
-        self.ev_battery_req_input.setCurrentText('Lithium')
-        ev_battery_layout.addWidget(self.ev_battery_req_input, 0, 1)
-        
-        ev_battery_layout.addWidget(QLabel('Battery Chemistry:'), 1, 0)
-        self.ev_battery_chem_input = QComboBox()
-        self.ev_battery_chem_input.addItems(['NCM', 'NCA', 'LFP', 'LTO'])
-        self.ev_battery_chem_input.setCurrentText('NCM')
-        ev_battery_layout.addWidget(self.ev_battery_chem_input, 1, 1)
-        
-        ev_battery_layout.addWidget(QLabel('Battery Voltage (V):'), 2, 0)
-        self.ev_battery_voltage_input = QDoubleSpinBox()
-        self.ev_battery_voltage_input.setRange(0.0, 1000.0)
-        self.ev_battery_voltage_input.setValue(24.0)
-        self.ev_battery_voltage_input.setDecimals(1)
-        self.ev_battery_voltage_input.setSingleStep(1.0)
-        ev_battery_layout.addWidget(self.ev_battery_voltage_input, 2, 1)
-        
-        ev_battery_layout.addWidget(QLabel('Weight per unit Wh (kg/Wh):'), 3, 0)
-        self.ev_weight_per_wh_input = QDoubleSpinBox()
-        self.ev_weight_per_wh_input.setRange(0.0, 1.0)
-        self.ev_weight_per_wh_input.setValue(EV_DEFAULTS['weight_per_wh'])
-        self.ev_weight_per_wh_input.setDecimals(4)
-        self.ev_weight_per_wh_input.setSingleStep(0.0001)
-        ev_battery_layout.addWidget(self.ev_weight_per_wh_input, 3, 1)
-        
-        ev_battery_layout.addWidget(QLabel('Peukert\'s Coefficient:'), 4, 0)
-        self.ev_peukert_input = QDoubleSpinBox()
-        self.ev_peukert_input.setRange(1.0, 1.5)
-        self.ev_peukert_input.setValue(1.05)
-        self.ev_peukert_input.setDecimals(2)
-        self.ev_peukert_input.setSingleStep(0.01)
-        ev_battery_layout.addWidget(self.ev_peukert_input, 4, 1)
-        
-        ev_battery_layout.addWidget(QLabel('Discharge Hour Rating (Hr):'), 5, 0)
-        self.ev_discharge_hr_input = QDoubleSpinBox()
-        self.ev_discharge_hr_input.setRange(0.1, 20.0)
-        self.ev_discharge_hr_input.setValue(2.0)
-        self.ev_discharge_hr_input.setDecimals(1)
-        self.ev_discharge_hr_input.setSingleStep(0.1)
-        ev_battery_layout.addWidget(self.ev_discharge_hr_input, 5, 1)
-        
-        ev_battery_layout.addWidget(QLabel('Depth of Discharge (%):'), 6, 0)
-        self.ev_dod_input = QDoubleSpinBox()
-        self.ev_dod_input.setRange(0.0, 100.0)
-        self.ev_dod_input.setValue(100.0)
-        self.ev_dod_input.setDecimals(1)
-        self.ev_dod_input.setSingleStep(1.0)
-        ev_battery_layout.addWidget(self.ev_dod_input, 6, 1)
-        
-        ev_battery_layout.addWidget(QLabel('Constant Speed Battery Current (A):'), 7, 0)
-        self.ev_battery_current_input = QDoubleSpinBox()
-        self.ev_battery_current_input.setRange(0.0, 500.0)
-        self.ev_battery_current_input.setValue(53.0)
-        self.ev_battery_current_input.setDecimals(1)
-        self.ev_battery_current_input.setSingleStep(1.0)
-        ev_battery_layout.addWidget(self.ev_battery_current_input, 7, 1)
-        
-        ev_battery_layout.addWidget(QLabel('True Usable Battery Capacity (Wh):'), 8, 0)
-        self.ev_true_capacity_wh_input = QDoubleSpinBox()
-        self.ev_true_capacity_wh_input.setRange(0.0, 50000.0)
-        self.ev_true_capacity_wh_input.setValue(1789.0)
-        self.ev_true_capacity_wh_input.setDecimals(1)
-        self.ev_true_capacity_wh_input.setSingleStep(10.0)
-        ev_battery_layout.addWidget(self.ev_true_capacity_wh_input, 8, 1)
-        
-        ev_battery_layout.addWidget(QLabel('True Usable Battery Capacity (Ah):'), 9, 0)
-        self.ev_true_capacity_ah_input = QDoubleSpinBox()
-        self.ev_true_capacity_ah_input.setRange(0.0, 1000.0)
-        self.ev_true_capacity_ah_input.setValue(75.0)
-        self.ev_true_capacity_ah_input.setDecimals(1)
-        self.ev_true_capacity_ah_input.setSingleStep(1.0)
-        ev_battery_layout.addWidget(self.ev_true_capacity_ah_input, 9, 1)
-        
-        ev_battery_layout.addWidget(QLabel('Tentative Battery Ah (for Discharge Hr):'), 10, 0)
-        self.ev_tentative_ah_input = QDoubleSpinBox()
-        self.ev_tentative_ah_input.setRange(0.0, 1000.0)
-        self.ev_tentative_ah_input.setValue(76.0)
-        self.ev_tentative_ah_input.setDecimals(1)
-        self.ev_tentative_ah_input.setSingleStep(1.0)
-        ev_battery_layout.addWidget(self.ev_tentative_ah_input, 10, 1)
-        
-        ev_battery_layout.addWidget(QLabel('Tentative Battery Capacity (Wh):'), 11, 0)
-        self.ev_tentative_wh_input = QDoubleSpinBox()
-        self.ev_tentative_wh_input.setRange(0.0, 50000.0)
-        self.ev_tentative_wh_input.setValue(1820.0)
-        self.ev_tentative_wh_input.setDecimals(1)
-        self.ev_tentative_wh_input.setSingleStep(10.0)
-        ev_battery_layout.addWidget(self.ev_tentative_wh_input, 11, 1)
-        
-        ev_battery_layout.addWidget(QLabel('Battery Weight (kg):'), 12, 0)
-        self.ev_battery_weight_total_input = QDoubleSpinBox()
-        self.ev_battery_weight_total_input.setRange(0.0, 500.0)
-        self.ev_battery_weight_total_input.setValue(12.0)
-        self.ev_battery_weight_total_input.setDecimals(1)
-        self.ev_battery_weight_total_input.setSingleStep(0.5)
-        ev_battery_layout.addWidget(self.ev_battery_weight_total_input, 12, 1)
-        
-        ev_battery_group.setLayout(ev_battery_layout)
-        ev_main_layout.addWidget(ev_battery_group)
-        
-        # Performance Parameters
-        ev_performance_group = QGroupBox('Performance Parameters')
-        ev_performance_layout = QGridLayout()
-        
-        ev_performance_layout.addWidget(QLabel('Rotary Inertia Compensation:'), 0, 0)
-        self.ev_rotary_inertia_input = QDoubleSpinBox()
-        self.ev_rotary_inertia_input.setRange(0.0, 2.0)
-        self.ev_rotary_inertia_input.setValue(1.06)
-        self.ev_rotary_inertia_input.setDecimals(3)
-        self.ev_rotary_inertia_input.setSingleStep(0.01)
-        ev_performance_layout.addWidget(self.ev_rotary_inertia_input, 0, 1)
-        
-        ev_performance_layout.addWidget(QLabel('Max Speed (Kmph):'), 1, 0)
-        self.ev_max_speed_input = QDoubleSpinBox()
-        self.ev_max_speed_input.setRange(1.0, 300.0)
-        self.ev_max_speed_input.setValue(50.0)
-        self.ev_max_speed_input.setSingleStep(1.0)
-        ev_performance_layout.addWidget(self.ev_max_speed_input, 1, 1)
-        
-        ev_performance_layout.addWidget(QLabel('Slope Speed (Kmph):'), 2, 0)
-        self.ev_slope_speed_input = QDoubleSpinBox()
-        self.ev_slope_speed_input.setRange(1.0, 150.0)
-        self.ev_slope_speed_input.setValue(5.0)
-        self.ev_slope_speed_input.setSingleStep(1.0)
-        ev_performance_layout.addWidget(self.ev_slope_speed_input, 2, 1)
-        
-        ev_performance_layout.addWidget(QLabel('Gradeability (deg):'), 3, 0)
-        self.ev_gradeability_input = QDoubleSpinBox()
-        self.ev_gradeability_input.setRange(0.0, 60.0)
-        self.ev_gradeability_input.setValue(30.0)
-        self.ev_gradeability_input.setSingleStep(0.5)
-        ev_performance_layout.addWidget(self.ev_gradeability_input, 3, 1)
-        
-        ev_performance_layout.addWidget(QLabel('Acceleration End Speed (Kmph):'), 4, 0)
-        self.ev_accel_end_speed_input = QDoubleSpinBox()
-        self.ev_accel_end_speed_input.setRange(1.0, 200.0)
-        self.ev_accel_end_speed_input.setValue(50.0)
-        self.ev_accel_end_speed_input.setSingleStep(1.0)
-        ev_performance_layout.addWidget(self.ev_accel_end_speed_input, 4, 1)
-        
-        ev_performance_layout.addWidget(QLabel('Acceleration Period (s):'), 5, 0)
-        self.ev_accel_period_input = QDoubleSpinBox()
-        self.ev_accel_period_input.setRange(1.0, 60.0)
-        self.ev_accel_period_input.setValue(5.0)
-        self.ev_accel_period_input.setSingleStep(0.5)
-        ev_performance_layout.addWidget(self.ev_accel_period_input, 5, 1)
-        
-        ev_performance_layout.addWidget(QLabel('Vehicle Range (Km):'), 6, 0)
-        self.ev_vehicle_range_input = QDoubleSpinBox()
-        self.ev_vehicle_range_input.setRange(1.0, 1000.0)
-        self.ev_vehicle_range_input.setValue(70.0)
-        self.ev_vehicle_range_input.setSingleStep(5.0)
-        ev_performance_layout.addWidget(self.ev_vehicle_range_input, 6, 1)
-        
-        ev_performance_group.setLayout(ev_performance_layout)
-        ev_main_layout.addWidget(ev_performance_group)
-        
-        # Reset to Defaults button for EV
-        ev_reset_btn = QPushButton('🔄 Reset to Default Values')
-        ev_reset_btn.setStyleSheet('''
-            QPushButton { background-color: #FF5722; color: white; font-weight: bold; padding: 10px; border: none; border-radius: 5px; }
-            QPushButton:hover { background-color: #E64A19; }
-            QPushButton:pressed { background-color: #BF360C; }
-        ''')
-        ev_reset_btn.clicked.connect(self.reset_ev_defaults)
-        ev_main_layout.addWidget(ev_reset_btn)
-        
-        self.ev_params_group.setLayout(ev_main_layout)
+        self.ev_params_group = self._build_vehicle_params('ev', VEHICLE_PARAM_GROUPS)
         layout.addWidget(self.ev_params_group)
         
-        # UGV Parameters (Shared + UGV-Specific)
-        self.ugv_params_group = QGroupBox('UGV Parameters')
-        ugv_main_layout = QVBoxLayout()
-        
-        # Physical Parameters
-        ugv_physical_group = QGroupBox('Physical Parameters')
-        ugv_physical_layout = QGridLayout()
-        
-        ugv_physical_layout.addWidget(QLabel('Cd Drag Coefficient:'), 0, 0)
-        self.ugv_cd_input = QDoubleSpinBox()
-        self.ugv_cd_input.setRange(0.1, 2.0)
-        self.ugv_cd_input.setValue(0.8)
-        self.ugv_cd_input.setDecimals(3)
-        self.ugv_cd_input.setSingleStep(0.01)
-        ugv_physical_layout.addWidget(self.ugv_cd_input, 0, 1)
-        
-        ugv_physical_layout.addWidget(QLabel('Cr Rolling Resistance:'), 1, 0)
-        self.ugv_cr_input = QDoubleSpinBox()
-        self.ugv_cr_input.setRange(0.001, 0.1)
-        self.ugv_cr_input.setValue(0.02)
-        self.ugv_cr_input.setDecimals(4)
-        self.ugv_cr_input.setSingleStep(0.001)
-        ugv_physical_layout.addWidget(self.ugv_cr_input, 1, 1)
-        
-        ugv_physical_layout.addWidget(QLabel('Wheel Radius (m):'), 2, 0)
-        self.ugv_wheel_radius_input = QDoubleSpinBox()
-        self.ugv_wheel_radius_input.setRange(0.05, 1.0)
-        self.ugv_wheel_radius_input.setValue(0.2795)
-        self.ugv_wheel_radius_input.setDecimals(4)
-        self.ugv_wheel_radius_input.setSingleStep(0.001)
-        ugv_physical_layout.addWidget(self.ugv_wheel_radius_input, 2, 1)
-        
-        ugv_physical_layout.addWidget(QLabel('ρ Air Density (kg/m³):'), 3, 0)
-        self.ugv_air_density_input = QDoubleSpinBox()
-        self.ugv_air_density_input.setRange(0.5, 2.0)
-        self.ugv_air_density_input.setValue(1.164)
-        self.ugv_air_density_input.setDecimals(3)
-        self.ugv_air_density_input.setSingleStep(0.001)
-        ugv_physical_layout.addWidget(self.ugv_air_density_input, 3, 1)
-        
-        ugv_physical_layout.addWidget(QLabel('Af Frontal Area (m²):'), 4, 0)
-        self.ugv_frontal_area_input = QDoubleSpinBox()
-        self.ugv_frontal_area_input.setRange(0.1, 5.0)
-        self.ugv_frontal_area_input.setValue(0.5)
-        self.ugv_frontal_area_input.setDecimals(2)
-        self.ugv_frontal_area_input.setSingleStep(0.1)
-        ugv_physical_layout.addWidget(self.ugv_frontal_area_input, 4, 1)
-        
-        ugv_physical_group.setLayout(ugv_physical_layout)
-        ugv_main_layout.addWidget(ugv_physical_group)
-        
-        # Drivetrain Parameters
-        ugv_drivetrain_group = QGroupBox('Drivetrain Parameters')
-        ugv_drivetrain_layout = QGridLayout()
-        
-        ugv_drivetrain_layout.addWidget(QLabel('Gear Ratio:'), 0, 0)
-        self.ugv_gear_ratio_input = QDoubleSpinBox()
-        self.ugv_gear_ratio_input.setRange(1.0, 20.0)
-        self.ugv_gear_ratio_input.setValue(5.221)
-        self.ugv_gear_ratio_input.setDecimals(3)
-        self.ugv_gear_ratio_input.setSingleStep(0.1)
-        ugv_drivetrain_layout.addWidget(self.ugv_gear_ratio_input, 0, 1)
-        
-        ugv_drivetrain_layout.addWidget(QLabel('Gear Efficiency ηg (%):'), 1, 0)
-        self.ugv_gear_efficiency_input = QDoubleSpinBox()
-        self.ugv_gear_efficiency_input.setRange(50.0, 99.0)
-        self.ugv_gear_efficiency_input.setValue(95.0)
-        self.ugv_gear_efficiency_input.setDecimals(1)
-        self.ugv_gear_efficiency_input.setSingleStep(0.5)
-        ugv_drivetrain_layout.addWidget(self.ugv_gear_efficiency_input, 1, 1)
-        
-        ugv_drivetrain_layout.addWidget(QLabel('Motor Efficiency ηm (%):'), 2, 0)
-        self.ugv_motor_efficiency_input = QDoubleSpinBox()
-        self.ugv_motor_efficiency_input.setRange(50.0, 99.0)
-        self.ugv_motor_efficiency_input.setValue(85.0)
-        self.ugv_motor_efficiency_input.setDecimals(1)
-        self.ugv_motor_efficiency_input.setSingleStep(0.5)
-        ugv_drivetrain_layout.addWidget(self.ugv_motor_efficiency_input, 2, 1)
-        
-        ugv_drivetrain_layout.addWidget(QLabel('Motor Base RPM:'), 3, 0)
-        self.ugv_motor_base_rpm_input = QSpinBox()
-        self.ugv_motor_base_rpm_input.setRange(100, 20000)
-        self.ugv_motor_base_rpm_input.setValue(1000)
-        self.ugv_motor_base_rpm_input.setSingleStep(100)
-        ugv_drivetrain_layout.addWidget(self.ugv_motor_base_rpm_input, 3, 1)
-        
-        ugv_drivetrain_group.setLayout(ugv_drivetrain_layout)
-        ugv_main_layout.addWidget(ugv_drivetrain_group)
-        
-        # Weight Parameters
-        ugv_weight_group = QGroupBox('Weight Parameters')
-        ugv_weight_layout = QGridLayout()
-        
-        ugv_weight_layout.addWidget(QLabel('Kerb Weight (kg):'), 0, 0)
-        self.ugv_kerb_weight_input = QDoubleSpinBox()
-        self.ugv_kerb_weight_input.setRange(0.0, 5000.0)
-        self.ugv_kerb_weight_input.setValue(150.0)
-        self.ugv_kerb_weight_input.setSingleStep(5.0)
-        self.ugv_kerb_weight_input.setReadOnly(True)  # Calculated field
-        self.ugv_kerb_weight_input.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        ugv_weight_layout.addWidget(self.ugv_kerb_weight_input, 0, 1)
-        
-        ugv_weight_layout.addWidget(QLabel('Passenger/Load Weight (kg):'), 1, 0)
-        self.ugv_passenger_weight_input = QDoubleSpinBox()
-        self.ugv_passenger_weight_input.setRange(0.0, 1000.0)
-        self.ugv_passenger_weight_input.setValue(0.0)
-        self.ugv_passenger_weight_input.setSingleStep(5.0)
-        ugv_weight_layout.addWidget(self.ugv_passenger_weight_input, 1, 1)
-        
-        ugv_weight_layout.addWidget(QLabel('GVW (kg):'), 2, 0)
-        self.ugv_gvw_input = QDoubleSpinBox()
-        self.ugv_gvw_input.setRange(0.0, 6000.0)
-        self.ugv_gvw_input.setValue(150.0)
-        self.ugv_gvw_input.setSingleStep(5.0)
-        self.ugv_gvw_input.setReadOnly(True)  # Calculated field
-        self.ugv_gvw_input.setStyleSheet("QDoubleSpinBox { background-color: #f0f0f0; }")
-        ugv_weight_layout.addWidget(self.ugv_gvw_input, 2, 1)
-        
-        ugv_weight_layout.addWidget(QLabel('Motor & Controller Weight (kg):'), 3, 0)
-        self.ugv_motor_controller_weight_input = QDoubleSpinBox()
-        self.ugv_motor_controller_weight_input.setRange(0.0, 500.0)
-        self.ugv_motor_controller_weight_input.setValue(0.0)
-        self.ugv_motor_controller_weight_input.setSingleStep(1.0)
-        ugv_weight_layout.addWidget(self.ugv_motor_controller_weight_input, 3, 1)
-        
-        ugv_weight_layout.addWidget(QLabel('Battery Weight (kg):'), 4, 0)
-        self.ugv_battery_weight_input = QDoubleSpinBox()
-        self.ugv_battery_weight_input.setRange(0.0, 1000.0)
-        self.ugv_battery_weight_input.setValue(0.0)
-        self.ugv_battery_weight_input.setSingleStep(1.0)
-        ugv_weight_layout.addWidget(self.ugv_battery_weight_input, 4, 1)
-        
-        ugv_weight_layout.addWidget(QLabel('Vehicle Weight (kg):'), 5, 0)
-        self.ugv_vehicle_weight_input = QDoubleSpinBox()
-        self.ugv_vehicle_weight_input.setRange(0.0, 5000.0)
-        self.ugv_vehicle_weight_input.setValue(150.0)
-        self.ugv_vehicle_weight_input.setSingleStep(5.0)
-        ugv_weight_layout.addWidget(self.ugv_vehicle_weight_input, 5, 1)
-        
-        ugv_weight_layout.addWidget(QLabel('Other Weights (kg):'), 6, 0)
-        self.ugv_other_weights_input = QDoubleSpinBox()
-        self.ugv_other_weights_input.setRange(0.0, 500.0)
-        self.ugv_other_weights_input.setValue(0.0)
-        self.ugv_other_weights_input.setSingleStep(1.0)
-        ugv_weight_layout.addWidget(self.ugv_other_weights_input, 6, 1)
-        
-        ugv_weight_layout.addWidget(QLabel('Generator Weight (kg):'), 7, 0)
-        self.ugv_generator_weight_input = QDoubleSpinBox()
-        self.ugv_generator_weight_input.setRange(0.0, 200.0)
-        self.ugv_generator_weight_input.setValue(0.0)
-        self.ugv_generator_weight_input.setSingleStep(1.0)
-        ugv_weight_layout.addWidget(self.ugv_generator_weight_input, 7, 1)
-        
-        ugv_weight_group.setLayout(ugv_weight_layout)
-        ugv_main_layout.addWidget(ugv_weight_group)
-        
-        # Connect signals for auto-calculation of kerb_weight and gvw
-        self.ugv_battery_weight_input.valueChanged.connect(self.update_ugv_calculated_weights)
-        self.ugv_vehicle_weight_input.valueChanged.connect(self.update_ugv_calculated_weights)
-        self.ugv_passenger_weight_input.valueChanged.connect(self.update_ugv_calculated_weights)
-        
-        # Battery Parameters
-        ugv_battery_group = QGroupBox('Battery Parameters')
-        ugv_battery_layout = QGridLayout()
-        
-        ugv_battery_layout.addWidget(QLabel('Battery Requirements:'), 0, 0)
-        self.ugv_battery_req_input = QComboBox()
-        self.ugv_battery_req_input.addItems(['Lithium', 'Lead Acid', 'NiMH'])
-        self.ugv_battery_req_input.setCurrentText('Lithium')
-        ugv_battery_layout.addWidget(self.ugv_battery_req_input, 0, 1)
-        
-        ugv_battery_layout.addWidget(QLabel('Battery Chemistry:'), 1, 0)
-        self.ugv_battery_chem_input = QComboBox()
-        self.ugv_battery_chem_input.addItems(['NCM', 'NCA', 'LFP', 'LTO'])
-        self.ugv_battery_chem_input.setCurrentText('NCM')
-        ugv_battery_layout.addWidget(self.ugv_battery_chem_input, 1, 1)
-        
-        ugv_battery_layout.addWidget(QLabel('Battery Voltage (V):'), 2, 0)
-        self.ugv_battery_voltage_input = QDoubleSpinBox()
-        self.ugv_battery_voltage_input.setRange(0.0, 1000.0)
-        self.ugv_battery_voltage_input.setValue(24.0)
-        self.ugv_battery_voltage_input.setDecimals(1)
-        self.ugv_battery_voltage_input.setSingleStep(1.0)
-        ugv_battery_layout.addWidget(self.ugv_battery_voltage_input, 2, 1)
-        
-        ugv_battery_layout.addWidget(QLabel('Weight per unit Wh (kg/Wh):'), 3, 0)
-        self.ugv_weight_per_wh_input = QDoubleSpinBox()
-        self.ugv_weight_per_wh_input.setRange(0.0, 1.0)
-        self.ugv_weight_per_wh_input.setValue(0.0)
-        self.ugv_weight_per_wh_input.setDecimals(4)
-        self.ugv_weight_per_wh_input.setSingleStep(0.0001)
-        ugv_battery_layout.addWidget(self.ugv_weight_per_wh_input, 3, 1)
-        
-        ugv_battery_layout.addWidget(QLabel('Peukert\'s Coefficient:'), 4, 0)
-        self.ugv_peukert_input = QDoubleSpinBox()
-        self.ugv_peukert_input.setRange(1.0, 1.5)
-        self.ugv_peukert_input.setValue(1.05)
-        self.ugv_peukert_input.setDecimals(2)
-        self.ugv_peukert_input.setSingleStep(0.01)
-        ugv_battery_layout.addWidget(self.ugv_peukert_input, 4, 1)
-        
-        ugv_battery_layout.addWidget(QLabel('Discharge Hour Rating (Hr):'), 5, 0)
-        self.ugv_discharge_hr_input = QDoubleSpinBox()
-        self.ugv_discharge_hr_input.setRange(0.1, 20.0)
-        self.ugv_discharge_hr_input.setValue(2.0)
-        self.ugv_discharge_hr_input.setDecimals(1)
-        self.ugv_discharge_hr_input.setSingleStep(0.1)
-        ugv_battery_layout.addWidget(self.ugv_discharge_hr_input, 5, 1)
-        
-        ugv_battery_layout.addWidget(QLabel('Depth of Discharge (%):'), 6, 0)
-        self.ugv_dod_input = QDoubleSpinBox()
-        self.ugv_dod_input.setRange(0.0, 100.0)
-        self.ugv_dod_input.setValue(100.0)
-        self.ugv_dod_input.setDecimals(1)
-        self.ugv_dod_input.setSingleStep(1.0)
-        ugv_battery_layout.addWidget(self.ugv_dod_input, 6, 1)
-        
-        ugv_battery_layout.addWidget(QLabel('Constant Speed Battery Current (A):'), 7, 0)
-        self.ugv_battery_current_input = QDoubleSpinBox()
-        self.ugv_battery_current_input.setRange(0.0, 500.0)
-        self.ugv_battery_current_input.setValue(53.0)
-        self.ugv_battery_current_input.setDecimals(1)
-        self.ugv_battery_current_input.setSingleStep(1.0)
-        ugv_battery_layout.addWidget(self.ugv_battery_current_input, 7, 1)
-        
-        ugv_battery_layout.addWidget(QLabel('True Usable Battery Capacity (Wh):'), 8, 0)
-        self.ugv_true_capacity_wh_input = QDoubleSpinBox()
-        self.ugv_true_capacity_wh_input.setRange(0.0, 50000.0)
-        self.ugv_true_capacity_wh_input.setValue(1789.0)
-        self.ugv_true_capacity_wh_input.setDecimals(1)
-        self.ugv_true_capacity_wh_input.setSingleStep(10.0)
-        ugv_battery_layout.addWidget(self.ugv_true_capacity_wh_input, 8, 1)
-        
-        ugv_battery_layout.addWidget(QLabel('True Usable Battery Capacity (Ah):'), 9, 0)
-        self.ugv_true_capacity_ah_input = QDoubleSpinBox()
-        self.ugv_true_capacity_ah_input.setRange(0.0, 1000.0)
-        self.ugv_true_capacity_ah_input.setValue(75.0)
-        self.ugv_true_capacity_ah_input.setDecimals(1)
-        self.ugv_true_capacity_ah_input.setSingleStep(1.0)
-        ugv_battery_layout.addWidget(self.ugv_true_capacity_ah_input, 9, 1)
-        
-        ugv_battery_layout.addWidget(QLabel('Tentative Battery Ah (for Discharge Hr):'), 10, 0)
-        self.ugv_tentative_ah_input = QDoubleSpinBox()
-        self.ugv_tentative_ah_input.setRange(0.0, 1000.0)
-        self.ugv_tentative_ah_input.setValue(76.0)
-        self.ugv_tentative_ah_input.setDecimals(1)
-        self.ugv_tentative_ah_input.setSingleStep(1.0)
-        ugv_battery_layout.addWidget(self.ugv_tentative_ah_input, 10, 1)
-        
-        ugv_battery_layout.addWidget(QLabel('Tentative Battery Capacity (Wh):'), 11, 0)
-        self.ugv_tentative_wh_input = QDoubleSpinBox()
-        self.ugv_tentative_wh_input.setRange(0.0, 50000.0)
-        self.ugv_tentative_wh_input.setValue(1820.0)
-        self.ugv_tentative_wh_input.setDecimals(1)
-        self.ugv_tentative_wh_input.setSingleStep(10.0)
-        ugv_battery_layout.addWidget(self.ugv_tentative_wh_input, 11, 1)
-        
-        ugv_battery_layout.addWidget(QLabel('Battery Weight (kg):'), 12, 0)
-        self.ugv_battery_weight_total_input = QDoubleSpinBox()
-        self.ugv_battery_weight_total_input.setRange(0.0, 500.0)
-        self.ugv_battery_weight_total_input.setValue(12.0)
-        self.ugv_battery_weight_total_input.setDecimals(1)
-        self.ugv_battery_weight_total_input.setSingleStep(0.5)
-        ugv_battery_layout.addWidget(self.ugv_battery_weight_total_input, 12, 1)
-        
-        ugv_battery_group.setLayout(ugv_battery_layout)
-        ugv_main_layout.addWidget(ugv_battery_group)
-        
-        # Performance Parameters
-        ugv_performance_group = QGroupBox('Performance Parameters')
-        ugv_performance_layout = QGridLayout()
-        
-        ugv_performance_layout.addWidget(QLabel('Rotary Inertia Compensation:'), 0, 0)
-        self.ugv_rotary_inertia_input = QDoubleSpinBox()
-        self.ugv_rotary_inertia_input.setRange(0.0, 2.0)
-        self.ugv_rotary_inertia_input.setValue(1.06)
-        self.ugv_rotary_inertia_input.setDecimals(3)
-        self.ugv_rotary_inertia_input.setSingleStep(0.01)
-        ugv_performance_layout.addWidget(self.ugv_rotary_inertia_input, 0, 1)
-        
-        ugv_performance_layout.addWidget(QLabel('Max Speed (Kmph):'), 1, 0)
-        self.ugv_max_speed_input = QDoubleSpinBox()
-        self.ugv_max_speed_input.setRange(1.0, 300.0)
-        self.ugv_max_speed_input.setValue(50.0)
-        self.ugv_max_speed_input.setSingleStep(1.0)
-        ugv_performance_layout.addWidget(self.ugv_max_speed_input, 1, 1)
-        
-        ugv_performance_layout.addWidget(QLabel('Slope Speed (Kmph):'), 2, 0)
-        self.ugv_slope_speed_input = QDoubleSpinBox()
-        self.ugv_slope_speed_input.setRange(1.0, 150.0)
-        self.ugv_slope_speed_input.setValue(5.0)
-        self.ugv_slope_speed_input.setSingleStep(1.0)
-        ugv_performance_layout.addWidget(self.ugv_slope_speed_input, 2, 1)
-        
-        ugv_performance_layout.addWidget(QLabel('Gradeability (deg):'), 3, 0)
-        self.ugv_gradeability_input = QDoubleSpinBox()
-        self.ugv_gradeability_input.setRange(0.0, 60.0)
-        self.ugv_gradeability_input.setValue(30.0)
-        self.ugv_gradeability_input.setSingleStep(0.5)
-        ugv_performance_layout.addWidget(self.ugv_gradeability_input, 3, 1)
-        
-        ugv_performance_layout.addWidget(QLabel('Acceleration End Speed (Kmph):'), 4, 0)
-        self.ugv_accel_end_speed_input = QDoubleSpinBox()
-        self.ugv_accel_end_speed_input.setRange(1.0, 200.0)
-        self.ugv_accel_end_speed_input.setValue(50.0)
-        self.ugv_accel_end_speed_input.setSingleStep(1.0)
-        ugv_performance_layout.addWidget(self.ugv_accel_end_speed_input, 4, 1)
-        
-        ugv_performance_layout.addWidget(QLabel('Acceleration Period (s):'), 5, 0)
-        self.ugv_accel_period_input = QDoubleSpinBox()
-        self.ugv_accel_period_input.setRange(1.0, 60.0)
-        self.ugv_accel_period_input.setValue(5.0)
-        self.ugv_accel_period_input.setSingleStep(0.5)
-        ugv_performance_layout.addWidget(self.ugv_accel_period_input, 5, 1)
-        
-        ugv_performance_layout.addWidget(QLabel('Vehicle Range (Km):'), 6, 0)
-        self.ugv_vehicle_range_input = QDoubleSpinBox()
-        self.ugv_vehicle_range_input.setRange(1.0, 1000.0)
-        self.ugv_vehicle_range_input.setValue(70.0)
-        self.ugv_vehicle_range_input.setSingleStep(5.0)
-        ugv_performance_layout.addWidget(self.ugv_vehicle_range_input, 6, 1)
-        
-        ugv_performance_group.setLayout(ugv_performance_layout)
-        ugv_main_layout.addWidget(ugv_performance_group)
-        
-        # UGV-Specific Parameters
-        ugv_specific_group = QGroupBox('UGV-Specific Parameters')
-        ugv_specific_layout = QGridLayout()
-        
-        ugv_specific_layout.addWidget(QLabel('Step Height (m):'), 0, 0)
-        self.ugv_step_height_input = QDoubleSpinBox()
-        self.ugv_step_height_input.setRange(0.0, 1.0)
-        self.ugv_step_height_input.setValue(0.1)
-        self.ugv_step_height_input.setDecimals(3)
-        self.ugv_step_height_input.setSingleStep(0.01)
-        ugv_specific_layout.addWidget(self.ugv_step_height_input, 0, 1)
-        
-        ugv_specific_layout.addWidget(QLabel('Number of Wheels:'), 1, 0)
-        self.ugv_num_wheels_input = QSpinBox()
-        self.ugv_num_wheels_input.setRange(2, 12)
-        self.ugv_num_wheels_input.setValue(4)
-        self.ugv_num_wheels_input.setSingleStep(1)
-        ugv_specific_layout.addWidget(self.ugv_num_wheels_input, 1, 1)
-        
-        ugv_specific_layout.addWidget(QLabel('Number of Powered Wheels:'), 2, 0)
-        self.ugv_num_powered_wheels_input = QSpinBox()
-        self.ugv_num_powered_wheels_input.setRange(1, 12)
-        self.ugv_num_powered_wheels_input.setValue(2)
-        self.ugv_num_powered_wheels_input.setSingleStep(1)
-        ugv_specific_layout.addWidget(self.ugv_num_powered_wheels_input, 2, 1)
-        
-        ugv_specific_layout.addWidget(QLabel('Load on each Wheel (kg):'), 3, 0)
-        self.ugv_load_per_wheel_input = QDoubleSpinBox()
-        self.ugv_load_per_wheel_input.setRange(0.0, 1000.0)
-        self.ugv_load_per_wheel_input.setValue(37.5)
-        self.ugv_load_per_wheel_input.setSingleStep(0.1)
-        ugv_specific_layout.addWidget(self.ugv_load_per_wheel_input, 3, 1)
-        
-        ugv_specific_layout.addWidget(QLabel('Torque Req. Climb/Motor (Nm):'), 4, 0)
-        self.ugv_torque_climb_input = QDoubleSpinBox()
-        self.ugv_torque_climb_input.setRange(0.0, 500.0)
-        self.ugv_torque_climb_input.setValue(36.75)
-        self.ugv_torque_climb_input.setSingleStep(0.01)
-        ugv_specific_layout.addWidget(self.ugv_torque_climb_input, 4, 1)
-        
-        ugv_specific_layout.addWidget(QLabel('Track Width (m):'), 5, 0)
-        self.ugv_track_width_input = QDoubleSpinBox()
-        self.ugv_track_width_input.setRange(0.1, 5.0)
-        self.ugv_track_width_input.setValue(0.6)
-        self.ugv_track_width_input.setDecimals(3)
-        self.ugv_track_width_input.setSingleStep(0.01)
-        ugv_specific_layout.addWidget(self.ugv_track_width_input, 5, 1)
-        
-        ugv_specific_layout.addWidget(QLabel('Skid Coefficient μ:'), 6, 0)
-        self.ugv_skid_coefficient_input = QDoubleSpinBox()
-        self.ugv_skid_coefficient_input.setRange(0.1, 2.0)
-        self.ugv_skid_coefficient_input.setValue(0.7)
-        self.ugv_skid_coefficient_input.setDecimals(3)
-        self.ugv_skid_coefficient_input.setSingleStep(0.01)
-        ugv_specific_layout.addWidget(self.ugv_skid_coefficient_input, 6, 1)
-        
-        ugv_specific_layout.addWidget(QLabel('Spin Angular Speed ω (rad/s):'), 7, 0)
-        self.ugv_spin_angular_rad_input = QDoubleSpinBox()
-        self.ugv_spin_angular_rad_input.setRange(0.0, 20.0)
-        self.ugv_spin_angular_rad_input.setValue(0.5)
-        self.ugv_spin_angular_rad_input.setDecimals(3)
-        self.ugv_spin_angular_rad_input.setSingleStep(0.1)
-        ugv_specific_layout.addWidget(self.ugv_spin_angular_rad_input, 7, 1)
-        
-        ugv_specific_layout.addWidget(QLabel('Spin Angular Speed (deg/s):'), 8, 0)
-        self.ugv_spin_angular_deg_input = QDoubleSpinBox()
-        self.ugv_spin_angular_deg_input.setRange(0.0, 1200.0)
-        self.ugv_spin_angular_deg_input.setValue(28.6479)
-        self.ugv_spin_angular_deg_input.setDecimals(4)
-        self.ugv_spin_angular_deg_input.setSingleStep(0.1)
-        ugv_specific_layout.addWidget(self.ugv_spin_angular_deg_input, 8, 1)
-        
-        ugv_specific_group.setLayout(ugv_specific_layout)
-        ugv_main_layout.addWidget(ugv_specific_group)
-        
-        # Reset to Defaults button for UGV
-        ugv_reset_btn = QPushButton('🔄 Reset to Default Values')
-        ugv_reset_btn.setStyleSheet('''
-            QPushButton { background-color: #FF5722; color: white; font-weight: bold; padding: 10px; border: none; border-radius: 5px; }
-            QPushButton:hover { background-color: #E64A19; }
-            QPushButton:pressed { background-color: #BF360C; }
-        ''')
-        ugv_reset_btn.clicked.connect(self.reset_ugv_defaults)
-        ugv_main_layout.addWidget(ugv_reset_btn)
-        
-        self.ugv_params_group.setLayout(ugv_main_layout)
-        layout.addWidget(self.ugv_params_group)
+        # UGV Parameters are built on first use (see _ensure_ugv_params_group); EV is the default
+        self._params_layout = layout
+        self.ugv_params_group = None
         
         # Initially hide comprehensive params (shown only in Output Value Simulation)
         self.ev_params_group.setVisible(False)
-        self.ugv_params_group.setVisible(False)
         
         # Quick Scenarios
         self.scenario_group = QGroupBox('Quick Scenarios')
@@ -3916,53 +3974,32 @@ class EVSimulationApp(QMainWindow):
         self.scenario_btn_group = QButtonGroup(self)
         self.scenario_btn_group.setExclusive(True)
         
-        # Base style for scenario buttons (OFF state)
-        flat_off_style = '''
-            QPushButton { padding: 6px; background-color: #E3F2FD; border: 2px solid #90CAF9; border-radius: 3px; }
-            QPushButton:hover { background-color: #BBDEFB; }
-            QPushButton:checked { background-color: #1565C0; color: white; border: 2px solid #0D47A1; font-weight: bold; }
-        '''
-        gentle_off_style = '''
-            QPushButton { padding: 6px; background-color: #E8F5E9; border: 2px solid #A5D6A7; border-radius: 3px; }
-            QPushButton:hover { background-color: #C8E6C9; }
-            QPushButton:checked { background-color: #2E7D32; color: white; border: 2px solid #1B5E20; font-weight: bold; }
-        '''
-        hill_off_style = '''
-            QPushButton { padding: 6px; background-color: #FFF3E0; border: 2px solid #FFCC80; border-radius: 3px; }
-            QPushButton:hover { background-color: #FFE0B2; }
-            QPushButton:checked { background-color: #EF6C00; color: white; border: 2px solid #E65100; font-weight: bold; }
-        '''
-        steep_off_style = '''
-            QPushButton { padding: 6px; background-color: #FFEBEE; border: 2px solid #FFAB91; border-radius: 3px; }
-            QPushButton:hover { background-color: #FFCDD2; }
-            QPushButton:checked { background-color: #C62828; color: white; border: 2px solid #B71C1C; font-weight: bold; }
-        '''
-        
+        # Scenario button colours (off, hover and checked) come from BUTTON_STYLESHEET
         self.flat_btn = QPushButton('Flat Terrain (0°)')
         self.flat_btn.setCheckable(True)
-        self.flat_btn.setStyleSheet(flat_off_style)
-        self.flat_btn.clicked.connect(lambda: self.load_scenario('flat'))
+        style_button(self.flat_btn, 'flatScenarioButton')
+        self.flat_btn.clicked.connect(partial(self.load_scenario, 'flat'))
         self.scenario_btn_group.addButton(self.flat_btn)
         scenario_layout.addWidget(self.flat_btn)
         
         self.gentle_btn = QPushButton('Gentle Slope (7°)')
         self.gentle_btn.setCheckable(True)
-        self.gentle_btn.setStyleSheet(gentle_off_style)
-        self.gentle_btn.clicked.connect(lambda: self.load_scenario('gentle'))
+        style_button(self.gentle_btn, 'gentleScenarioButton')
+        self.gentle_btn.clicked.connect(partial(self.load_scenario, 'gentle'))
         self.scenario_btn_group.addButton(self.gentle_btn)
         scenario_layout.addWidget(self.gentle_btn)
         
         self.hill_btn = QPushButton('Moderate Hill (15°)')
         self.hill_btn.setCheckable(True)
-        self.hill_btn.setStyleSheet(hill_off_style)
-        self.hill_btn.clicked.connect(lambda: self.load_scenario('hill'))
+        style_button(self.hill_btn, 'hillScenarioButton')
+        self.hill_btn.clicked.connect(partial(self.load_scenario, 'hill'))
         self.scenario_btn_group.addButton(self.hill_btn)
         scenario_layout.addWidget(self.hill_btn)
         
         self.steep_btn = QPushButton('Steep Climb (30°)')
         self.steep_btn.setCheckable(True)
-        self.steep_btn.setStyleSheet(steep_off_style)
-        self.steep_btn.clicked.connect(lambda: self.load_scenario('steep'))
+        style_button(self.steep_btn, 'steepScenarioButton')
+        self.steep_btn.clicked.connect(partial(self.load_scenario, 'steep'))
         self.scenario_btn_group.addButton(self.steep_btn)
         scenario_layout.addWidget(self.steep_btn)
         
@@ -3974,38 +4011,22 @@ class EVSimulationApp(QMainWindow):
         btn_layout = QVBoxLayout(self.btn_layout_widget)
         
         self.run_btn = QPushButton('▶ Run Simulation')
-        self.run_btn.setStyleSheet('''
-            QPushButton { background-color: #4CAF50; color: white; font-weight: bold; padding: 10px; border: none; border-radius: 5px; }
-            QPushButton:hover { background-color: #43A047; }
-            QPushButton:pressed { background-color: #2E7D32; }
-        ''')
+        style_button(self.run_btn, 'runSimulationButton')
         self.run_btn.clicked.connect(self.run_simulation)
         btn_layout.addWidget(self.run_btn)
         
         export_btn = QPushButton('💾 Export Results')
-        export_btn.setStyleSheet('''
-            QPushButton { background-color: #2196F3; color: white; font-weight: bold; padding: 8px; border: none; border-radius: 5px; }
-            QPushButton:hover { background-color: #1E88E5; }
-            QPushButton:pressed { background-color: #1565C0; }
-        ''')
+        style_button(export_btn, 'exportResultsButton')
         export_btn.clicked.connect(self.export_results)
         btn_layout.addWidget(export_btn)
         
         check_suitability_btn = QPushButton('🔍 Check Motor Suitability')
-        check_suitability_btn.setStyleSheet('''
-            QPushButton { background-color: #9C27B0; color: white; font-weight: bold; padding: 8px; border: none; border-radius: 5px; }
-            QPushButton:hover { background-color: #8E24AA; }
-            QPushButton:pressed { background-color: #6A1B9A; }
-        ''')
+        style_button(check_suitability_btn, 'motorSuitabilityButton')
         check_suitability_btn.clicked.connect(self.check_motor_suitability)
         btn_layout.addWidget(check_suitability_btn)
         
         reset_btn = QPushButton('🔄 Reset')
-        reset_btn.setStyleSheet('''
-            QPushButton { background-color: #FF9800; color: white; font-weight: bold; padding: 8px; border: none; border-radius: 5px; }
-            QPushButton:hover { background-color: #FB8C00; }
-            QPushButton:pressed { background-color: #EF6C00; }
-        ''')
+        style_button(reset_btn, 'resetSimulationButton')
         reset_btn.clicked.connect(self.reset_simulation)
         btn_layout.addWidget(reset_btn)
         
@@ -4019,11 +4040,7 @@ class EVSimulationApp(QMainWindow):
         
         # Output value compute button - STICKY at bottom (outside scroll area)
         self.output_compute_btn = QPushButton('🧮 Compute Output Values')
-        self.output_compute_btn.setStyleSheet('''
-            QPushButton { background-color: #28a745; color: white; font-weight: bold; padding: 12px; border: none; border-radius: 5px; font-size: 14px; }
-            QPushButton:hover { background-color: #218838; }
-            QPushButton:pressed { background-color: #1e7e34; }
-        ''')
+        style_button(self.output_compute_btn, 'computeOutputButton')
         self.output_compute_btn.clicked.connect(self.compute_output_values)
         self.output_compute_btn.setVisible(False)  # Hidden by default, shown in Output mode
         self.output_compute_btn.setMinimumHeight(45)
@@ -4043,21 +4060,17 @@ class EVSimulationApp(QMainWindow):
         # Tab widget for different plots
         self.tab_widget = QTabWidget()
         
-        # Speed plot
-        self.speed_canvas = PlotCanvas(self, width=8, height=6)
-        self.tab_widget.addTab(self.speed_canvas, '📈 Speed')
-        
-        # Power plot
-        self.power_canvas = PlotCanvas(self, width=8, height=6)
-        self.tab_widget.addTab(self.power_canvas, '⚡ Power')
-        
-        # Forces plot
-        self.forces_canvas = PlotCanvas(self, width=8, height=6)
-        self.tab_widget.addTab(self.forces_canvas, '🔧 Forces')
-        
-        # Motor plot
-        self.motor_canvas = PlotCanvas(self, width=8, height=6)
-        self.tab_widget.addTab(self.motor_canvas, '⚙️ Motor')
+        # Speed, Power, Forces and Motor plots - each PlotCanvas is built the first time its
+        # tab is shown with a plot waiting, so startup pays for no matplotlib figures
+        self._graph_canvas_pages = {}
+        for attr, title in (('speed_canvas', '📈 Speed'), ('power_canvas', '⚡ Power'),
+                            ('forces_canvas', '🔧 Forces'), ('motor_canvas', '⚙️ Motor')):
+            page = QWidget()
+            page.setStyleSheet("background-color: white;")
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            setattr(self, attr, None)
+            self._graph_canvas_pages[page] = attr
+            self.tab_widget.addTab(page, title)
         
         # Data Table tab for graph simulation parameters
         self.graph_sim_tab = QWidget()
@@ -4072,15 +4085,17 @@ class EVSimulationApp(QMainWindow):
         
         graph_sim_layout.addLayout(header_layout)
         
-        # Table widget
-        self.graph_data_table = QTableWidget()
+        # Table view backed by the simulation rows
+        self.graph_table_model = GraphDataTableModel(self)
+        self.graph_data_table = QTableView()
+        self.graph_data_table.setModel(self.graph_table_model)
         self.graph_data_table.setAlternatingRowColors(True)
         self.graph_data_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #d0d0d0;
                 background-color: white;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
             QHeaderView::section {
@@ -4094,6 +4109,7 @@ class EVSimulationApp(QMainWindow):
         graph_sim_layout.addWidget(self.graph_data_table)
         
         self.tab_widget.addTab(self.graph_sim_tab, '📋 Data Table')
+        self.tab_widget.currentChanged.connect(self._flush_graph_plot)
         
         layout.addWidget(self.tab_widget)
         
@@ -4101,21 +4117,17 @@ class EVSimulationApp(QMainWindow):
     
     def load_scenario(self, scenario_type):
         """Load predefined scenario"""
-        if scenario_type == 'flat':
-            self.gradient_input.setValue(0)
-        elif scenario_type == 'gentle':
-            self.gradient_input.setValue(7)
-        elif scenario_type == 'hill':
-            self.gradient_input.setValue(15)
-        elif scenario_type == 'steep':
-            self.gradient_input.setValue(30)
+        self.gradient_input.setValue(SCENARIO_GRADIENTS[scenario_type])
         
-        self.statusBar().showMessage(f'Loaded {scenario_type} terrain scenario')
+        self._status.showMessage(f'Loaded {scenario_type} terrain scenario')
     
     def run_simulation(self):
         """Run the simulation - directly generates table data"""
         self.run_btn.setEnabled(False)
-        self.statusBar().showMessage('Running simulation...')
+        self._status.showMessage('Running simulation...')
+        
+        # Apply any edit still waiting on the debounce timer before the calculated fields are read
+        self.update_graph_sim_calculated_values()
         
         # Directly generate table data (no background thread needed - it's fast)
         self.generate_graph_simulation_data()
@@ -4142,14 +4154,7 @@ class EVSimulationApp(QMainWindow):
             motor_name = motor['name']
         
         # Get vehicle parameters
-        gvw = EV_DEFAULTS['gvw']
-        gear_ratio = EV_DEFAULTS['gear_ratio']
-        gear_efficiency = EV_DEFAULTS['gear_efficiency'] / 100.0
-        wheel_radius = EV_DEFAULTS['wheel_radius']
-        cr = EV_DEFAULTS['cr']
-        cd = EV_DEFAULTS['cd']
-        air_density = EV_DEFAULTS['air_density']
-        frontal_area = EV_DEFAULTS['frontal_area']
+        gvw, gear_efficiency, gear_ratio, wheel_radius, cr, cd, air_density, frontal_area = GRAPH_SIM_VEHICLE
         num_motors = self.init_num_power_wheels.value()
         
         # Performance requirements from EV_DEFAULTS
@@ -4233,16 +4238,18 @@ class EVSimulationApp(QMainWindow):
         msg.setIcon(QMessageBox.Icon.Information if overall_suitable else QMessageBox.Icon.Warning)
         msg.exec()
         
-        self.statusBar().showMessage(f"Motor suitability check: {'SUITABLE' if overall_suitable else 'NOT SUITABLE'}")
+        self._status.showMessage(f"Motor suitability check: {'SUITABLE' if overall_suitable else 'NOT SUITABLE'}")
     
     def _calculate_max_speed(self, peak_power, num_motors, efficiency, gvw, cr, cd, air_density, frontal_area):
         """Calculate maximum achievable speed given motor power"""
         power_available = peak_power * num_motors * efficiency
+        # Speed-independent terms, computed once for the whole scan
+        F_roll = cr * gvw * 9.81
+        drag_coefficient = 0.5 * cd * air_density * frontal_area
         # Iterative approximation
         for speed_kmph in range(1, 200):
             speed_ms = speed_kmph / 3.6
-            F_roll = cr * gvw * 9.81
-            F_drag = 0.5 * cd * air_density * frontal_area * (speed_ms ** 2)
+            F_drag = drag_coefficient * (speed_ms ** 2)
             power_required = (F_roll + F_drag) * speed_ms
             if power_required > power_available:
                 return speed_kmph - 1
@@ -4250,14 +4257,15 @@ class EVSimulationApp(QMainWindow):
     
     def _calculate_max_gradient(self, peak_torque, num_motors, gvw, gear_ratio, gear_efficiency, wheel_radius, cr, cd, air_density, frontal_area, speed_ms):
         """Calculate maximum climbable gradient given motor torque"""
-        import math
         max_tractive_force = (peak_torque * num_motors * gear_ratio * gear_efficiency) / wheel_radius
         F_drag = 0.5 * cd * air_density * frontal_area * (speed_ms ** 2)
         
-        for gradient_deg in range(0, 90):
-            gradient_rad = math.radians(gradient_deg)
-            F_roll = cr * gvw * 9.81 * math.cos(gradient_rad)
-            F_climb = gvw * 9.81 * math.sin(gradient_rad)
+        # Gradient-independent terms; the trig per gradient comes from GRADIENT_SCAN_TRIG
+        roll_weight = cr * gvw * 9.81
+        weight = gvw * 9.81
+        for gradient_deg, (cos_gradient, sin_gradient) in enumerate(GRADIENT_SCAN_TRIG):
+            F_roll = roll_weight * cos_gradient
+            F_climb = weight * sin_gradient
             F_total = F_roll + F_drag + F_climb
             if F_total > max_tractive_force:
                 return gradient_deg - 1
@@ -4273,147 +4281,161 @@ class EVSimulationApp(QMainWindow):
             QMessageBox.warning(self, 'No Data', 'Please run a simulation first!')
             return
         
-        # Ask user for export file location (Excel format)
+        # Ask user for export file location (Excel by default, CSV on request)
         filename, _ = QFileDialog.getSaveFileName(
-            self, 'Export Results', 'simulation_results.xlsx', 'Excel Files (*.xlsx);;All Files (*)'
+            self, 'Export Results', 'simulation_results.xlsx',
+            'Excel Files (*.xlsx);;CSV Files (*.csv);;All Files (*)'
         )
         
         if filename:
             try:
-                with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                    # Export simulation table data
-                    df_table = pd.DataFrame(self.graph_simulation_data)
-                    df_table.to_excel(writer, sheet_name='Simulation Data', index=False)
+                if filename.lower().endswith('.csv'):
+                    # CSV is streamed row by row straight from the columns - no DataFrame, no pandas
+                    import csv
+                    columns = self.graph_simulation_data
+                    with open(filename, 'w', newline='', encoding='utf-8') as csv_file:
+                        writer = csv.writer(csv_file)
+                        writer.writerow(columns)
+                        writer.writerows(zip(*columns.values()))
+                else:
+                    # pandas is only needed for Excel export, so it is imported on first use rather than at startup
+                    import pandas as pd
+                    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+                        # Export simulation table data
+                        df_table = pd.DataFrame(self.graph_simulation_data)
+                        df_table.to_excel(writer, sheet_name='Simulation Data', index=False)
                 
                 # Success message
-                message = f'Exported to:\n{filename}\n\nRows: {len(self.graph_simulation_data)}'
+                message = f'Exported to:\n{filename}\n\nRows: {len(self.graph_simulation_data["Time"])}'
                 QMessageBox.information(self, 'Export Successful', message)
-                self.statusBar().showMessage(f'Exported {len(self.graph_simulation_data)} rows to {filename}')
+                self._status.showMessage(f'Exported {len(self.graph_simulation_data["Time"])} rows to {filename}')
             
             except Exception as e:
                 QMessageBox.critical(self, 'Export Failed', f'Error exporting data:\n{str(e)}')
-                self.statusBar().showMessage('Export failed')
+                self._status.showMessage('Export failed')
+    
+    def _cache_sin_grade(self, prefix, degrees):
+        """Store sin(gradeability) for the 'ev' or 'ugv' parameter panel"""
+        self._sin_grade[prefix] = math.sin(degrees * DEG_TO_RAD)
     
     def update_ev_calculated_weights(self):
         """Auto-update calculated weight fields based on formulas"""
-        # Formula: kerb_weight = battery_weight_input + vehicle_weight
         battery_weight = self.ev_battery_weight_input.value()
         vehicle_weight = self.ev_vehicle_weight_input.value()
-        kerb_weight = battery_weight + vehicle_weight
-        self.ev_kerb_weight_input.setValue(kerb_weight)
+        passenger_weight = self.ev_passenger_weight_input.value()
+        inputs = (battery_weight, vehicle_weight, passenger_weight)
+        if self._derived_inputs.get('ev') == inputs:
+            return  # Calculated fields already match these inputs
+        self._derived_inputs['ev'] = inputs
         
+        # Formula: kerb_weight = battery_weight_input + vehicle_weight
+        kerb_weight = battery_weight + vehicle_weight
         # Formula: gvw = kerb_weight + passenger_weight
-        passenger_weight = self.ev_passenger_weight_input.value()
         gvw = kerb_weight + passenger_weight
-        self.ev_gvw_input.setValue(gvw)
+        
+        # The calculated fields are display-only, so writing them must not emit valueChanged
+        with QSignalBlocker(self.ev_kerb_weight_input), QSignalBlocker(self.ev_gvw_input):
+            self.ev_kerb_weight_input.setValue(kerb_weight)
+            self.ev_gvw_input.setValue(gvw)
     
     def update_ugv_calculated_weights(self):
         """Auto-update UGV calculated weight fields based on formulas"""
-        # Formula: kerb_weight = battery_weight_input + vehicle_weight
         battery_weight = self.ugv_battery_weight_input.value()
         vehicle_weight = self.ugv_vehicle_weight_input.value()
-        kerb_weight = battery_weight + vehicle_weight
-        self.ugv_kerb_weight_input.setValue(kerb_weight)
+        passenger_weight = self.ugv_passenger_weight_input.value()
+        inputs = (battery_weight, vehicle_weight, passenger_weight)
+        if self._derived_inputs.get('ugv') == inputs:
+            return  # Calculated fields already match these inputs
+        self._derived_inputs['ugv'] = inputs
         
+        # Formula: kerb_weight = battery_weight_input + vehicle_weight
+        kerb_weight = battery_weight + vehicle_weight
         # Formula: gvw = kerb_weight + passenger_weight
-        passenger_weight = self.ugv_passenger_weight_input.value()
         gvw = kerb_weight + passenger_weight
-        self.ugv_gvw_input.setValue(gvw)
+        
+        # The calculated fields are display-only, so writing them must not emit valueChanged
+        with QSignalBlocker(self.ugv_kerb_weight_input), QSignalBlocker(self.ugv_gvw_input):
+            self.ugv_kerb_weight_input.setValue(kerb_weight)
+            self.ugv_gvw_input.setValue(gvw)
     
     def update_graph_sim_calculated_values(self):
         """Auto-update graph simulation calculated fields based on formulas"""
-        # Formula 1: init_vehicle_speed_kmph = init_vehicle_speed_ms * 3.6
         speed_ms = self.init_vehicle_speed_ms.value()
+        motor_key = self.motor_combo.currentText()
+        mode = self.mode_combo.currentText()
+        num_power_wheels = self.init_num_power_wheels.value()
+        inputs = (speed_ms, motor_key, mode, self.custom_peak_torque.value(), self.custom_peak_power.value(),
+                  num_power_wheels, self.gradient_input.value())
+        if self._derived_inputs.get('graph') == inputs:
+            return  # Calculated fields already match these inputs
+        self._derived_inputs['graph'] = inputs
+        gvw, gear_efficiency, gear_ratio, wheel_radius, cr, cd, air_density, frontal_area = GRAPH_SIM_VEHICLE
+        
+        # Formula 1: init_vehicle_speed_kmph = init_vehicle_speed_ms * 3.6
         speed_kmph = speed_ms * 3.6
         self.init_vehicle_speed_kmph.setValue(speed_kmph)
         
         # Formula 2: init_motor_speed_rpm = (speed_kmph * gear_ratio) / (2 * π * wheel_radius * 0.001 * 60)
-        # Uses EV_DEFAULTS for gear_ratio and wheel_radius
-        gear_ratio = EV_DEFAULTS['gear_ratio']
-        wheel_radius = EV_DEFAULTS['wheel_radius']
-        motor_rpm = (speed_kmph * gear_ratio) / (2 * 3.14159 * wheel_radius * 0.001 * 60)
+        # Uses the reference EV's gear_ratio and wheel_radius
+        motor_rpm = (speed_kmph * gear_ratio) / (TWO_PI * wheel_radius * 0.001 * 60)
         self.init_motor_speed_rpm.setValue(motor_rpm)
         
         # Formula 3: init_total_motor_torque based on mode, motor selection, and motor RPM
-        # Get motor parameters from selection
-        motor_key = self.motor_combo.currentText()
-        mode = self.mode_combo.currentText()
-        
-        # Get motor specs based on selection
+        # Get torque curve based on selection (boost = peak, eco = continuous)
         if motor_key == 'Customize':
             # Use custom input values
             peak_torque = self.custom_peak_torque.value()
             peak_power = self.custom_peak_power.value()
-            continuous_torque = peak_torque / 2  # Default assumption
-            continuous_power = peak_power / 2
             base_rpm = 500  # Default
+            if mode == 'boost':
+                torque_curve = (base_rpm, peak_torque, peak_power * 60 / TWO_PI)
+            else:  # eco mode - half of peak by default assumption
+                torque_curve = (base_rpm, peak_torque / 2, (peak_power / 2) * 60 / TWO_PI)
         else:
-            # Use predefined motor specs from GPM_MOTORS
-            motor = GPM_MOTORS.get(motor_key, GPM_MOTORS['Default'])
-            peak_torque = motor['peak_torque_nm']
-            peak_power = motor['peak_power_w']
-            continuous_torque = motor['continuous_torque_nm']
-            continuous_power = motor['continuous_power_w']
-            base_rpm = motor['base_rpm']
-        
-        # Select torque and power based on mode (boost = peak, eco = continuous)
-        if mode == 'boost':
-            torque_per_motor = peak_torque
-            power_per_motor = peak_power
-        else:  # eco mode
-            torque_per_motor = continuous_torque
-            power_per_motor = continuous_power
+            # Use precomputed curve from GPM_MOTORS
+            torque_curve = MOTOR_TORQUE_CURVES.get((motor_key, mode), MOTOR_TORQUE_CURVES[('Default', mode)])
+        rpm_threshold, constant_torque, constant_power_num = torque_curve
         
         # Calculate torque based on motor RPM (constant torque below base RPM, constant power above)
-        if motor_rpm < base_rpm:
-            torque = torque_per_motor  # Constant torque region
+        if motor_rpm < rpm_threshold:
+            torque = constant_torque  # Constant torque region
         else:
             # Constant power region: P = (2π × RPM × T) / 60 → T = (P × 60) / (2π × RPM)
-            torque = (power_per_motor * 60) / (2 * 3.14159 * motor_rpm)
+            torque = constant_power_num / motor_rpm
         
         # Total torque from all motors (currently using 2 motors)
-        num_power_wheels = self.init_num_power_wheels.value()
         total_torque = torque * num_power_wheels
         self.init_total_motor_torque.setValue(total_torque)
 
         
         # Formula 4: init_per_motor_torque = total_torque / num_power_wheels
-        num_power_wheels = self.init_num_power_wheels.value()
         per_motor_torque = total_torque / num_power_wheels
         self.init_per_motor_torque.setValue(per_motor_torque)
         
         # Formula 5: init_per_motor_power = (2π × RPM × per_motor_torque) / 60
-        per_motor_power = (2 * 3.14159 * motor_rpm * per_motor_torque) / 60
+        per_motor_power = (TWO_PI * motor_rpm * per_motor_torque) / 60
         self.init_per_motor_power.setValue(per_motor_power)
         
         # Formula 6: init_tractive_force = (total_torque × gear_efficiency × gear_ratio) / wheel_radius
-        # Uses EV_DEFAULTS for gear_efficiency, gear_ratio, and wheel_radius
-        gear_efficiency = EV_DEFAULTS['gear_efficiency'] / 100.0  # Convert % to decimal
-        gear_ratio = EV_DEFAULTS['gear_ratio']
-        wheel_radius = EV_DEFAULTS['wheel_radius']
+        # Uses the reference EV's gear_efficiency, gear_ratio, and wheel_radius
         tractive_force = (total_torque * gear_efficiency * gear_ratio) / wheel_radius
         self.init_tractive_force.setValue(tractive_force)
         
         # Formula 7: init_froll = cr × mass × g (rolling resistance)
-        # Uses EV_DEFAULTS for cr and gvw
-        cr = EV_DEFAULTS['cr']
-        gvw = EV_DEFAULTS['gvw']
+        # Uses the reference EV's cr and gvw
         froll = cr * gvw * 9.81
         self.init_froll.setValue(froll)
         
         # Formula 8: init_fdrag = cd × air_density × frontal_area × speed² × 0.03858025308642 (aerodynamic drag)
-        # Uses EV_DEFAULTS for cd, air_density, frontal_area
-        cd = EV_DEFAULTS['cd']
-        air_density = EV_DEFAULTS['air_density']
-        frontal_area = EV_DEFAULTS['frontal_area']
+        # Uses the reference EV's cd, air_density, frontal_area
         fdrag = cd * air_density * frontal_area * speed_kmph * speed_kmph * 0.03858025308642
         self.init_fdrag.setValue(fdrag)
         
         # Formula 9: init_fclimb = mass × g × sin(gradient) (climbing force)
-        # Uses EV_DEFAULTS for gvw
+        # Uses the reference EV's gvw
         import math
         gradient_deg = self.gradient_input.value()
-        fclimb = gvw * 9.81 * math.sin(gradient_deg * 0.01745329)
+        fclimb = gvw * 9.81 * math.sin(gradient_deg * DEG_TO_RAD)
         self.init_fclimb.setValue(fclimb)
         
         # Formula 10: init_fload = froll + fdrag + fclimb (total load resistance)
@@ -4429,145 +4451,198 @@ class EVSimulationApp(QMainWindow):
         vehicle_accel = fnet / gvw
         self.init_vehicle_accel.setValue(vehicle_accel)
     
+    @contextmanager
+    def _bulk_update(self, widgets):
+        """Block widget signals and window repaints while a batch of values is applied"""
+        self.setUpdatesEnabled(False)
+        blockers = [QSignalBlocker(widget) for widget in widgets]
+        try:
+            yield
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            self.setUpdatesEnabled(True)
+            self.update()
+    
     def reset_ev_defaults(self):
         """Reset EV parameters to default values from EV_DEFAULTS constants"""
-        # Physical Parameters
-        self.ev_cd_input.setValue(EV_DEFAULTS['cd'])
-        self.ev_cr_input.setValue(EV_DEFAULTS['cr'])
-        self.ev_wheel_radius_input.setValue(EV_DEFAULTS['wheel_radius'])
-        self.ev_air_density_input.setValue(EV_DEFAULTS['air_density'])
-        self.ev_frontal_area_input.setValue(EV_DEFAULTS['frontal_area'])
-        
-        # Drivetrain Parameters
-        self.ev_gear_ratio_input.setValue(EV_DEFAULTS['gear_ratio'])
-        self.ev_gear_efficiency_input.setValue(EV_DEFAULTS['gear_efficiency'])
-        self.ev_motor_efficiency_input.setValue(EV_DEFAULTS['motor_efficiency'])
-        self.ev_motor_base_rpm_input.setValue(EV_DEFAULTS['motor_base_rpm'])
-        
-        # Weight Parameters
-        self.ev_kerb_weight_input.setValue(EV_DEFAULTS['kerb_weight'])
-        self.ev_passenger_weight_input.setValue(EV_DEFAULTS['passenger_weight'])
-        self.ev_gvw_input.setValue(EV_DEFAULTS['gvw'])
-        self.ev_motor_controller_weight_input.setValue(EV_DEFAULTS['motor_controller_weight'])
-        self.ev_battery_weight_input.setValue(EV_DEFAULTS['battery_weight_input'])
-        self.ev_vehicle_weight_input.setValue(EV_DEFAULTS['vehicle_weight'])
-        self.ev_other_weights_input.setValue(EV_DEFAULTS['other_weights'])
-        self.ev_generator_weight_input.setValue(EV_DEFAULTS['generator_weight'])
-        
-        # Battery Parameters
-        self.ev_battery_req_input.setCurrentText(EV_DEFAULTS['battery_requirements'])
-        self.ev_battery_chem_input.setCurrentText(EV_DEFAULTS['battery_chemistry'])
-        self.ev_battery_voltage_input.setValue(EV_DEFAULTS['battery_voltage'])
-        self.ev_weight_per_wh_input.setValue(EV_DEFAULTS['weight_per_wh'])
-        self.ev_peukert_input.setValue(EV_DEFAULTS['peukert_coeff'])
-        self.ev_discharge_hr_input.setValue(EV_DEFAULTS['discharge_hr'])
-        self.ev_dod_input.setValue(EV_DEFAULTS['dod_pct'])
-        self.ev_battery_current_input.setValue(EV_DEFAULTS['battery_current'])
-        self.ev_true_capacity_wh_input.setValue(EV_DEFAULTS['true_capacity_wh'])
-        self.ev_true_capacity_ah_input.setValue(EV_DEFAULTS['true_capacity_ah'])
-        self.ev_tentative_ah_input.setValue(EV_DEFAULTS['tentative_ah'])
-        self.ev_tentative_wh_input.setValue(EV_DEFAULTS['tentative_wh'])
-        self.ev_battery_weight_total_input.setValue(EV_DEFAULTS['battery_weight_total'])
-        
-        # Performance Parameters
-        self.ev_rotary_inertia_input.setValue(EV_DEFAULTS['rotary_inertia'])
-        self.ev_max_speed_input.setValue(EV_DEFAULTS['max_speed'])
-        self.ev_slope_speed_input.setValue(EV_DEFAULTS['slope_speed'])
-        self.ev_gradeability_input.setValue(EV_DEFAULTS['gradeability'])
-        self.ev_accel_end_speed_input.setValue(EV_DEFAULTS['accel_end_speed'])
-        self.ev_accel_period_input.setValue(EV_DEFAULTS['accel_period'])
-        self.ev_vehicle_range_input.setValue(EV_DEFAULTS['vehicle_range'])
+        widgets = [widget for widget, _, _ in self._ev_reset_plan]
+        with self._bulk_update(widgets):
+            for widget, key, setter in self._ev_reset_plan:
+                getattr(widget, setter)(EV_DEFAULTS[key])
+        
+        # Signals were blocked above, so refresh derived values once
+        self.update_ev_calculated_weights()
+        self._cache_sin_grade('ev', self.ev_gradeability_input.value())
+        self._sync_ev_params()
         
         # Clear output area
+        self.output_text.setUpdatesEnabled(False)
         self.output_text.clear()
+        self.output_text.setUpdatesEnabled(True)
+        self._shown_ev_snapshot = None
+        self._ev_output_cells = None
+        self._pending_output = None
         
-        self.statusBar().showMessage('EV parameters reset to defaults')
+        self._status.showMessage('EV parameters reset to defaults')
     
     def reset_ugv_defaults(self):
         """Reset UGV parameters to default values using UGV_DEFAULTS dictionary"""
-        # Physical Parameters
-        self.ugv_cd_input.setValue(UGV_DEFAULTS['cd'])
-        self.ugv_cr_input.setValue(UGV_DEFAULTS['cr'])
-        self.ugv_wheel_radius_input.setValue(UGV_DEFAULTS['wheel_radius'])
-        self.ugv_air_density_input.setValue(UGV_DEFAULTS['air_density'])
-        self.ugv_frontal_area_input.setValue(UGV_DEFAULTS['frontal_area'])
-        
-        # Drivetrain Parameters
-        self.ugv_gear_ratio_input.setValue(UGV_DEFAULTS['gear_ratio'])
-        self.ugv_gear_efficiency_input.setValue(UGV_DEFAULTS['gear_efficiency'])
-        self.ugv_motor_efficiency_input.setValue(UGV_DEFAULTS['motor_efficiency'])
-        self.ugv_motor_base_rpm_input.setValue(UGV_DEFAULTS['motor_base_rpm'])
-        
-        # Weight Parameters
-        self.ugv_kerb_weight_input.setValue(UGV_DEFAULTS['kerb_weight'])
-        self.ugv_passenger_weight_input.setValue(UGV_DEFAULTS['passenger_weight'])
-        self.ugv_gvw_input.setValue(UGV_DEFAULTS['gvw'])
-        self.ugv_motor_controller_weight_input.setValue(UGV_DEFAULTS['motor_controller_weight'])
-        self.ugv_battery_weight_input.setValue(UGV_DEFAULTS['battery_weight_input'])
-        self.ugv_vehicle_weight_input.setValue(UGV_DEFAULTS['vehicle_weight'])
-        self.ugv_other_weights_input.setValue(UGV_DEFAULTS['other_weights'])
-        self.ugv_generator_weight_input.setValue(UGV_DEFAULTS['generator_weight'])
-        
-        # Battery Parameters
-        self.ugv_battery_req_input.setCurrentText(UGV_DEFAULTS['battery_requirements'])
-        self.ugv_battery_chem_input.setCurrentText(UGV_DEFAULTS['battery_chemistry'])
-        self.ugv_battery_voltage_input.setValue(UGV_DEFAULTS['battery_voltage'])
-        self.ugv_weight_per_wh_input.setValue(UGV_DEFAULTS['weight_per_wh'])
-        self.ugv_peukert_input.setValue(UGV_DEFAULTS['peukert_coeff'])
-        self.ugv_discharge_hr_input.setValue(UGV_DEFAULTS['discharge_hr'])
-        self.ugv_dod_input.setValue(UGV_DEFAULTS['dod_pct'])
-        self.ugv_battery_current_input.setValue(UGV_DEFAULTS['battery_current'])
-        self.ugv_true_capacity_wh_input.setValue(UGV_DEFAULTS['true_capacity_wh'])
-        self.ugv_true_capacity_ah_input.setValue(UGV_DEFAULTS['true_capacity_ah'])
-        self.ugv_tentative_ah_input.setValue(UGV_DEFAULTS['tentative_ah'])
-        self.ugv_tentative_wh_input.setValue(UGV_DEFAULTS['tentative_wh'])
-        self.ugv_battery_weight_total_input.setValue(UGV_DEFAULTS['battery_weight_total'])
-        
-        # Performance Parameters
-        self.ugv_rotary_inertia_input.setValue(UGV_DEFAULTS['rotary_inertia'])
-        self.ugv_max_speed_input.setValue(UGV_DEFAULTS['max_speed'])
-        self.ugv_slope_speed_input.setValue(UGV_DEFAULTS['slope_speed'])
-        self.ugv_gradeability_input.setValue(UGV_DEFAULTS['gradeability'])
-        self.ugv_accel_end_speed_input.setValue(UGV_DEFAULTS['accel_end_speed'])
-        self.ugv_accel_period_input.setValue(UGV_DEFAULTS['accel_period'])
-        self.ugv_vehicle_range_input.setValue(UGV_DEFAULTS['vehicle_range'])
-        
-        # UGV-Specific Parameters
-        self.ugv_step_height_input.setValue(UGV_DEFAULTS['step_height'])
-        self.ugv_num_wheels_input.setValue(UGV_DEFAULTS['num_wheels'])
-        self.ugv_num_powered_wheels_input.setValue(UGV_DEFAULTS['num_powered_wheels'])
-        self.ugv_load_per_wheel_input.setValue(UGV_DEFAULTS['load_per_wheel'])
-        self.ugv_torque_climb_input.setValue(UGV_DEFAULTS['torque_climb'])
-        self.ugv_track_width_input.setValue(UGV_DEFAULTS['track_width'])
-        self.ugv_skid_coefficient_input.setValue(UGV_DEFAULTS['skid_coefficient'])
-        self.ugv_spin_angular_rad_input.setValue(UGV_DEFAULTS['spin_angular_rad'])
-        self.ugv_spin_angular_deg_input.setValue(UGV_DEFAULTS['spin_angular_deg'])
+        widgets = [widget for widget, _, _ in self._ugv_reset_plan]
+        with self._bulk_update(widgets):
+            for widget, key, setter in self._ugv_reset_plan:
+                getattr(widget, setter)(UGV_DEFAULTS[key])
+        
+        # Signals were blocked above, so refresh derived values once
+        self.update_ugv_calculated_weights()
+        self._cache_sin_grade('ugv', self.ugv_gradeability_input.value())
         
         # Clear output area
+        self.output_text.setUpdatesEnabled(False)
         self.output_text.clear()
+        self.output_text.setUpdatesEnabled(True)
+        self._shown_ev_snapshot = None
+        self._ev_output_cells = None
+        self._pending_output = None
         
-        self.statusBar().showMessage('UGV parameters reset to defaults')
+        self._status.showMessage('UGV parameters reset to defaults')
     
     def reset_simulation(self):
         """Reset simulation and parameters to defaults"""
         # Clear table data
         if hasattr(self, 'graph_simulation_data'):
-            self.graph_simulation_data = []
+            self.graph_simulation_data = {}
         
-        # Clear table widget
-        self.graph_data_table.setRowCount(0)
+        # Clear table view with a single model reset
+        self.graph_table_model.clear()
+        self._pending_graph_plots.clear()
         
         # Reset simulation parameters to defaults
         self.gradient_input.setValue(GRAPH_SIM_DEFAULTS['gradient_deg'])
         self.mode_combo.setCurrentIndex(0)  # boost (matches GRAPH_SIM_DEFAULTS['mode'])
         
-        # Clear plots
-        for canvas in [self.speed_canvas, self.power_canvas, 
-                      self.forces_canvas, self.motor_canvas]:
-            canvas.fig.clear()
-            canvas.draw()
+        # Clear plots - only canvases that were actually drawn need a fresh render.
+        # draw_idle() only schedules the paint; flush the queued repaints together once.
+        if self._dirty_canvases:
+            for canvas in self._dirty_canvases:
+                canvas.fig.clear()
+                canvas.draw_idle()
+            self._dirty_canvases.clear()
+            QApplication.processEvents()
         
-        self.statusBar().showMessage('Simulation reset - parameters unchanged')
+        self._status.showMessage('Simulation reset - parameters unchanged')
+
+
+# Light theme palette entries: (color role, (r, g, b))
+LIGHT_PALETTE_COLORS = (
+    # Window colors
+    (QPalette.ColorRole.Window, (240, 240, 240)),
+    (QPalette.ColorRole.WindowText, (0, 0, 0)),
+    # Base colors (input fields)
+    (QPalette.ColorRole.Base, (255, 255, 255)),
+    (QPalette.ColorRole.AlternateBase, (245, 245, 245)),
+    # Text colors
+    (QPalette.ColorRole.Text, (0, 0, 0)),
+    (QPalette.ColorRole.BrightText, (255, 255, 255)),
+    # Button colors
+    (QPalette.ColorRole.Button, (225, 225, 225)),
+    (QPalette.ColorRole.ButtonText, (0, 0, 0)),
+    # Selection colors
+    (QPalette.ColorRole.Highlight, (0, 120, 215)),
+    (QPalette.ColorRole.HighlightedText, (255, 255, 255)),
+    # Disabled colors
+    (QPalette.ColorRole.Light, (255, 255, 255)),
+    (QPalette.ColorRole.Midlight, (227, 227, 227)),
+    (QPalette.ColorRole.Dark, (160, 160, 160)),
+    (QPalette.ColorRole.Mid, (180, 180, 180)),
+    (QPalette.ColorRole.Shadow, (105, 105, 105)),
+)
+
+# Shared QColor instances, one per distinct RGB value in the palette
+COLOR_POOL = {rgb: QColor(*rgb) for _, rgb in LIGHT_PALETTE_COLORS}
+
+# Push button style rules, selected by object name. Set on each styled button rather than the
+# application: any app-level sheet reroutes every widget (spinboxes included) through the style sheet renderer.
+BUTTON_STYLESHEET = '''
+    QPushButton#vehicleResetButton { background-color: #FF5722; color: white; font-weight: bold; padding: 10px; border: none; border-radius: 5px; }
+    QPushButton#vehicleResetButton:hover { background-color: #E64A19; }
+    QPushButton#vehicleResetButton:pressed { background-color: #BF360C; }
+    QPushButton#runSimulationButton { background-color: #4CAF50; color: white; font-weight: bold; padding: 10px; border: none; border-radius: 5px; }
+    QPushButton#runSimulationButton:hover { background-color: #43A047; }
+    QPushButton#runSimulationButton:pressed { background-color: #2E7D32; }
+    QPushButton#exportResultsButton { background-color: #2196F3; color: white; font-weight: bold; padding: 8px; border: none; border-radius: 5px; }
+    QPushButton#exportResultsButton:hover { background-color: #1E88E5; }
+    QPushButton#exportResultsButton:pressed { background-color: #1565C0; }
+    QPushButton#motorSuitabilityButton { background-color: #9C27B0; color: white; font-weight: bold; padding: 8px; border: none; border-radius: 5px; }
+    QPushButton#motorSuitabilityButton:hover { background-color: #8E24AA; }
+    QPushButton#motorSuitabilityButton:pressed { background-color: #6A1B9A; }
+    QPushButton#resetSimulationButton { background-color: #FF9800; color: white; font-weight: bold; padding: 8px; border: none; border-radius: 5px; }
+    QPushButton#resetSimulationButton:hover { background-color: #FB8C00; }
+    QPushButton#resetSimulationButton:pressed { background-color: #EF6C00; }
+    QPushButton#computeOutputButton { background-color: #28a745; color: white; font-weight: bold; padding: 12px; border: none; border-radius: 5px; font-size: 14px; }
+    QPushButton#computeOutputButton:hover { background-color: #218838; }
+    QPushButton#computeOutputButton:pressed { background-color: #1e7e34; }
+    QPushButton#flatScenarioButton { padding: 6px; background-color: #E3F2FD; border: 2px solid #90CAF9; border-radius: 3px; }
+    QPushButton#flatScenarioButton:hover { background-color: #BBDEFB; }
+    QPushButton#flatScenarioButton:checked { background-color: #1565C0; color: white; border: 2px solid #0D47A1; font-weight: bold; }
+    QPushButton#gentleScenarioButton { padding: 6px; background-color: #E8F5E9; border: 2px solid #A5D6A7; border-radius: 3px; }
+    QPushButton#gentleScenarioButton:hover { background-color: #C8E6C9; }
+    QPushButton#gentleScenarioButton:checked { background-color: #2E7D32; color: white; border: 2px solid #1B5E20; font-weight: bold; }
+    QPushButton#hillScenarioButton { padding: 6px; background-color: #FFF3E0; border: 2px solid #FFCC80; border-radius: 3px; }
+    QPushButton#hillScenarioButton:hover { background-color: #FFE0B2; }
+    QPushButton#hillScenarioButton:checked { background-color: #EF6C00; color: white; border: 2px solid #E65100; font-weight: bold; }
+    QPushButton#steepScenarioButton { padding: 6px; background-color: #FFEBEE; border: 2px solid #FFAB91; border-radius: 3px; }
+    QPushButton#steepScenarioButton:hover { background-color: #FFCDD2; }
+    QPushButton#steepScenarioButton:checked { background-color: #C62828; color: white; border: 2px solid #B71C1C; font-weight: bold; }
+    QPushButton#plotTestPointsButton { background-color: #4CAF50; color: white; border: none; border-radius: 5px; padding: 10px 20px; font-weight: bold; font-size: 12px; }
+    QPushButton#plotTestPointsButton:hover { background-color: #45a049; }
+    QPushButton#plotTestPointsButton:pressed { background-color: #3d8b40; }
+    QPushButton#resetTestPointsButton { background-color: #2196F3; color: white; border: none; border-radius: 5px; padding: 10px 20px; font-weight: bold; font-size: 12px; }
+    QPushButton#resetTestPointsButton:hover { background-color: #1976D2; }
+    QPushButton#resetTestPointsButton:pressed { background-color: #1565C0; }
+    QPushButton#clearTestPointsButton { background-color: #f44336; color: white; border: none; border-radius: 5px; padding: 10px 20px; font-weight: bold; font-size: 12px; }
+    QPushButton#clearTestPointsButton:hover { background-color: #da190b; }
+    QPushButton#clearTestPointsButton:pressed { background-color: #c41808; }
+    QPushButton#aboutCloseButton { padding: 8px; background-color: #2196F3; color: white; border-radius: 4px; }
+'''
+
+
+@lru_cache(maxsize=1)
+def build_light_palette():
+    """Build the light theme palette once and reuse it on later app starts"""
+    palette = QPalette()
+    for role, rgb in LIGHT_PALETTE_COLORS:
+        palette.setColor(role, COLOR_POOL[rgb])
+    return palette
+
+
+def style_button(button, name):
+    """Name a push button and give it the BUTTON_STYLESHEET rules for that name"""
+    button.setObjectName(name)
+    button.setStyleSheet(BUTTON_STYLESHEET)
+
+
+@lru_cache(maxsize=1)
+def build_read_only_palette():
+    """Palette for calculated (read-only) spinboxes: only the grey Base role is set, the rest is inherited"""
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.Base, COLOR_POOL[(240, 240, 240)])
+    return palette
+
+
+@lru_cache(maxsize=1)
+def load_app_icon():
+    """Decode the window icon once; later windows reuse it"""
+    return QIcon('ePropelled Logo.jpg')
+
+
+@lru_cache(maxsize=1)
+def load_header_logo():
+    """Decode and scale the header logo to 200px width once; a null pixmap if the file is missing"""
+    logo_pixmap = QPixmap('ePropelled_Text.jpg')
+    if logo_pixmap.isNull():
+        return logo_pixmap
+    return logo_pixmap.scaledToWidth(200, Qt.TransformationMode.SmoothTransformation)
 
 
 def main():
@@ -4578,37 +4653,7 @@ def main():
     app.setStyle('Fusion')
     
     # Set light color palette
-    from PyQt6.QtGui import QPalette, QColor
-    palette = QPalette()
-    
-    # Window colors
-    palette.setColor(QPalette.ColorRole.Window, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(0, 0, 0))
-    
-    # Base colors (input fields)
-    palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(245, 245, 245))
-    
-    # Text colors
-    palette.setColor(QPalette.ColorRole.Text, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 255, 255))
-    
-    # Button colors
-    palette.setColor(QPalette.ColorRole.Button, QColor(225, 225, 225))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(0, 0, 0))
-    
-    # Selection colors
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(0, 120, 215))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
-    
-    # Disabled colors
-    palette.setColor(QPalette.ColorRole.Light, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.Midlight, QColor(227, 227, 227))
-    palette.setColor(QPalette.ColorRole.Dark, QColor(160, 160, 160))
-    palette.setColor(QPalette.ColorRole.Mid, QColor(180, 180, 180))
-    palette.setColor(QPalette.ColorRole.Shadow, QColor(105, 105, 105))
-    
-    app.setPalette(palette)
+    app.setPalette(build_light_palette())
     
     window = EVSimulationApp()
     window.show()